@@ -0,0 +1,244 @@
+"""
+Inference micro-benchmarks
+
+Measures what a model costs to serve: load time, peak memory allocated,
+single-row latency percentiles and batch throughput. Results are cached
+on disk per model version (content digest), so each retrained model is
+benchmarked once.
+"""
+import os
+import json
+import time
+import gc
+import threading
+import tracemalloc
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import MODEL_PATHS, BENCHMARK_CACHE_PATH
+from models.metrics_store import file_digest, atomic_write
+
+
+BATCH_SIZES = (1, 32, 256, 2048)
+LATENCY_REPEATS = 200
+LOAD_REPEATS = 3
+
+BENCHMARK_COLUMNS = ['Model', 'Load_ms', 'Peak_Alloc_KB', 'Latency_p50_ms', 'Latency_p99_ms'] + \
+    [f'Rows_per_sec@{size}' for size in BATCH_SIZES]
+
+_CACHE_LOCK = threading.Lock()
+
+
+def measure_single_row_latency(model: Any, X: pd.DataFrame, repeats: int = LATENCY_REPEATS) -> np.ndarray:
+    """
+    Time repeated single-row predictions, cycling through the rows of X
+
+    Args:
+        model: Fitted model
+        X: Feature rows to draw single-row inputs from
+        repeats: Number of timed predictions
+
+    Returns:
+        Array of per-call latencies in seconds
+
+    Raises:
+        ValueError: If X has no rows
+    """
+    if X.empty:
+        raise ValueError("Need at least one feature row to time predictions")
+    rows = [X.iloc[[i % len(X)]] for i in range(min(repeats, len(X)))]
+    model.predict(rows[0])  # warm-up
+
+    latencies = np.empty(repeats)
+    for i in range(repeats):
+        row = rows[i % len(rows)]
+        start = time.perf_counter()
+        model.predict(row)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def measure_throughput(model: Any, X: pd.DataFrame, batch_size: int, min_seconds: float = 0.2) -> float:
+    """
+    Measure batch prediction throughput at a given batch size
+
+    X is tiled when it has fewer rows than batch_size. Batches are repeated
+    until at least min_seconds elapsed so small batches are timed reliably.
+
+    Args:
+        model: Fitted model
+        X: Feature rows
+        batch_size: Rows per predict call
+        min_seconds: Minimum total timed duration
+
+    Returns:
+        Rows predicted per second
+
+    Raises:
+        ValueError: If X has no rows
+    """
+    if X.empty:
+        raise ValueError("Need at least one feature row to time predictions")
+    reps = int(np.ceil(batch_size / len(X)))
+    batch = pd.concat([X] * reps, ignore_index=True).iloc[:batch_size] if reps > 1 else X.iloc[:batch_size]
+    model.predict(batch)  # warm-up
+
+    rows = 0
+    start = time.perf_counter()
+    while True:
+        model.predict(batch)
+        rows += len(batch)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return rows / elapsed
+
+
+def measure_peak_allocation(model_name: str, model_path: str, X: pd.DataFrame,
+                            batch_size: int = BATCH_SIZES[-1]) -> float:
+    """
+    Peak memory allocated while loading a model and predicting with it
+
+    Traced with tracemalloc, so it covers Python objects and NumPy arrays
+    but not buffers a native library allocates itself (XGBoost's trees and
+    prediction cache).
+
+    Args:
+        model_name: Model name as used in MODEL_PATHS
+        model_path: Path to the serialized model
+        X: Feature rows; one row and then a batch of up to batch_size rows are predicted
+        batch_size: Rows in the batch prediction
+
+    Returns:
+        Peak traced allocation in bytes above what was allocated before
+    """
+    from models.model_loader import load_model_file
+
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        model = load_model_file(model_name, model_path)
+        model.predict(X.iloc[:1])
+        model.predict(X.iloc[:batch_size])
+        return float(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def benchmark_model(model_name: str, model_path: str, X: pd.DataFrame,
+                    batch_sizes: Iterable[int] = BATCH_SIZES) -> Dict[str, Any]:
+    """
+    Run the full micro-benchmark for one model file
+
+    Args:
+        model_name: Model name as used in MODEL_PATHS
+        model_path: Path to the serialized model
+        X: Feature rows used for timing
+        batch_sizes: Batch sizes for throughput measurement
+
+    Returns:
+        Benchmark row keyed by BENCHMARK_COLUMNS
+    """
+    from models.model_loader import load_model_file
+
+    if X.empty:
+        raise ValueError("Need at least one feature row to benchmark a model")
+
+    load_times = []
+    for _ in range(LOAD_REPEATS):
+        start = time.perf_counter()
+        model = load_model_file(model_name, model_path)
+        load_times.append(time.perf_counter() - start)
+
+    latencies = measure_single_row_latency(model, X)
+
+    row = {
+        'Model': model_name,
+        'Load_ms': float(np.median(load_times) * 1000),
+        'Peak_Alloc_KB': measure_peak_allocation(model_name, model_path, X) / 1024,
+        'Latency_p50_ms': float(np.percentile(latencies, 50) * 1000),
+        'Latency_p99_ms': float(np.percentile(latencies, 99) * 1000),
+    }
+    for size in batch_sizes:
+        row[f'Rows_per_sec@{size}'] = float(measure_throughput(model, X, size))
+    return row
+
+
+def _read_cache() -> Dict[str, Any]:
+    """Read the benchmark cache, tolerating a missing or corrupt file"""
+    try:
+        with open(BENCHMARK_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def load_benchmark_results() -> pd.DataFrame:
+    """
+    Cached benchmark rows for the current version of each model
+
+    Returns:
+        DataFrame with one row per model that has an up-to-date benchmark
+    """
+    cache = _read_cache()
+    rows = []
+    for model_name, model_path in MODEL_PATHS.items():
+        entry = cache.get(model_name)
+        # Entries written before a column was added or renamed count as stale
+        if entry and entry.get('model_hash') == file_digest(model_path) \
+                and set(BENCHMARK_COLUMNS) <= set(entry['results']):
+            rows.append(entry['results'])
+    return pd.DataFrame(rows, columns=BENCHMARK_COLUMNS)
+
+
+def stale_models() -> List[str]:
+    """
+    Models whose current file has no cached benchmark
+
+    Returns:
+        List of model names
+    """
+    cached = set(load_benchmark_results()['Model'])
+    return [name for name, path in MODEL_PATHS.items()
+            if file_digest(path) is not None and name not in cached]
+
+
+def run_benchmarks(X: pd.DataFrame, model_names: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Benchmark models and store results in the per-version cache
+
+    Args:
+        X: Feature rows used for timing
+        model_names: Models to benchmark; defaults to every stale model
+
+    Returns:
+        DataFrame with cached results for all current model versions
+    """
+    with _CACHE_LOCK:
+        names = list(model_names) if model_names is not None else stale_models()
+        cache = _read_cache()
+        for model_name in names:
+            model_path = MODEL_PATHS[model_name]
+            model_digest = file_digest(model_path)
+            if model_digest is None:
+                continue
+            cache[model_name] = {
+                'model_hash': model_digest,
+                'benchmarked_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': benchmark_model(model_name, model_path, X),
+            }
+        atomic_write(BENCHMARK_CACHE_PATH, json.dumps(cache, indent=2))
+    return load_benchmark_results()
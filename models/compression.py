@@ -0,0 +1,263 @@
+"""
+XGBoost model compression
+
+Post-training pass over the saved booster JSON: sibling leaves whose
+values differ by less than a tolerance are merged into their parent, then
+the trees contributing least are dropped for as long as the RMSE on the
+training split stays within a relative tolerance. Both steps work on the
+exact per-tree leaf outputs, so no retraining is involved. The result is
+written as a normal XGBoost model with a report of size, speed and
+accuracy before and after.
+"""
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import (
+    MODEL_PATHS, X_TRAIN_PATH, X_TEST_PATH, Y_TRAIN_PATH, Y_TEST_PATH,
+    COMPRESSED_MODEL_PATH, COMPRESSION_REPORT_PATH
+)
+from models.metrics_store import atomic_write
+from models.splits import read_split
+
+
+DEFAULT_RMSE_TOLERANCE = 0.005
+DEFAULT_LEAF_TOLERANCE = 0.01
+
+_TREE_ARRAYS = ['base_weights', 'default_left', 'left_children', 'loss_changes', 'parents',
+                'right_children', 'split_conditions', 'split_indices', 'split_type', 'sum_hessian']
+
+
+def _is_leaf(tree: Dict[str, Any], node: int) -> bool:
+    return tree['left_children'][node] == -1
+
+
+def merge_leaves(tree: Dict[str, Any], tolerance: float) -> Dict[str, Any]:
+    """
+    Collapse sibling leaves with nearly equal values into their parent
+
+    Merging is applied bottom-up, so a subtree can collapse completely.
+    The merged leaf takes the hessian-weighted mean of its children, which
+    moves any prediction by at most tolerance / 2 per merge.
+
+    Args:
+        tree: One tree of the booster JSON
+        tolerance: Largest leaf value difference to merge
+
+    Returns:
+        Rebuilt tree dict with renumbered nodes
+    """
+    values = list(tree['split_conditions'])
+    weights = list(tree['base_weights'])
+    leaf = [_is_leaf(tree, node) for node in range(len(values))]
+
+    def collapse(node: int) -> None:
+        if leaf[node]:
+            return
+        left, right = tree['left_children'][node], tree['right_children'][node]
+        collapse(left)
+        collapse(right)
+        if leaf[left] and leaf[right] and abs(values[left] - values[right]) <= tolerance:
+            h_left, h_right = tree['sum_hessian'][left], tree['sum_hessian'][right]
+            total = (h_left + h_right) or 1.0
+            values[node] = (values[left] * h_left + values[right] * h_right) / total
+            weights[node] = (weights[left] * h_left + weights[right] * h_right) / total
+            leaf[node] = True
+
+    collapse(0)
+
+    # Renumber the remaining nodes breadth-first (the order XGBoost writes)
+    order, index = [0], {0: 0}
+    for node in order:
+        if not leaf[node]:
+            for child in (tree['left_children'][node], tree['right_children'][node]):
+                index[child] = len(order)
+                order.append(child)
+
+    rebuilt = {key: [] for key in _TREE_ARRAYS}
+    for node in order:
+        is_leaf = leaf[node]
+        parent = tree['parents'][node]
+        rebuilt['base_weights'].append(weights[node])
+        rebuilt['default_left'].append(0 if is_leaf else tree['default_left'][node])
+        rebuilt['left_children'].append(-1 if is_leaf else index[tree['left_children'][node]])
+        rebuilt['right_children'].append(-1 if is_leaf else index[tree['right_children'][node]])
+        rebuilt['loss_changes'].append(0.0 if is_leaf else tree['loss_changes'][node])
+        rebuilt['parents'].append(parent if node == 0 else index[parent])
+        rebuilt['split_conditions'].append(values[node])
+        rebuilt['split_indices'].append(0 if is_leaf else tree['split_indices'][node])
+        rebuilt['split_type'].append(0 if is_leaf else tree['split_type'][node])
+        rebuilt['sum_hessian'].append(tree['sum_hessian'][node])
+
+    merged = {**tree, **rebuilt}
+    merged['tree_param'] = {**tree['tree_param'], 'num_nodes': str(len(order)), 'num_deleted': '0'}
+    return merged
+
+
+def _set_trees(model: Dict[str, Any], trees: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Booster JSON with its tree list replaced (single-output, one tree per round)"""
+    gbtree = model['learner']['gradient_booster']['model']
+    trees = [{**tree, 'id': i} for i, tree in enumerate(trees)]
+    gbtree['trees'] = trees
+    gbtree['tree_info'] = [0] * len(trees)
+    gbtree['iteration_indptr'] = list(range(len(trees) + 1))
+    gbtree['gbtree_model_param'] = {**gbtree['gbtree_model_param'], 'num_trees': str(len(trees))}
+    # Early-stopping markers would point past the shortened model
+    for key in ('best_iteration', 'best_score'):
+        model['learner'].get('attributes', {}).pop(key, None)
+    return model
+
+
+def _to_booster(model: Dict[str, Any]):
+    """Load a booster from its JSON dict"""
+    import xgboost as xgb
+
+    booster = xgb.Booster()
+    booster.load_model(bytearray(json.dumps(model).encode()))
+    return booster
+
+
+def tree_outputs(booster, trees: List[Dict[str, Any]], X: pd.DataFrame) -> np.ndarray:
+    """
+    Leaf value each tree adds to each row's prediction
+
+    Args:
+        booster: Booster holding trees
+        trees: The booster's trees (JSON)
+        X: Encoded features
+
+    Returns:
+        Array of shape (rows, trees)
+    """
+    import xgboost as xgb
+
+    leaves = booster.predict(xgb.DMatrix(X), pred_leaf=True).astype(int).reshape(len(X), -1)
+    outputs = np.empty(leaves.shape, dtype='float64')
+    for t, tree in enumerate(trees):
+        outputs[:, t] = np.asarray(tree['split_conditions'], dtype='float64')[leaves[:, t]]
+    return outputs
+
+
+def select_trees(outputs: np.ndarray, y: np.ndarray, base_margin: float, tolerance: float) -> np.ndarray:
+    """
+    Drop the least contributing trees within an RMSE budget
+
+    Trees are ranked by mean absolute output; the longest prefix of that
+    ranking whose removal keeps RMSE within (1 + tolerance) of the full
+    model is dropped.
+
+    Args:
+        outputs: Per-tree outputs from tree_outputs
+        y: Targets of the same rows
+        base_margin: Booster base score
+        tolerance: Allowed relative RMSE increase
+
+    Returns:
+        Sorted indices of the trees to keep
+    """
+    full = base_margin + outputs.sum(axis=1)
+    budget = np.sqrt(np.mean((y - full) ** 2)) * (1 + tolerance)
+
+    ranking = np.argsort(np.abs(outputs).mean(axis=0), kind='stable')
+    # Prediction after removing the first k ranked trees, for every k
+    removed = np.cumsum(outputs[:, ranking], axis=1)
+    rmse = np.sqrt(np.mean((y[:, None] - (full[:, None] - removed)) ** 2, axis=0))
+
+    within = np.nonzero(rmse <= budget)[0]
+    n_drop = int(within.max()) + 1 if len(within) else 0
+    n_drop = min(n_drop, outputs.shape[1] - 1)
+    return np.sort(ranking[n_drop:])
+
+
+def _model_profile(model_path: str, X: pd.DataFrame, y: np.ndarray) -> Dict[str, Any]:
+    """Size, load time, latency and test accuracy of a saved XGBoost model"""
+    from models.model_loader import load_model_file
+    from models.benchmark import measure_single_row_latency
+    from utils.helpers import calculate_metrics
+
+    start = time.perf_counter()
+    model = load_model_file('XGBoost', model_path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    trees = json.loads(model.get_booster().save_raw('json'))['learner']['gradient_booster']['model']['trees']
+    scores = calculate_metrics(y, model.predict(X))
+    return {
+        'trees': len(trees),
+        'nodes': int(sum(int(tree['tree_param']['num_nodes']) for tree in trees)),
+        'file_kb': os.path.getsize(model_path) / 1024,
+        'load_ms': load_ms,
+        'latency_p50_ms': float(np.percentile(measure_single_row_latency(model, X), 50) * 1000),
+        'metrics': {key: float(value) for key, value in scores.items()},
+    }
+
+
+def compress_xgboost(source: str = MODEL_PATHS['XGBoost'], output: str = COMPRESSED_MODEL_PATH,
+                     rmse_tolerance: float = DEFAULT_RMSE_TOLERANCE,
+                     leaf_tolerance: float = DEFAULT_LEAF_TOLERANCE,
+                     log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Write a compressed copy of an XGBoost model and its report
+
+    Args:
+        source: Saved XGBoost model
+        output: Where to write the compressed model
+        rmse_tolerance: Allowed relative training-split RMSE increase from dropping trees
+        leaf_tolerance: Largest sibling leaf difference to merge (target units)
+        log: Progress callback
+
+    Returns:
+        Report with before/after profiles (also written to COMPRESSION_REPORT_PATH)
+    """
+    from models.training import save_model_file
+
+    with open(source, 'r', encoding='utf-8') as f:
+        model = json.load(f)
+    trees = model['learner']['gradient_booster']['model']['trees']
+    base_margin = float(model['learner']['learner_model_param']['base_score'].strip('[]'))
+    if model['learner']['gradient_booster']['model']['gbtree_model_param']['num_parallel_tree'] != '1':
+        raise ValueError("Only single-tree-per-round models can be compressed")
+
+    X_train = read_split(X_TRAIN_PATH).astype('float32')
+    y_train = read_split(Y_TRAIN_PATH).values.ravel().astype('float64')
+
+    merged = [merge_leaves(tree, leaf_tolerance) for tree in trees]
+    nodes_before = sum(len(tree['left_children']) for tree in trees)
+    nodes_after = sum(len(tree['left_children']) for tree in merged)
+    log(f"  Merged leaves: {nodes_before:,} → {nodes_after:,} nodes")
+
+    booster = _to_booster(_set_trees(model, merged))
+    keep = select_trees(tree_outputs(booster, merged, X_train), y_train, base_margin, rmse_tolerance)
+    log(f"  Dropped trees: {len(merged)} → {len(keep)}")
+
+    booster = _to_booster(_set_trees(model, [merged[t] for t in keep]))
+    save_model_file('XGBoost', booster, output)
+
+    X_test = read_split(X_TEST_PATH).astype('float32')
+    y_test = read_split(Y_TEST_PATH).values.ravel()
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'source': os.path.relpath(source, os.path.dirname(output)),
+        'output': os.path.relpath(output, os.path.dirname(COMPRESSION_REPORT_PATH)),
+        'rmse_tolerance': rmse_tolerance,
+        'leaf_tolerance': leaf_tolerance,
+        'before': _model_profile(source, X_test, y_test),
+        'after': _model_profile(output, X_test, y_test),
+    }
+    atomic_write(COMPRESSION_REPORT_PATH, json.dumps(report, indent=2, ensure_ascii=False))
+    return report
+
+
+def read_compression_report(path: str = COMPRESSION_REPORT_PATH) -> Optional[Dict[str, Any]]:
+    """Report of the last compression, or None if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,219 @@
+"""
+Cross-validation report
+
+Every (model, fold) fit runs as one task in a process pool. The
+out-of-fold predictions are stored with their fold, row and segment
+columns, and fold timings go to a JSON report. All CV metrics, per fold
+or per segment, are derived from the stored predictions, so looking at
+another metric never refits anything.
+"""
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import CV_PREDICTIONS_PATH, CV_REPORT_PATH
+from models.metrics_store import atomic_write
+from models.preprocessing import ONE_HOT_ORDER
+
+
+CV_METRICS = ['R²', 'MAE', 'RMSE', 'MAPE']
+
+SEGMENT_COLUMNS = list(ONE_HOT_ORDER)
+
+
+def decode_segments(X: pd.DataFrame, schema: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Recover the categorical values of encoded rows
+
+    Args:
+        X: Encoded features (drop_first one-hot)
+        schema: Feature schema the rows were encoded with
+
+    Returns:
+        DataFrame with one column per categorical feature
+    """
+    segments = {}
+    for col in SEGMENT_COLUMNS:
+        levels = schema['categories'][col]
+        dummies = X[[f"{col}_{value}" for value in levels[1:]]].to_numpy(dtype=bool)
+        # The dropped first level is the row with no dummy set
+        codes = np.where(dummies.any(axis=1), dummies.argmax(axis=1) + 1, 0)
+        segments[col] = np.asarray(levels, dtype=object)[codes]
+    return pd.DataFrame(segments, index=X.index)
+
+
+def _fit_fold(name: str, model: Any, X: np.ndarray, y: np.ndarray, fold: int,
+              train_idx: np.ndarray, val_idx: np.ndarray) -> Dict[str, Any]:
+    """Fit one model on one fold and predict its held-out rows (runs in a worker)"""
+    from sklearn.base import clone
+
+    estimator = clone(model)
+    start = time.perf_counter()
+    estimator.fit(X[train_idx], y[train_idx])
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictions = estimator.predict(X[val_idx])
+    predict_seconds = time.perf_counter() - start
+
+    return {
+        'model': name,
+        'fold': fold,
+        'rows': val_idx,
+        'predictions': np.asarray(predictions, dtype='float64'),
+        'fit_seconds': fit_seconds,
+        'predict_seconds': predict_seconds,
+        'train_rows': len(train_idx),
+    }
+
+
+def run_cv(models: Dict[str, Any], X: pd.DataFrame, y, n_splits: int, random_state: int,
+           segments: Optional[pd.DataFrame] = None, n_jobs: int = -1) -> tuple:
+    """
+    K-fold cross-validation keeping out-of-fold predictions
+
+    Args:
+        models: Unfitted estimators by name
+        X: Encoded training features
+        y: Training targets
+        n_splits: Number of folds (shuffled, as in the notebook)
+        random_state: Fold seed
+        segments: Optional per-row columns stored next to the predictions
+        n_jobs: Worker processes for the (model, fold) tasks
+
+    Returns:
+        (predictions DataFrame, fold timings DataFrame)
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import KFold
+
+    X_values = np.asarray(X, dtype='float32')
+    y_values = np.asarray(y, dtype='float64').ravel()
+    folds = list(KFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(X_values))
+
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_fold)(name, model, X_values, y_values, fold, train_idx, val_idx)
+        for name, model in models.items()
+        for fold, (train_idx, val_idx) in enumerate(folds)
+    )
+
+    frames, timings = [], []
+    for result in results:
+        rows = result['rows']
+        frame = pd.DataFrame({
+            'Model': result['model'],
+            'Fold': result['fold'],
+            'Row': rows,
+            'Actual': y_values[rows],
+            'Predicted': result['predictions'],
+        })
+        if segments is not None:
+            for col in segments.columns:
+                frame[col] = segments[col].to_numpy()[rows]
+        frames.append(frame)
+        timings.append({
+            'Model': result['model'],
+            'Fold': result['fold'],
+            'Train_rows': result['train_rows'],
+            'Val_rows': len(rows),
+            'Fit_s': result['fit_seconds'],
+            'Predict_s': result['predict_seconds'],
+        })
+    return pd.concat(frames, ignore_index=True), pd.DataFrame(timings)
+
+
+def _scores(group: pd.DataFrame) -> pd.Series:
+    """CV_METRICS of one group of stored predictions"""
+    from utils.helpers import calculate_metrics
+
+    scores = calculate_metrics(group['Actual'], group['Predicted'])
+    return pd.Series({'R²': scores['R2'], 'MAE': scores['MAE'], 'RMSE': scores['RMSE'],
+                      'MAPE': scores['MAPE'], 'Rows': len(group)})
+
+
+def fold_metrics(predictions: pd.DataFrame) -> pd.DataFrame:
+    """
+    Metrics of every model on every fold
+
+    Args:
+        predictions: Out-of-fold predictions from run_cv
+
+    Returns:
+        DataFrame with Model, Fold and CV_METRICS columns
+    """
+    return predictions.groupby(['Model', 'Fold'])[['Actual', 'Predicted']].apply(_scores).reset_index()
+
+
+def segment_metrics(predictions: pd.DataFrame, segment: str) -> pd.DataFrame:
+    """
+    Out-of-fold metrics per value of a categorical feature
+
+    Args:
+        predictions: Out-of-fold predictions from run_cv
+        segment: One of SEGMENT_COLUMNS
+
+    Returns:
+        DataFrame with Model, the segment column, CV_METRICS and Rows
+    """
+    return predictions.groupby(['Model', segment])[['Actual', 'Predicted']].apply(_scores).reset_index()
+
+
+def summarize(predictions: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Fold R² of each model in the shape of the training manifest
+
+    Args:
+        predictions: Out-of-fold predictions from run_cv
+
+    Returns:
+        Dict mapping model names to fold scores, mean and std
+    """
+    summary = {}
+    for name, group in fold_metrics(predictions).groupby('Model', sort=False):
+        scores = group.sort_values('Fold')['R²'].to_numpy()
+        summary[name] = {'scores': scores.tolist(), 'mean': float(scores.mean()), 'std': float(scores.std())}
+    return summary
+
+
+def save_cv_report(predictions: pd.DataFrame, timings: pd.DataFrame, info: Dict[str, Any],
+                   predictions_path: str = CV_PREDICTIONS_PATH, report_path: str = CV_REPORT_PATH) -> None:
+    """
+    Write the out-of-fold predictions (Parquet) and the fold report (JSON)
+
+    Args:
+        predictions: Out-of-fold predictions from run_cv
+        timings: Fold timings from run_cv
+        info: Extra report fields (folds, seed, data digests)
+        predictions_path: Parquet destination
+        report_path: JSON destination
+    """
+    tmp_path = predictions_path + '.tmp'
+    predictions.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, predictions_path)
+
+    report = {**info, 'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'timings': timings.to_dict(orient='records')}
+    atomic_write(report_path, json.dumps(report, indent=2, ensure_ascii=False))
+
+
+def read_cv_predictions(path: str = CV_PREDICTIONS_PATH) -> Optional[pd.DataFrame]:
+    """Stored out-of-fold predictions, or None if missing"""
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def read_cv_report(path: str = CV_REPORT_PATH) -> Optional[Dict[str, Any]]:
+    """Stored fold report, or None if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -4,18 +4,22 @@ Data loading utilities
 import os
 import pandas as pd
 import streamlit as st
-from typing import Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 # Get paths from config
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from config.settings import (
-    DATASET_PATH, X_TRAIN_PATH, X_TEST_PATH, 
-    Y_TRAIN_PATH, Y_TEST_PATH, METRICS_PATH
+    DATASET_PATH, EDA_SUMMARY_PATH, MODEL_PATHS, X_TRAIN_PATH, X_TEST_PATH, 
+    Y_TRAIN_PATH, Y_TEST_PATH, METRICS_PATH, CV_PREDICTIONS_PATH, CV_REPORT_PATH
 )
+from models.metrics_store import current_metrics, file_digest
+from models.splits import split_path, read_split
+from utils.instrumentation import timed
 
 
+@timed('load_dataset')
 @st.cache_data
 def load_dataset() -> Optional[pd.DataFrame]:
     """
@@ -26,8 +30,7 @@ def load_dataset() -> Optional[pd.DataFrame]:
     """
     try:
         if os.path.exists(DATASET_PATH):
-            # CSV uses semicolon as separator and comma as decimal
-            df = pd.read_csv(DATASET_PATH, sep=';', decimal=',')
+            df = read_dataset(DATASET_PATH)
             return df
         else:
             st.warning(f"⚠️ Dataset not found: {DATASET_PATH}")
@@ -37,6 +40,94 @@ def load_dataset() -> Optional[pd.DataFrame]:
         return None
 
 
+def read_dataset(path) -> pd.DataFrame:
+    """
+    Parse a CSV in the raw dataset format without Streamlit caching
+    
+    Args:
+        path: File path or buffer
+        
+    Returns:
+        DataFrame with the raw dataset columns
+    """
+    # CSV uses semicolon as separator and comma as decimal
+    return pd.read_csv(path, sep=';', decimal=',')
+
+
+def iter_dataset_chunks(path: str, chunk_rows: int = 100_000,
+                        columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream a file in the raw dataset schema without loading it whole
+    
+    Args:
+        path: CSV in the dataset_800.csv format, or a Parquet file
+        chunk_rows: Rows per chunk
+        columns: Only read these columns (default: all)
+        
+    Yields:
+        DataFrames with the raw dataset columns
+    """
+    if str(path).endswith('.parquet'):
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+        return
+    
+    yield from pd.read_csv(path, sep=';', decimal=',', chunksize=chunk_rows, usecols=columns)
+
+
+@timed('load_eda_summary')
+def load_eda_summary() -> Optional[Dict[str, Any]]:
+    """
+    Load the precomputed EDA statistics of the dataset
+    
+    The stored summary is rebuilt (one chunked pass over the dataset) when
+    it is missing or was built from a different version of the dataset.
+    A summary merged from several inputs by scripts/build_eda_summary.py
+    has no dataset digest and is used as it is.
+    
+    Returns:
+        Summary dict (see models.eda_summary) or None if the dataset is missing
+    """
+    return _load_eda_summary(file_digest(DATASET_PATH), file_digest(EDA_SUMMARY_PATH))
+
+
+@st.cache_data(max_entries=1)
+def _load_eda_summary(dataset_digest: Optional[str],
+                      summary_digest: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Read or rebuild the EDA summary, cached per content digest
+    
+    Args:
+        dataset_digest: Digest of DATASET_PATH, used as the cache key
+        summary_digest: Digest of EDA_SUMMARY_PATH, used as the cache key
+        
+    Returns:
+        Summary dict or None if neither a usable summary nor the dataset exists
+    """
+    from models.eda_summary import build_eda_summary, read_eda_summary, save_eda_summary
+    
+    try:
+        summary = read_eda_summary() if summary_digest is not None else None
+        if summary is not None and summary['dataset_sha256'] in (None, dataset_digest):
+            return summary
+        if dataset_digest is None:
+            st.warning(f"⚠️ Dataset not found: {DATASET_PATH}")
+            return None
+        summary = build_eda_summary(DATASET_PATH)
+        try:
+            save_eda_summary(summary)
+        except OSError:
+            pass  # Read-only data directory: keep the in-memory summary
+        return summary
+    except Exception as e:
+        st.error(f"❌ Error building EDA summary: {str(e)}")
+        return None
+
+
+@timed('load_train_test_data')
 @st.cache_data
 def load_train_test_data() -> Dict[str, pd.DataFrame]:
     """
@@ -48,14 +139,15 @@ def load_train_test_data() -> Dict[str, pd.DataFrame]:
     data = {}
     
     try:
-        if os.path.exists(X_TRAIN_PATH):
-            data['X_train'] = pd.read_csv(X_TRAIN_PATH)
-        if os.path.exists(X_TEST_PATH):
-            data['X_test'] = pd.read_csv(X_TEST_PATH)
-        if os.path.exists(Y_TRAIN_PATH):
-            data['y_train'] = pd.read_csv(Y_TRAIN_PATH)
-        if os.path.exists(Y_TEST_PATH):
-            data['y_test'] = pd.read_csv(Y_TEST_PATH)
+        # Parquet splits (split_dataset.py default) take precedence over CSV
+        if os.path.exists(split_path(X_TRAIN_PATH)):
+            data['X_train'] = read_split(X_TRAIN_PATH)
+        if os.path.exists(split_path(X_TEST_PATH)):
+            data['X_test'] = read_split(X_TEST_PATH)
+        if os.path.exists(split_path(Y_TRAIN_PATH)):
+            data['y_train'] = read_split(Y_TRAIN_PATH)
+        if os.path.exists(split_path(Y_TEST_PATH)):
+            data['y_test'] = read_split(Y_TEST_PATH)
             
     except Exception as e:
         st.error(f"❌ Error loading train/test data: {str(e)}")
@@ -63,26 +155,94 @@ def load_train_test_data() -> Dict[str, pd.DataFrame]:
     return data
 
 
-@st.cache_data
+@timed('load_metrics')
 def load_metrics() -> Optional[pd.DataFrame]:
     """
-    Load model comparison metrics
+    Load model comparison metrics without evaluating anything
+    
+    Models evaluated in the metrics cache since their file last changed
+    show the cached row (with timing columns); the others show their row
+    of the published METRICS_PATH. Re-evaluation runs only from
+    scripts/refresh_metrics.py, training, or the Model Performance page's
+    re-evaluate button.
     
+    Returns:
+        DataFrame with model metrics or None if not found
+    """
+    evaluated = current_metrics()
+    stored = _read_metrics(file_digest(METRICS_PATH), warn=not evaluated)
+    if not evaluated:
+        return stored
+    
+    rows = [] if stored is None else [row for row in stored.to_dict('records') if row['Model'] not in evaluated]
+    rows += [evaluated[name] for name in MODEL_PATHS if name in evaluated]
+    order = {name: i for i, name in enumerate(MODEL_PATHS)}
+    rows.sort(key=lambda row: order.get(row['Model'], len(order)))
+    return pd.DataFrame(rows)
+
+
+@st.cache_data
+def _read_metrics(metrics_digest: Optional[str], warn: bool = True) -> Optional[pd.DataFrame]:
+    """
+    Read the metrics CSV, cached per content digest
+    
+    Args:
+        metrics_digest: Digest of METRICS_PATH, used as the cache key
+        warn: Show a warning if the file is missing
+        
     Returns:
         DataFrame with model metrics or None if not found
     """
     try:
-        if os.path.exists(METRICS_PATH):
+        if metrics_digest is not None:
             metrics_df = pd.read_csv(METRICS_PATH)
             return metrics_df
         else:
-            st.warning(f"⚠️ Metrics file not found: {METRICS_PATH}")
+            if warn:
+                st.warning(f"⚠️ Metrics file not found: {METRICS_PATH}")
             return None
     except Exception as e:
         st.error(f"❌ Error loading metrics: {str(e)}")
         return None
 
 
+@timed('load_cv_results')
+def load_cv_results() -> Optional[Dict[str, Any]]:
+    """
+    Load the stored cross-validation report of the published models
+    
+    Returns:
+        Dict with out-of-fold 'predictions', per-fold 'folds' metrics and
+        the 'report' (fold timings), or None if no CV report was published
+    """
+    return _read_cv_results(file_digest(CV_PREDICTIONS_PATH), file_digest(CV_REPORT_PATH))
+
+
+@st.cache_data
+def _read_cv_results(predictions_digest: Optional[str],
+                     report_digest: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Read the CV artifacts and derive fold metrics, cached per content digest
+    
+    Args:
+        predictions_digest: Digest of CV_PREDICTIONS_PATH, used as the cache key
+        report_digest: Digest of CV_REPORT_PATH, used as the cache key
+        
+    Returns:
+        CV results dict or None if the predictions are missing
+    """
+    from models.cv_report import fold_metrics, read_cv_predictions, read_cv_report
+    
+    predictions = read_cv_predictions()
+    if predictions is None:
+        return None
+    return {
+        'predictions': predictions,
+        'folds': fold_metrics(predictions),
+        'report': read_cv_report() or {},
+    }
+
+
 def get_best_model() -> Optional[str]:
     """
     Get the name of the best performing model based on R² score
@@ -97,14 +257,11 @@ def get_best_model() -> Optional[str]:
             return None
             
         # Find model with highest R² score
-        if 'R²' in metrics_df.columns and 'Model' in metrics_df.columns:
-            best_idx = metrics_df['R²'].idxmax()
-            return metrics_df.loc[best_idx, 'Model']
-        elif 'r2' in metrics_df.columns and 'Model' in metrics_df.columns:
-            best_idx = metrics_df['r2'].idxmax()
-            return metrics_df.loc[best_idx, 'Model']
-        else:
-            return None
+        for r2_col in ('R²', 'R2', 'r2'):
+            if r2_col in metrics_df.columns and 'Model' in metrics_df.columns:
+                best_idx = metrics_df[r2_col].idxmax()
+                return metrics_df.loc[best_idx, 'Model']
+        return None
             
     except Exception as e:
         st.error(f"❌ Error getting best model: {str(e)}")
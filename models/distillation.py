@@ -0,0 +1,166 @@
+"""
+Surrogate distillation
+
+Trains a shallow decision tree to imitate the published XGBoost model
+(the teacher). Training rows are dense random samples over the observed
+range of every raw feature, labeled by the teacher, so the surrogate
+covers the whole input space the UI sliders can reach. It serves fast
+previews; final predictions keep using the teacher.
+"""
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import (
+    DATASET_PATH, MODEL_PATHS, X_TEST_PATH, Y_TEST_PATH,
+    SURROGATE_MODEL_PATH, SURROGATE_REPORT_PATH
+)
+from models.metrics_store import atomic_write, file_digest
+from models.preprocessing import BOOL_COLS
+
+
+TEACHER = 'XGBoost'
+DEFAULT_SAMPLES = 200_000
+DEFAULT_MAX_DEPTH = 10
+
+
+def feature_ranges(df: pd.DataFrame, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Observed range of every numeric feature in raw data
+
+    Args:
+        df: Rows in the raw dataset schema
+        schema: Feature schema (numeric columns and category vocabularies)
+
+    Returns:
+        Dict mapping numeric columns to [min, max] and flags to None
+    """
+    return {col: None if col in BOOL_COLS else [float(df[col].min()), float(df[col].max())]
+            for col in schema['numeric_columns']}
+
+
+def sample_inputs(ranges: Dict[str, Any], schema: Dict[str, Any], n_samples: int,
+                  random_state: int = 42) -> pd.DataFrame:
+    """
+    Uniform random raw inputs over the feature ranges and vocabularies
+
+    Args:
+        ranges: Output of feature_ranges
+        schema: Feature schema
+        n_samples: Rows to draw
+        random_state: Sampling seed
+
+    Returns:
+        DataFrame in the raw dataset schema (without the target)
+    """
+    rng = np.random.default_rng(random_state)
+    data = {}
+    for col in schema['numeric_columns']:
+        if ranges[col] is None:
+            data[col] = rng.integers(0, 2, n_samples).astype(bool)
+        else:
+            low, high = ranges[col]
+            data[col] = rng.uniform(low, high, n_samples)
+    for col, levels in schema['categories'].items():
+        data[col] = rng.choice(np.asarray(levels, dtype=object), n_samples)
+    return pd.DataFrame(data)
+
+
+def _fidelity(teacher_pred: np.ndarray, surrogate_pred: np.ndarray) -> Dict[str, float]:
+    """How closely the surrogate tracks the teacher"""
+    from sklearn.metrics import r2_score
+
+    error = np.abs(teacher_pred - surrogate_pred)
+    return {
+        'R2': float(r2_score(teacher_pred, surrogate_pred)),
+        'MAE': float(error.mean()),
+        'P95_abs_error': float(np.percentile(error, 95)),
+        'Max_abs_error': float(error.max()),
+    }
+
+
+def distill_surrogate(n_samples: int = DEFAULT_SAMPLES, max_depth: int = DEFAULT_MAX_DEPTH,
+                      random_state: int = 42, log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Train and save a surrogate of the published XGBoost model
+
+    Args:
+        n_samples: Teacher-labeled samples to train on
+        max_depth: Surrogate tree depth
+        random_state: Seed for sampling and the tree
+        log: Progress callback
+
+    Returns:
+        Report with fidelity to the teacher and test accuracy (also
+        written to SURROGATE_REPORT_PATH)
+    """
+    from sklearn.tree import DecisionTreeRegressor
+    from models.benchmark import measure_single_row_latency
+    from models.data_loader import read_dataset
+    from models.feature_schema import resolve_schema, schema_encoder
+    from models.model_loader import load_model_file
+    from models.splits import read_split, split_path
+    from models.training import save_model_file
+    from utils.helpers import calculate_metrics
+
+    teacher_path = MODEL_PATHS[TEACHER]
+    teacher = load_model_file(TEACHER, teacher_path)
+    schema = resolve_schema()
+    encoder = schema_encoder(schema)
+    ranges = feature_ranges(read_dataset(DATASET_PATH), schema)
+
+    start = time.perf_counter()
+    X_train = encoder.transform(sample_inputs(ranges, schema, n_samples, random_state)).astype('float32')
+    y_train = teacher.predict(X_train)
+    surrogate = DecisionTreeRegressor(max_depth=max_depth, random_state=random_state).fit(X_train, y_train)
+    log(f"  Distilled {n_samples:,} teacher samples into {surrogate.tree_.node_count:,} nodes "
+        f"in {time.perf_counter() - start:.1f}s")
+    save_model_file('Surrogate', surrogate, SURROGATE_MODEL_PATH)
+
+    # Fresh samples the surrogate has not seen
+    X_check = encoder.transform(sample_inputs(ranges, schema, min(n_samples, 50_000),
+                                              random_state + 1)).astype('float32')
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'teacher': TEACHER,
+        'teacher_sha256': file_digest(teacher_path),
+        'schema_version': schema.get('version'),
+        'samples': n_samples,
+        'max_depth': max_depth,
+        'nodes': int(surrogate.tree_.node_count),
+        'ranges': ranges,
+        'fidelity_sampled': _fidelity(teacher.predict(X_check), surrogate.predict(X_check)),
+    }
+
+    if os.path.exists(split_path(X_TEST_PATH)) and os.path.exists(split_path(Y_TEST_PATH)):
+        X_test = read_split(X_TEST_PATH)[encoder.columns].astype('float32')
+        y_test = read_split(Y_TEST_PATH).values.ravel()
+        teacher_pred, surrogate_pred = teacher.predict(X_test), surrogate.predict(X_test)
+        report['fidelity_test'] = _fidelity(teacher_pred, surrogate_pred)
+        report['test_metrics'] = {
+            'teacher': {key: float(value) for key, value in calculate_metrics(y_test, teacher_pred).items()},
+            'surrogate': {key: float(value) for key, value in calculate_metrics(y_test, surrogate_pred).items()},
+        }
+        report['latency_p50_ms'] = {
+            'teacher': float(np.percentile(measure_single_row_latency(teacher, X_test), 50) * 1000),
+            'surrogate': float(np.percentile(measure_single_row_latency(surrogate, X_test), 50) * 1000),
+        }
+
+    atomic_write(SURROGATE_REPORT_PATH, json.dumps(report, indent=2, ensure_ascii=False))
+    return report
+
+
+def read_surrogate_report(path: str = SURROGATE_REPORT_PATH) -> Optional[Dict[str, Any]]:
+    """Report of the last distillation, or None if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
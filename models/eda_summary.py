@@ -0,0 +1,407 @@
+"""
+EDA summary
+
+Statistics behind the Home and Data Visualization pages, computed in one
+pass over the dataset in chunks. A DatasetSketch keeps only mergeable
+state: exact row, missing and category counts with per-category target
+sums, streaming means and (co)variances (MomentSketch), a KLL quantile
+sketch per numeric column (QuantileSketch) and a bottom-k random row
+sample. Sketches of chunks, files or worker processes merge into the same
+result whatever the split, and can be saved as JSON to be merged on
+another machine. The final summary is a small JSON artifact tied to the
+dataset's digest.
+"""
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import DATASET_PATH, EDA_SUMMARY_PATH, TARGET_COL
+from models.metrics_store import atomic_write, file_digest
+from models.sketches import DEFAULT_K, MomentSketch, QuantileSketch
+
+
+SUMMARY_VERSION = 2
+SAMPLE_ROWS = 2000
+HEAD_ROWS = 20
+HISTOGRAM_BINS = 30
+# Saved DatasetSketch files end with this, so they can be told from data files
+SKETCH_SUFFIX = '.sketch.json'
+
+
+def column_roles(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+    """
+    Numeric and categorical columns of a chunk (boolean flags are neither)
+
+    Args:
+        df: Rows in the raw dataset schema
+
+    Returns:
+        (numeric columns, categorical columns)
+    """
+    numeric = df.select_dtypes(include=[np.number]).columns.tolist()
+    categorical = [col for col in df.columns
+                   if col not in numeric and not pd.api.types.is_bool_dtype(df[col])]
+    return numeric, categorical
+
+
+def _add_counts(totals: Dict[str, float], values: pd.Series) -> None:
+    """Add per-value numbers into a running {value: total} dict"""
+    for key, value in values.to_dict().items():
+        totals[str(key)] = totals.get(str(key), 0) + value
+
+
+def _records(df: Optional[pd.DataFrame]) -> Optional[Dict[str, Any]]:
+    """JSON-safe column/row lists of a frame"""
+    return None if df is None else json.loads(df.to_json(orient='split', index=False))
+
+
+def _finite(value: float) -> Optional[float]:
+    """JSON-safe float (None for NaN and inf)"""
+    return float(value) if np.isfinite(value) else None
+
+
+class DatasetSketch:
+    """
+    Mergeable one-pass summary of a dataset
+
+    Memory is bounded by the number of columns and category values, not by
+    the number of rows.
+    """
+
+    def __init__(self, columns: Sequence[str], numeric: Sequence[str], categorical: Sequence[str],
+                 k: int = DEFAULT_K, seed=None):
+        """
+        Args:
+            columns: Raw column order
+            numeric: Columns with quantile and moment sketches
+            categorical: Columns with value counts and target means
+            k: Accuracy parameter of the quantile sketches
+            seed: Seed of the row sample keys and sketch compactions
+        """
+        self.columns = list(columns)
+        self.numeric = list(numeric)
+        self.categorical = list(categorical)
+        self.k = k
+        self.rows = 0
+        self.missing = {col: 0 for col in self.columns}
+        self._rng = np.random.default_rng(seed)
+        self.quantiles = {col: QuantileSketch(k, self._rng) for col in self.numeric}
+        self.moments = {col: MomentSketch([col]) for col in self.numeric}
+        self.joint = MomentSketch(self.numeric)
+        self.groups = {col: {'count': {}, 'target_count': {}, 'target_sum': {}} for col in self.categorical}
+        self.sample: Optional[pd.DataFrame] = None
+        self.head: Optional[pd.DataFrame] = None
+
+    def update(self, df: pd.DataFrame) -> 'DatasetSketch':
+        """
+        Add a chunk of rows
+
+        Args:
+            df: Rows with the sketch's columns
+
+        Returns:
+            self
+        """
+        self.rows += len(df)
+        _add_counts(self.missing, df[self.columns].isna().sum())
+
+        values = df[self.numeric].to_numpy(dtype=float)
+        for i, col in enumerate(self.numeric):
+            self.quantiles[col].update(values[:, i])
+            self.moments[col].update(values[:, i])
+        self.joint.update(values)
+
+        for col, group in self.groups.items():
+            _add_counts(group['count'], df[col].value_counts())
+            if TARGET_COL in df.columns:
+                target = df.groupby(col, observed=True)[TARGET_COL]
+                _add_counts(group['target_count'], target.count())
+                _add_counts(group['target_sum'], target.sum())
+
+        keyed = df[self.columns].assign(_key=self._rng.random(len(df))).nsmallest(SAMPLE_ROWS, '_key')
+        self.sample = keyed if self.sample is None else pd.concat([self.sample, keyed]).nsmallest(SAMPLE_ROWS, '_key')
+        if self.head is None or len(self.head) < HEAD_ROWS:
+            self.head = pd.concat([frame for frame in (self.head, df[self.columns]) if frame is not None]).head(HEAD_ROWS)
+        return self
+
+    def merge(self, other: 'DatasetSketch') -> 'DatasetSketch':
+        """
+        Fold in the sketch of other rows with the same column layout
+
+        Args:
+            other: Sketch of later rows (its head rows come after these)
+
+        Returns:
+            self
+        """
+        if (other.columns, other.numeric, other.categorical) != (self.columns, self.numeric, self.categorical):
+            raise ValueError("Cannot merge sketches of datasets with different columns")
+        self.rows += other.rows
+        _add_counts(self.missing, pd.Series(other.missing))
+        for col in self.numeric:
+            self.quantiles[col].merge(other.quantiles[col])
+            self.moments[col].merge(other.moments[col])
+        self.joint.merge(other.joint)
+        for col, group in self.groups.items():
+            for key, totals in group.items():
+                _add_counts(totals, pd.Series(other.groups[col][key], dtype=float if key == 'target_sum' else int))
+        samples = [frame for frame in (self.sample, other.sample) if frame is not None]
+        self.sample = pd.concat(samples).nsmallest(SAMPLE_ROWS, '_key') if samples else None
+        heads = [frame for frame in (self.head, other.head) if frame is not None]
+        self.head = pd.concat(heads).head(HEAD_ROWS) if heads else None
+        return self
+
+    def summary(self, dataset_digest: Optional[str] = None, sources: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Display statistics of the sketched rows
+
+        Args:
+            dataset_digest: Digest of the summarized file, or None when the
+                summary covers several inputs
+            sources: Names of the summarized inputs
+
+        Returns:
+            JSON-serializable summary
+        """
+        describe, histograms, rank_error = {}, {}, {}
+        for col in self.numeric:
+            quantiles, moments = self.quantiles[col], self.moments[col]
+            if not moments.n:
+                continue
+            q1, median, q3 = quantiles.quantiles([0.25, 0.5, 0.75])
+            describe[col] = {'count': moments.n, 'mean': float(moments.mean[0]), 'std': _finite(moments.std()[0]),
+                             'min': quantiles.min, '25%': float(q1), '50%': float(median), '75%': float(q3),
+                             'max': quantiles.max}
+            edges, counts = quantiles.histogram(HISTOGRAM_BINS)
+            histograms[col] = {'edges': edges.tolist(), 'counts': counts.tolist()}
+            rank_error[col] = quantiles.rank_error()
+
+        correlation = None
+        if self.joint.n > 1:
+            correlation = {'columns': self.numeric, 'rows': self.joint.n,
+                           'matrix': [[_finite(v) for v in row] for row in self.joint.correlation()]}
+
+        groups = {}
+        for col, group in self.groups.items():
+            groups[col] = {'count': dict(group['count'])}
+            if group['target_count']:
+                groups[col]['target_mean'] = {value: group['target_sum'][value] / count
+                                              for value, count in group['target_count'].items() if count}
+
+        return {
+            'version': SUMMARY_VERSION,
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'dataset_sha256': dataset_digest,
+            'sources': sources or [],
+            'target': TARGET_COL,
+            'rows': self.rows,
+            'columns': self.columns,
+            'numeric_columns': self.numeric,
+            'missing': dict(self.missing),
+            'describe': describe,
+            'rank_error': rank_error,
+            'histograms': histograms,
+            'correlation': correlation,
+            'groups': groups,
+            'sample': _records(None if self.sample is None else self.sample.drop(columns='_key')),
+            'head': _records(self.head),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable state of the sketch"""
+        return {
+            'version': SUMMARY_VERSION,
+            'columns': self.columns,
+            'numeric': self.numeric,
+            'categorical': self.categorical,
+            'k': self.k,
+            'rows': self.rows,
+            'missing': self.missing,
+            'quantiles': {col: sketch.to_dict() for col, sketch in self.quantiles.items()},
+            'moments': {col: sketch.to_dict() for col, sketch in self.moments.items()},
+            'joint': self.joint.to_dict(),
+            'groups': self.groups,
+            'sample': _records(self.sample),
+            'head': _records(self.head),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any], seed=None) -> 'DatasetSketch':
+        """Rebuild a sketch saved with to_dict"""
+        if payload.get('version') != SUMMARY_VERSION:
+            raise ValueError(f"Unsupported sketch version: {payload.get('version')}")
+        sketch = cls(payload['columns'], payload['numeric'], payload['categorical'], payload['k'], seed)
+        sketch.rows = payload['rows']
+        sketch.missing = dict(payload['missing'])
+        sketch.quantiles = {col: QuantileSketch.from_dict(state, sketch._rng)
+                            for col, state in payload['quantiles'].items()}
+        sketch.moments = {col: MomentSketch.from_dict(state) for col, state in payload['moments'].items()}
+        sketch.joint = MomentSketch.from_dict(payload['joint'])
+        sketch.groups = payload['groups']
+        sketch.sample = summary_frame(payload['sample']) if payload['sample'] else None
+        sketch.head = summary_frame(payload['head']) if payload['head'] else None
+        return sketch
+
+
+def sketch_dataset(path: str, chunk_rows: int = 100_000, k: int = DEFAULT_K, seed=42,
+                   log: Optional[Callable[[str], None]] = None) -> DatasetSketch:
+    """
+    Sketch one dataset file in a single chunked pass
+
+    Args:
+        path: Dataset file (CSV in the dataset format or Parquet)
+        chunk_rows: Rows per chunk
+        k: Accuracy parameter of the quantile sketches
+        seed: Seed of the row sample and sketch compactions
+        log: Optional progress callback
+
+    Returns:
+        Sketch of every row of the file
+    """
+    from models.data_loader import iter_dataset_chunks
+
+    sketch = None
+    for chunk in iter_dataset_chunks(path, chunk_rows):
+        if sketch is None:
+            sketch = DatasetSketch(chunk.columns, *column_roles(chunk), k=k, seed=seed)
+        sketch.update(chunk)
+        if log:
+            log(f"  {os.path.basename(path)}: {sketch.rows:,} rows sketched")
+    if sketch is None:
+        raise ValueError(f"No rows in {path}")
+    return sketch
+
+
+def _sketch_source(args: Tuple[str, int, int, int]) -> Dict[str, Any]:
+    """Worker entry point: sketch a data file or read a saved sketch"""
+    path, chunk_rows, k, seed = args
+    if path.endswith(SKETCH_SUFFIX):
+        return read_sketch(path).to_dict()
+    return sketch_dataset(path, chunk_rows, k, seed).to_dict()
+
+
+def sketch_sources(paths: List[str], chunk_rows: int = 100_000, k: int = DEFAULT_K, seed: int = 42,
+                   workers: int = 1, log: Optional[Callable[[str], None]] = None) -> DatasetSketch:
+    """
+    Sketch several data files and saved sketches, and merge the results
+
+    Args:
+        paths: Dataset files, or DatasetSketch files ending in SKETCH_SUFFIX
+        chunk_rows: Rows per chunk
+        k: Accuracy parameter of the quantile sketches
+        seed: Base seed; every input gets its own
+        workers: Processes sketching inputs in parallel
+        log: Optional progress callback
+
+    Returns:
+        Merged sketch, in the order of paths
+    """
+    jobs = [(path, chunk_rows, k, seed + i) for i, path in enumerate(paths)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            states = list(pool.map(_sketch_source, jobs))
+    else:
+        states = [_sketch_source(job) for job in jobs]
+
+    merged = None
+    for path, state in zip(paths, states):
+        sketch = DatasetSketch.from_dict(state, seed)
+        merged = sketch if merged is None else merged.merge(sketch)
+        if log:
+            log(f"  {os.path.basename(path)}: {sketch.rows:,} rows")
+    if merged is None:
+        raise ValueError("No inputs to sketch")
+    return merged
+
+
+def build_eda_summary(path: str = DATASET_PATH, chunk_rows: int = 100_000, seed: int = 42,
+                      log: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Summarize a dataset in one chunked pass
+
+    Args:
+        path: Dataset file (CSV in the dataset format or Parquet)
+        chunk_rows: Rows per chunk
+        seed: Seed of the row sample
+        log: Optional progress callback
+
+    Returns:
+        Summary from DatasetSketch.summary
+    """
+    sketch = sketch_dataset(path, chunk_rows, seed=seed, log=log)
+    return sketch.summary(file_digest(path), [os.path.basename(path)])
+
+
+def save_sketch(sketch: DatasetSketch, path: str) -> None:
+    """Write a sketch atomically, to be merged later with sketch_sources"""
+    atomic_write(path, json.dumps(sketch.to_dict(), ensure_ascii=False))
+
+
+def read_sketch(path: str) -> DatasetSketch:
+    """Read a sketch written by save_sketch"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return DatasetSketch.from_dict(json.load(f))
+
+
+def save_eda_summary(summary: Dict[str, Any], path: str = EDA_SUMMARY_PATH) -> None:
+    """Write a summary atomically"""
+    atomic_write(path, json.dumps(summary, ensure_ascii=False))
+
+
+def read_eda_summary(path: str = EDA_SUMMARY_PATH) -> Optional[Dict[str, Any]]:
+    """Stored summary, or None if missing, unreadable or of another version"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return summary if summary.get('version') == SUMMARY_VERSION else None
+
+
+def summary_frame(records: Dict[str, Any]) -> pd.DataFrame:
+    """DataFrame of a stored 'sample' or 'head' entry"""
+    return pd.DataFrame(records['data'], columns=records['columns'])
+
+
+def summary_histogram(summary: Dict[str, Any], col: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stored display histogram of a numeric column
+
+    Args:
+        summary: Stored summary
+        col: Numeric column
+
+    Returns:
+        (edges, counts) over HISTOGRAM_BINS equal-width bins
+    """
+    hist = summary['histograms'][col]
+    return np.asarray(hist['edges']), np.asarray(hist['counts'])
+
+
+def box_stats(summary: Dict[str, Any], col: str) -> Dict[str, float]:
+    """
+    Quartiles, Tukey fences (clipped to the data range) and mean of a column
+
+    Args:
+        summary: Stored summary
+        col: Numeric column
+
+    Returns:
+        Dict with q1, median, q3, lowerfence, upperfence and mean
+    """
+    stats = summary['describe'][col]
+    iqr = stats['75%'] - stats['25%']
+    return {
+        'q1': stats['25%'], 'median': stats['50%'], 'q3': stats['75%'],
+        'lowerfence': max(stats['min'], stats['25%'] - 1.5 * iqr),
+        'upperfence': min(stats['max'], stats['75%'] + 1.5 * iqr),
+        'mean': stats['mean'],
+    }
@@ -0,0 +1,77 @@
+"""
+SHAP explainer cache
+
+Building an explainer (and importing shap) dominates the first SHAP
+analysis of a worker. Explainers are cached per model file and training
+split, so the SHAP page and the warm-up phase share them.
+"""
+import os
+import pandas as pd
+import streamlit as st
+from typing import Any
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import MODEL_PATHS, X_TRAIN_PATH
+from models.metrics_store import file_digest
+from models.splits import split_path
+
+
+BACKGROUND_ROWS = 100
+
+
+def align_features(X: pd.DataFrame) -> pd.DataFrame:
+    """
+    Align encoded rows to the feature schema as float64, as SHAP expects
+
+    Args:
+        X: Encoded features
+
+    Returns:
+        DataFrame with the schema's feature order, missing columns as 0
+    """
+    from models.model_loader import load_feature_schema
+
+    aligned = X.reindex(columns=load_feature_schema()['feature_order'], fill_value=0)
+    for col in aligned.columns:
+        if aligned[col].dtype == bool:
+            aligned[col] = aligned[col].astype(int)
+        aligned[col] = pd.to_numeric(aligned[col], errors='coerce')
+    return aligned.astype('float64').fillna(0)
+
+
+def load_explainer(model_name: str) -> Any:
+    """
+    SHAP explainer of a published model
+
+    Args:
+        model_name: Model name as used in MODEL_PATHS
+
+    Returns:
+        shap.Explainer with a fixed background sample of the training split
+    """
+    fingerprint = (file_digest(MODEL_PATHS[model_name]), file_digest(split_path(X_TRAIN_PATH)))
+    return _load_explainer_cached(model_name, fingerprint)
+
+
+@st.cache_resource(max_entries=len(MODEL_PATHS))
+def _load_explainer_cached(model_name: str, fingerprint: tuple) -> Any:
+    """
+    Build an explainer
+
+    Args:
+        model_name: Model name as used in MODEL_PATHS
+        fingerprint: Model and training split digests, used as the cache key
+
+    Returns:
+        shap.Explainer
+    """
+    import shap
+    from models.model_loader import load_models
+    from models.data_loader import load_train_test_data
+
+    X_train = align_features(load_train_test_data()['X_train'])
+    background = X_train.sample(min(BACKGROUND_ROWS, len(X_train)), random_state=42)
+    return shap.Explainer(load_models()[model_name], background)
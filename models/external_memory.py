@@ -0,0 +1,158 @@
+"""
+Out-of-core XGBoost training
+
+Raw rows are streamed from disk in batches, one-hot encoded with the
+published feature schema batch by batch and handed to XGBoost through its
+DataIter interface. XGBoost sketches the batches into quantized pages
+cached on disk, so the training data never has to fit in memory. Rows with
+categories outside the schema, and rows of the test split, are dropped
+from the batches and counted.
+"""
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional
+
+import xgboost as xgb
+
+
+# Get settings from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import TARGET_COL, TRAINING_RUN_DIR
+from models.preprocessing import FeatureEncoder
+
+
+DEFAULT_BATCH_ROWS = 250_000
+
+
+class EncodedBatchIter(xgb.DataIter):
+    """Feeds encoded batches of one or more raw dataset files to XGBoost"""
+
+    def __init__(self, paths: List[str], encoder: FeatureEncoder, batch_rows: int = DEFAULT_BATCH_ROWS,
+                 cache_prefix: Optional[str] = None, exclude_hashes: Optional[np.ndarray] = None):
+        """
+        Args:
+            paths: CSV (dataset_800.csv format) or Parquet files, read in order
+            encoder: Encoder of the feature schema to train on
+            batch_rows: Rows per batch
+            cache_prefix: Where XGBoost writes its external-memory pages
+            exclude_hashes: Sorted encoded_row_hash values of rows to leave
+                out (the test split)
+        """
+        self._paths = list(paths)
+        self._encoder = encoder
+        self._batch_rows = batch_rows
+        self._exclude_hashes = exclude_hashes
+        self._chunks = None
+        self._dropped = [0, 0]
+        # Rows dropped in the last complete pass
+        self.unknown_rows = 0
+        self.excluded_rows = 0
+        super().__init__(cache_prefix=cache_prefix)
+
+    def _iter_chunks(self):
+        """Chain the chunks of every input file"""
+        from models.data_loader import iter_dataset_chunks
+
+        for path in self._paths:
+            yield from iter_dataset_chunks(path, self._batch_rows)
+
+    def reset(self) -> None:
+        """Rewind to the first batch (called by XGBoost before each pass)"""
+        self._chunks = self._iter_chunks()
+        self._dropped = [0, 0]
+
+    def next(self, input_data: Callable) -> bool:
+        """Encode and pass on the next batch; False when the input is exhausted"""
+        from models.splits import encoded_row_hash
+
+        if self._chunks is None:
+            self.reset()
+        while True:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.unknown_rows, self.excluded_rows = self._dropped
+                return False
+
+            # Unknown categories would encode as all zeros
+            known = self._encoder.known_rows(chunk)
+            self._dropped[0] += int((~known).sum())
+            chunk = chunk[known]
+            X = self._encoder.transform(chunk.drop(columns=[TARGET_COL]))
+            y = chunk[TARGET_COL].to_numpy(dtype='float64')
+            if self._exclude_hashes is not None and len(X):
+                excluded = np.isin(encoded_row_hash(X, y), self._exclude_hashes)
+                self._dropped[1] += int(excluded.sum())
+                X, y = X[~excluded], y[~excluded]
+            if len(X):
+                break
+
+        input_data(data=X.to_numpy(dtype=np.float32), label=y.astype(np.float32),
+                   feature_names=self._encoder.columns)
+        return True
+
+
+def train_external_memory(paths: List[str], params: Dict[str, Any], num_boost_round: int,
+                          encoder: FeatureEncoder, batch_rows: int = DEFAULT_BATCH_ROWS, max_bin: int = 256,
+                          cache_dir: Optional[str] = None, exclude_hashes: Optional[np.ndarray] = None,
+                          log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Train an XGBoost booster on data streamed from disk
+
+    Args:
+        paths: Training files in the raw dataset schema
+        params: Booster parameters (tree_method is forced to 'hist')
+        num_boost_round: Boosting rounds
+        encoder: Encoder of the feature schema to train on
+        batch_rows: Rows per streamed batch
+        max_bin: Histogram bins per feature
+        cache_dir: Directory for external-memory pages; a temporary
+            directory under TRAINING_RUN_DIR is used and removed by default
+        exclude_hashes: Sorted encoded_row_hash values of rows to leave out
+        log: Progress callback
+
+    Returns:
+        Dict with the booster, training row count, dropped row counts and timings
+    """
+    own_cache = cache_dir is None
+    if own_cache:
+        os.makedirs(TRAINING_RUN_DIR, exist_ok=True)
+        cache_dir = tempfile.mkdtemp(prefix='extmem_', dir=TRAINING_RUN_DIR)
+
+    try:
+        start = time.perf_counter()
+        batches = EncodedBatchIter(paths, encoder, batch_rows, cache_prefix=os.path.join(cache_dir, 'train'),
+                                   exclude_hashes=exclude_hashes)
+        dtrain = xgb.ExtMemQuantileDMatrix(batches, max_bin=max_bin, nthread=params.get('nthread'))
+        sketch_seconds = time.perf_counter() - start
+        unknown_rows, excluded_rows = batches.unknown_rows, batches.excluded_rows
+        log(f"  Sketched {dtrain.num_row():,} rows into external-memory pages in {sketch_seconds:.1f}s")
+        if unknown_rows:
+            log(f"  ⚠️ Dropped {unknown_rows:,} rows with categories outside the feature schema")
+        if excluded_rows:
+            log(f"  ⚠️ Dropped {excluded_rows:,} rows that are in the test split")
+
+        start = time.perf_counter()
+        booster = xgb.train({**params, 'tree_method': 'hist', 'max_bin': max_bin}, dtrain,
+                            num_boost_round=num_boost_round)
+        train_seconds = time.perf_counter() - start
+        log(f"  Trained {num_boost_round} rounds in {train_seconds:.1f}s")
+
+        # Release the pages before their cache directory is removed
+        rows = int(dtrain.num_row())
+        del dtrain, batches
+
+        return {
+            'booster': booster,
+            'rows': rows,
+            'unknown_rows': unknown_rows,
+            'excluded_rows': excluded_rows,
+            'sketch_seconds': sketch_seconds,
+            'train_seconds': train_seconds,
+        }
+    finally:
+        if own_cache:
+            shutil.rmtree(cache_dir, ignore_errors=True)
@@ -0,0 +1,138 @@
+"""
+Feature schema artifact
+
+One JSON document describes the encoded feature layout: raw numeric
+columns, category vocabularies, one-hot column order and dtypes, plus a
+version hash over all of it. split_dataset.py records it in the split
+manifest, training publishes it next to the models and inference loads
+it instead of reading training data to learn column names.
+"""
+import os
+import json
+import hashlib
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import DATASET_PATH, FEATURE_SCHEMA_PATH, TARGET_COL
+from models.preprocessing import FeatureEncoder
+
+
+def build_schema(encoder: FeatureEncoder, encoded: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Describe an encoder's output as a versioned schema
+
+    Args:
+        encoder: Fitted encoder
+        encoded: Any output of encoder.transform (only dtypes are used)
+
+    Returns:
+        Schema dict with a 'version' hash
+    """
+    schema = {
+        **encoder.to_dict(),
+        'feature_order': encoder.columns,
+        'dtypes': {col: str(encoded[col].dtype) for col in encoder.columns},
+        'target': TARGET_COL,
+    }
+    payload = json.dumps(schema, sort_keys=True, ensure_ascii=False)
+    schema['version'] = hashlib.sha256(payload.encode()).hexdigest()[:16]
+    return schema
+
+
+def fit_schema(path: str = DATASET_PATH) -> Dict[str, Any]:
+    """
+    Fit a schema on a raw dataset (fallback when no artifact exists)
+
+    Args:
+        path: Raw dataset file
+
+    Returns:
+        Schema dict
+    """
+    from models.data_loader import read_dataset
+
+    df = read_dataset(path)
+    encoder = FeatureEncoder.fit([df])
+    return build_schema(encoder, encoder.transform(df.head(1)))
+
+
+def schema_encoder(schema: Dict[str, Any]) -> FeatureEncoder:
+    """Encoder that produces exactly the schema's feature order"""
+    return FeatureEncoder.from_dict(schema)
+
+
+def schema_raw_columns(schema: Dict[str, Any]) -> list:
+    """Raw feature columns an input must provide to be encoded"""
+    return schema['numeric_columns'] + list(schema['categories'])
+
+
+def save_schema(schema: Dict[str, Any], path: str = FEATURE_SCHEMA_PATH) -> None:
+    """Write a schema atomically"""
+    from models.metrics_store import atomic_write
+
+    atomic_write(path, json.dumps(schema, indent=2, ensure_ascii=False))
+
+
+def read_schema(path: str = FEATURE_SCHEMA_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Read a saved schema
+
+    Args:
+        path: Schema file
+
+    Returns:
+        Schema dict or None if missing or unreadable
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def schema_for_split(columns) -> Dict[str, Any]:
+    """
+    Schema of the current split, checked against its encoded columns
+
+    Args:
+        columns: Columns of the encoded training split
+
+    Returns:
+        Schema dict
+
+    Raises:
+        ValueError: If the split was encoded with a different layout
+    """
+    from models.splits import read_split_manifest
+
+    schema = (read_split_manifest() or {}).get('schema') or fit_schema()
+    if schema['feature_order'] != list(columns):
+        raise ValueError("Split columns don't match the feature schema; re-run split_dataset.py")
+    return schema
+
+
+def resolve_schema() -> Dict[str, Any]:
+    """
+    Schema of the published models
+
+    Falls back to the current split's schema, then to fitting one on the
+    raw dataset, so older model directories keep working.
+
+    Returns:
+        Schema dict
+    """
+    schema = read_schema()
+    if schema is not None:
+        return schema
+
+    from models.splits import read_split_manifest
+
+    manifest = read_split_manifest() or {}
+    if 'schema' in manifest:
+        return manifest['schema']
+    return fit_schema()
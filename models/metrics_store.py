@@ -0,0 +1,289 @@
+"""
+Metrics store materialization
+
+Evaluated metrics live in the gitignored fingerprint cache
+(models/metrics_cache.json): accuracy plus machine-specific timings. Each
+model is fingerprinted by content hash together with the test data; only
+models whose fingerprint changed are re-evaluated. The tracked
+models/model_comparison.csv holds the accuracy columns only and is written
+by the training publish step, never from the app.
+"""
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import (
+    MODEL_PATHS, METRICS_PATH, METRICS_CACHE_PATH,
+    X_TEST_PATH, Y_TEST_PATH
+)
+from models.splits import split_path, read_split
+
+
+METRIC_COLUMNS = ['Model', 'R²', 'MAE', 'RMSE', 'MAPE',
+                  'Predict_Latency_ms', 'Rows_per_sec', 'Model_Size_KB']
+# Machine-independent columns published to METRICS_PATH
+PUBLISHED_COLUMNS = ['Model', 'R²', 'MAE', 'RMSE', 'MAPE']
+
+# Number of single-row predictions timed per model
+LATENCY_REPEATS = 50
+
+_DIGEST_MEMO: Dict[str, tuple] = {}
+_REFRESH_LOCK = threading.Lock()
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Compute the SHA-256 digest of a file
+
+    Digests are memoized on (size, mtime) so unchanged files are never
+    re-read between reruns.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    key = (stat.st_size, stat.st_mtime_ns)
+    cached = _DIGEST_MEMO.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    digest = sha.hexdigest()
+    _DIGEST_MEMO[path] = (key, digest)
+    return digest
+
+
+def test_data_digest() -> Optional[str]:
+    """
+    Combined digest of X_test and y_test
+
+    Returns:
+        Hex digest or None if either file is missing
+    """
+    x_digest = file_digest(split_path(X_TEST_PATH))
+    y_digest = file_digest(split_path(Y_TEST_PATH))
+    if x_digest is None or y_digest is None:
+        return None
+    return hashlib.sha256(f"{x_digest}:{y_digest}".encode()).hexdigest()
+
+
+def atomic_write(path: str, payload: str) -> None:
+    """
+    Write text to path via a temporary file and an atomic rename
+
+    Args:
+        path: Destination file
+        payload: Text content
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _read_cache() -> Dict[str, Any]:
+    """Read the fingerprint cache, tolerating a missing or corrupt file"""
+    try:
+        with open(METRICS_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict) and isinstance(cache.get('models'), dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {'models': {}}
+
+
+def current_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Cached metrics of models whose file and test split haven't changed since evaluation
+
+    Reads only file stats and the cache file; never evaluates.
+
+    Returns:
+        Dict mapping model names to metrics rows
+    """
+    data_digest = test_data_digest()
+    return {
+        name: entry['metrics']
+        for name, entry in _read_cache()['models'].items()
+        if name in MODEL_PATHS and entry.get('model_hash') == file_digest(MODEL_PATHS[name])
+        and data_digest is not None and entry.get('data_hash') == data_digest
+    }
+
+
+def _load_test_data():
+    """Load X_test and y_test as (DataFrame, 1D array)"""
+    X_test = read_split(X_TEST_PATH)
+    y_test = read_split(Y_TEST_PATH).iloc[:, 0].values
+    return X_test, y_test
+
+
+def _measure_timing(model: Any, X_test: pd.DataFrame) -> Dict[str, float]:
+    """
+    Time single-row latency and full-batch throughput
+
+    Args:
+        model: Fitted model
+        X_test: Features to predict on
+
+    Returns:
+        Dict with median single-row latency (ms) and batch rows/sec
+    """
+    from models.benchmark import measure_single_row_latency, measure_throughput
+
+    latencies = measure_single_row_latency(model, X_test, repeats=LATENCY_REPEATS)
+    return {
+        'Predict_Latency_ms': float(np.median(latencies) * 1000),
+        'Rows_per_sec': float(measure_throughput(model, X_test, len(X_test))),
+    }
+
+
+def evaluate_model(model_name: str, model_path: str, X_test: pd.DataFrame, y_test) -> Dict[str, Any]:
+    """
+    Load one model from disk and compute accuracy and timing metrics
+
+    Args:
+        model_name: Model name as used in MODEL_PATHS
+        model_path: Path to the serialized model
+        X_test: Test features
+        y_test: Test targets
+
+    Returns:
+        Metrics row keyed by METRIC_COLUMNS
+    """
+    from models.model_loader import load_model_file
+    from utils.helpers import calculate_metrics
+
+    model = load_model_file(model_name, model_path)
+    y_pred = model.predict(X_test)
+    scores = calculate_metrics(y_test, y_pred)
+
+    row = {
+        'Model': model_name,
+        'R²': float(scores['R2']),
+        'MAE': float(scores['MAE']),
+        'RMSE': float(scores['RMSE']),
+        'MAPE': float(scores['MAPE']),
+        'Model_Size_KB': os.path.getsize(model_path) / 1024,
+    }
+    row.update(_measure_timing(model, X_test))
+    return row
+
+
+def split_changed_since_training() -> bool:
+    """
+    Whether the split on disk differs from the one the published models were trained on
+
+    Compares the split digests recorded in the training manifest with the
+    current files. Without a manifest the provenance is unknown and this
+    returns False (scripts/split_dataset.py warns about that case).
+
+    Returns:
+        True if evaluating now could score models on rows they trained on
+    """
+    from models.training import data_digests, read_manifest
+
+    trained_on = (read_manifest() or {}).get('data')
+    if not trained_on:
+        return False
+    return trained_on != data_digests()
+
+
+def refresh_metrics(force: bool = False, publish: bool = False,
+                    check_split: bool = True) -> Optional[List[str]]:
+    """
+    Bring the metrics cache up to date with model files and test data
+
+    Cheap when nothing changed: only file stats and the small cache file
+    are read. Stale models are loaded and re-evaluated, so this is never
+    called while rendering a page.
+
+    Args:
+        force: Re-evaluate every model regardless of fingerprints
+        publish: Also rewrite METRICS_PATH (accuracy columns only) when its
+            content changes; reserved for the training publish step
+        check_split: Refuse to evaluate if the split changed since training
+            (the publish step, which just trained on it, skips this)
+
+    Returns:
+        Names of re-evaluated models, or None if test data is unavailable
+
+    Raises:
+        RuntimeError: If the split changed since the models were trained
+    """
+    with _REFRESH_LOCK:
+        data_digest = test_data_digest()
+        if data_digest is None:
+            return None
+        if check_split and split_changed_since_training():
+            raise RuntimeError("The train/test split changed since the published models were trained, so "
+                               "their test rows may include training rows. Retrain them "
+                               "(scripts/train_models.py) before re-evaluating.")
+
+        entries = _read_cache()['models']
+        current = {}
+        stale = []
+
+        for model_name, model_path in MODEL_PATHS.items():
+            model_digest = file_digest(model_path)
+            if model_digest is None:
+                continue
+            entry = entries.get(model_name)
+            if (force or entry is None
+                    or entry.get('model_hash') != model_digest
+                    or entry.get('data_hash') != data_digest):
+                stale.append((model_name, model_path, model_digest))
+            else:
+                current[model_name] = entry
+
+        if stale or set(entries) != set(current):
+            if stale:
+                X_test, y_test = _load_test_data()
+                for model_name, model_path, model_digest in stale:
+                    current[model_name] = {
+                        'model_hash': model_digest,
+                        'data_hash': data_digest,
+                        'evaluated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                        'metrics': evaluate_model(model_name, model_path, X_test, y_test),
+                    }
+            atomic_write(METRICS_CACHE_PATH, json.dumps({'models': current}, indent=2, ensure_ascii=False))
+
+        if publish:
+            # Keep MODEL_PATHS order so the table is stable between publishes
+            rows = [current[name]['metrics'] for name in MODEL_PATHS if name in current]
+            payload = pd.DataFrame(rows, columns=METRIC_COLUMNS)[PUBLISHED_COLUMNS].to_csv(index=False)
+            try:
+                with open(METRICS_PATH, 'r', encoding='utf-8', newline='') as f:
+                    unchanged = f.read() == payload
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                atomic_write(METRICS_PATH, payload)
+
+        return [name for name, _, _ in stale]
@@ -3,9 +3,7 @@ Model loading utilities
 """
 import os
 import pickle
-import joblib
 import streamlit as st
-import xgboost as xgb
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional
@@ -14,14 +12,34 @@ from typing import Dict, Any, Optional
 # Get model paths from config
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from config.settings import MODEL_PATHS
+from config.settings import MODEL_PATHS, FEATURE_SCHEMA_PATH, SURROGATE_MODEL_PATH, SURROGATE_REPORT_PATH
+from models.metrics_store import file_digest
+from utils.instrumentation import timed
 
 
-@st.cache_resource
+@timed('load_models')
 def load_models() -> Dict[str, Any]:
     """
     Load all trained models
     
+    Models are cached per content fingerprint, so a retrained model file
+    is picked up on the next rerun instead of serving the stale object.
+    
+    Returns:
+        Dict mapping model names to loaded model objects
+    """
+    fingerprint = tuple(file_digest(path) for path in MODEL_PATHS.values())
+    return _load_models_cached(fingerprint)
+
+
+@st.cache_resource(max_entries=1)
+def _load_models_cached(fingerprint: tuple) -> Dict[str, Any]:
+    """
+    Deserialize every model in MODEL_PATHS
+    
+    Args:
+        fingerprint: Model file digests, used as the cache key
+        
     Returns:
         Dict mapping model names to loaded model objects
     """
@@ -33,20 +51,7 @@ def load_models() -> Dict[str, Any]:
                 st.warning(f"⚠️ Model file not found: {model_path}")
                 continue
                 
-            if model_name == 'XGBoost':
-                # Load XGBoost model from JSON
-                model = xgb.XGBRegressor()
-                model.load_model(model_path)
-                models[model_name] = model
-            else:
-                # Load joblib/pickle models (Decision Tree, etc.)
-                try:
-                    # Try joblib first (preferred for sklearn models)
-                    models[model_name] = joblib.load(model_path)
-                except Exception:
-                    # Fallback to pickle
-                    with open(model_path, 'rb') as f:
-                        models[model_name] = pickle.load(f)
+            models[model_name] = load_model_file(model_name, model_path)
                     
         except Exception as e:
             st.error(f"❌ Error loading {model_name}: {str(e)}")
@@ -54,6 +59,109 @@ def load_models() -> Dict[str, Any]:
     return models
 
 
+def load_feature_schema() -> Dict[str, Any]:
+    """
+    Load the feature schema published with the models
+    
+    Cached per schema file digest, like the models themselves.
+    
+    Returns:
+        Schema dict (feature_order, categories, dtypes, version)
+    """
+    return _load_feature_schema_cached(file_digest(FEATURE_SCHEMA_PATH))
+
+
+@st.cache_resource(max_entries=1)
+def _load_feature_schema_cached(fingerprint: Optional[str]) -> Dict[str, Any]:
+    """
+    Read the schema artifact, falling back to the split or the raw dataset
+    
+    Args:
+        fingerprint: Schema file digest (None if missing), used as the cache key
+        
+    Returns:
+        Schema dict
+    """
+    from models.feature_schema import resolve_schema
+    
+    return resolve_schema()
+
+
+def load_surrogate() -> Optional[Dict[str, Any]]:
+    """
+    Load the distilled fast-preview surrogate of the XGBoost model
+    
+    Returns:
+        Dict with the 'model', its distillation 'report' and 'stale' (True
+        when the XGBoost model changed since distillation), or None if no
+        surrogate was distilled for the current feature schema
+    """
+    fingerprint = (file_digest(SURROGATE_MODEL_PATH), file_digest(SURROGATE_REPORT_PATH))
+    surrogate = _load_surrogate_cached(fingerprint)
+    if surrogate is None:
+        return None
+    # A surrogate of another feature layout can't even be called on current inputs
+    if surrogate['report'].get('schema_version') != load_feature_schema().get('version'):
+        return None
+    teacher_path = MODEL_PATHS.get(surrogate['report'].get('teacher', 'XGBoost'))
+    teacher_digest = file_digest(teacher_path) if teacher_path else None
+    return {**surrogate, 'stale': surrogate['report'].get('teacher_sha256') != teacher_digest}
+
+
+@st.cache_resource(max_entries=1)
+def _load_surrogate_cached(fingerprint: tuple) -> Optional[Dict[str, Any]]:
+    """
+    Deserialize the surrogate and read its report
+    
+    Args:
+        fingerprint: Surrogate model and report digests, used as the cache key
+        
+    Returns:
+        Dict with 'model' and 'report', or None if either is missing
+    """
+    from models.distillation import read_surrogate_report
+    
+    report = read_surrogate_report()
+    if fingerprint[0] is None or report is None:
+        return None
+    import joblib
+    
+    return {'model': joblib.load(SURROGATE_MODEL_PATH), 'report': report}
+
+
+@timed('load_model_file')
+def load_model_file(model_name: str, model_path: str) -> Any:
+    """
+    Deserialize a single model file without Streamlit caching
+    
+    Args:
+        model_name: Model name as used in MODEL_PATHS
+        model_path: Path to the serialized model
+        
+    Returns:
+        Loaded model object
+    """
+    if model_name == 'XGBoost':
+        import xgboost as xgb
+        
+        # Load XGBoost model from JSON
+        model = xgb.XGBRegressor()
+        model.load_model(model_path)
+        return model
+    
+    import joblib
+    
+    # Load joblib/pickle models (Decision Tree, etc.)
+    try:
+        # Try joblib first (preferred for sklearn models)
+        return joblib.load(model_path)
+    except Exception:
+        # Fallback to pickle
+        with open(model_path, 'rb') as f:
+            return pickle.load(f)
+
+
+@timed('predict')
 def predict(model: Any, input_data: pd.DataFrame) -> Optional[np.ndarray]:
     """
     Make prediction using the provided model
@@ -0,0 +1,154 @@
+"""
+Feature preprocessing utilities
+"""
+import os
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Get settings from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import CATEGORICAL_COLS, TARGET_COL
+from utils.instrumentation import timed
+
+
+BOOL_COLS = ['Fertilizer_Used', 'Irrigation_Used']
+
+# Categorical blocks in the order the trained models expect them
+ONE_HOT_ORDER = ['Crop', 'Soil_Type', 'Weather_Condition']
+
+
+@timed('encode_for_model')
+def encode_for_model(df_input: pd.DataFrame, train_columns: List[str]) -> pd.DataFrame:
+    """
+    One-hot encode raw feature rows and align them to the training columns
+    
+    Args:
+        df_input: Raw rows with the dataset feature columns
+        train_columns: Encoded column order the model was trained on
+        
+    Returns:
+        Encoded DataFrame with exactly train_columns
+    """
+    df_processed = df_input.copy()
+    
+    # Convert boolean columns to int first
+    for col in BOOL_COLS:
+        if col in df_processed.columns:
+            df_processed[col] = df_processed[col].astype(int)
+    
+    # One-hot encode categorical columns
+    categorical_cols = [col for col in CATEGORICAL_COLS if col in df_processed.columns]
+    if categorical_cols:
+        df_processed = pd.get_dummies(df_processed, columns=categorical_cols, drop_first=True)
+    
+    # Align to training columns, keeping only training columns in correct order
+    return df_processed.reindex(columns=train_columns, fill_value=0)
+
+
+class FeatureEncoder:
+    """
+    One-hot encoder with a fixed vocabulary
+    
+    Fitted once on the category values of a dataset, then applied chunk by
+    chunk: every chunk gets the same columns in the same order, whether or
+    not it contains every category. Output matches encode_for_model
+    (drop_first one-hot, boolean flags as int).
+    """
+    
+    def __init__(self, numeric_columns: List[str], categories: Dict[str, List[str]]):
+        """
+        Args:
+            numeric_columns: Raw non-categorical feature columns, in output order
+            categories: Sorted vocabulary of each categorical column
+        """
+        self.numeric_columns = list(numeric_columns)
+        self.categories = {col: list(categories[col]) for col in ONE_HOT_ORDER}
+    
+    @classmethod
+    def fit(cls, chunks: Iterable[pd.DataFrame], columns: Optional[List[str]] = None) -> 'FeatureEncoder':
+        """
+        Learn column layout and category vocabularies from raw rows
+        
+        Args:
+            chunks: DataFrames with at least the categorical columns
+            columns: Raw column order; defaults to the first chunk's columns
+            
+        Returns:
+            Fitted encoder
+        """
+        values = {col: set() for col in ONE_HOT_ORDER}
+        for chunk in chunks:
+            if columns is None:
+                columns = chunk.columns.tolist()
+            for col in ONE_HOT_ORDER:
+                values[col].update(chunk[col].dropna().unique().tolist())
+        if columns is None:
+            raise ValueError("Cannot fit an encoder on empty input")
+        numeric_columns = [col for col in columns if col not in CATEGORICAL_COLS and col != TARGET_COL]
+        return cls(numeric_columns, {col: sorted(vals) for col, vals in values.items()})
+    
+    @property
+    def columns(self) -> List[str]:
+        """Encoded column order"""
+        dummies = [f"{col}_{value}" for col in ONE_HOT_ORDER for value in self.categories[col][1:]]
+        return self.numeric_columns + dummies
+    
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Encode raw rows; unknown categories encode as all zeros (see known_rows)
+        
+        Args:
+            df: Rows in the raw dataset schema
+            
+        Returns:
+            Encoded DataFrame with exactly self.columns
+        """
+        data = {}
+        for col in self.numeric_columns:
+            data[col] = df[col].astype(int) if col in BOOL_COLS else df[col]
+        for col in ONE_HOT_ORDER:
+            codes = pd.Categorical(df[col], categories=self.categories[col]).codes
+            for i, value in enumerate(self.categories[col][1:], start=1):
+                data[f"{col}_{value}"] = codes == i
+        return pd.DataFrame(data, index=df.index)
+    
+    def known_rows(self, df: pd.DataFrame) -> pd.Series:
+        """Boolean mask of rows whose categories are all in the vocabulary"""
+        known = pd.Series(True, index=df.index)
+        for col in ONE_HOT_ORDER:
+            known &= df[col].isin(self.categories[col])
+        return known
+    
+    def unknown_categories(self, df: pd.DataFrame) -> Dict[str, List[str]]:
+        """
+        Values outside the vocabulary, which transform would encode as all zeros
+        
+        Args:
+            df: Rows in the raw dataset schema
+            
+        Returns:
+            Sorted unknown values (missing values as '(missing)') of each
+            categorical column that has any
+        """
+        unknown = {}
+        for col in ONE_HOT_ORDER:
+            values = df.loc[~df[col].isin(self.categories[col]), col]
+            if len(values):
+                unknown[col] = sorted(values.astype(object).fillna('(missing)').astype(str).unique().tolist())
+        return unknown
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable description of the encoder"""
+        return {
+            'numeric_columns': self.numeric_columns,
+            'categories': self.categories,
+            'drop_first': True,
+            'columns': self.columns,
+        }
+    
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'FeatureEncoder':
+        """Rebuild an encoder saved with to_dict"""
+        return cls(payload['numeric_columns'], payload['categories'])
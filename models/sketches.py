@@ -0,0 +1,291 @@
+"""
+Mergeable streaming sketches
+
+Summaries built one chunk at a time in bounded memory and merged across
+chunks, files or worker processes. The result does not depend on how the
+data was split up, beyond the stated error of the quantile sketch:
+
+- QuantileSketch: KLL quantiles, histograms and ranks with an error bound
+- MomentSketch: exact counts, means, variances and correlations
+"""
+import math
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+DEFAULT_K = 200
+# Capacity ratio between a KLL level and the level above it
+LEVEL_DECAY = 2 / 3
+MIN_LEVEL_CAPACITY = 8
+
+
+class QuantileSketch:
+    """
+    KLL quantile sketch of a numeric stream
+
+    Items are kept in levels; an item on level h stands for 2**h values.
+    When the sketch outgrows its capacity, the lowest full level is sorted
+    and every other item, starting at a random offset, moves up a level.
+    A compaction on level h changes any rank by -2**h, 0 or +2**h with
+    mean zero, so the summed squares of those weights bound the rank error
+    by Hoeffding's inequality (see rank_error). The sketch holds about 3k
+    items whatever the stream length; with k=200 the bound stays under 1%
+    at 99% confidence.
+    """
+
+    def __init__(self, k: int = DEFAULT_K, seed=None):
+        """
+        Args:
+            k: Capacity of the top level (accuracy/size trade-off)
+            seed: Seed or np.random.Generator for the compaction offsets
+        """
+        self.k = k
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.error_variance = 0.0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        """Items level may hold before it is compacted"""
+        depth = len(self.levels) - 1 - level
+        return max(MIN_LEVEL_CAPACITY, int(math.ceil(self.k * LEVEL_DECAY ** depth)))
+
+    def _compress(self) -> None:
+        """Compact the lowest full level until the sketch fits its capacity"""
+        while sum(map(len, self.levels)) > sum(self._capacity(h) for h in range(len(self.levels))):
+            level = next(h for h in range(len(self.levels)) if len(self.levels[h]) > self._capacity(h))
+            items = np.sort(self.levels[level])
+            # An odd item out stays on its level with its weight
+            keep, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[self._rng.integers(2)::2]])
+            self.error_variance += 4.0 ** level
+
+    def update(self, values) -> 'QuantileSketch':
+        """
+        Add values to the sketch (NaN and inf are skipped)
+
+        Args:
+            values: Array-like of numbers
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if len(values):
+            self.n += len(values)
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Fold another sketch of the same k into this one
+
+        Args:
+            other: Sketch of other values
+
+        Returns:
+            self
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge quantile sketches with k={self.k} and k={other.k}")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.error_variance += other.error_variance
+        self._compress()
+        return self
+
+    def weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retained items in ascending order with the number of values each stands for
+
+        Returns:
+            (values, weights); the weights sum to n
+        """
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        """
+        Approximate quantiles (0 and 1 give the exact min and max)
+
+        Args:
+            quantiles: Probabilities in [0, 1]
+
+        Returns:
+            One value per probability (NaN for an empty sketch)
+        """
+        quantiles = np.asarray(quantiles, dtype=float)
+        if not self.n:
+            return np.full(len(quantiles), np.nan)
+        values, weights = self.weighted_items()
+        index = np.searchsorted(np.cumsum(weights), quantiles * self.n, side='left')
+        result = values[np.clip(index, 0, len(values) - 1)]
+        result[quantiles <= 0] = self.min
+        result[quantiles >= 1] = self.max
+        return result
+
+    def histogram(self, bins: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate equal-width histogram between min and max
+
+        Every bin count is within 2 * rank_error() * n of the exact count.
+
+        Args:
+            bins: Number of bins
+
+        Returns:
+            (edges, counts); the counts sum to n
+        """
+        if not self.n:
+            return np.linspace(0, 1, bins + 1), np.zeros(bins, dtype=int)
+        high = self.max if self.max > self.min else self.min + 1
+        values, weights = self.weighted_items()
+        counts, edges = np.histogram(values, bins=bins, range=(self.min, high), weights=weights)
+        return edges, np.rint(counts).astype(int)
+
+    def rank_error(self, confidence: float = 0.99) -> float:
+        """
+        Bound on the normalized rank error of a single quantile or rank query
+
+        Args:
+            confidence: Probability that the bound holds
+
+        Returns:
+            Error as a fraction of n (0 while no compaction has happened)
+        """
+        if not self.n:
+            return 0.0
+        return math.sqrt(2 * math.log(2 / (1 - confidence)) * self.error_variance) / self.n
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable state of the sketch"""
+        return {
+            'k': self.k,
+            'n': self.n,
+            'min': self.min if self.n else None,
+            'max': self.max if self.n else None,
+            'error_variance': self.error_variance,
+            'levels': [items.tolist() for items in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any], seed=None) -> 'QuantileSketch':
+        """Rebuild a sketch saved with to_dict"""
+        sketch = cls(payload['k'], seed)
+        sketch.n = payload['n']
+        if sketch.n:
+            sketch.min, sketch.max = payload['min'], payload['max']
+        sketch.error_variance = payload['error_variance']
+        sketch.levels = [np.asarray(items, dtype=float) for items in payload['levels']]
+        return sketch
+
+
+class MomentSketch:
+    """
+    Count, means and co-moments of a fixed set of columns
+
+    Only rows where every column is finite are counted. Chunks and sketches
+    are combined with the pairwise update of Chan et al., which stays
+    accurate where summing raw squares would cancel.
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        """
+        Args:
+            columns: Column names, in the order of the arrays passed to update
+        """
+        self.columns = list(columns)
+        self.n = 0
+        self.mean = np.zeros(len(self.columns))
+        self.comoment = np.zeros((len(self.columns), len(self.columns)))
+
+    def update(self, values) -> 'MomentSketch':
+        """
+        Add rows to the sketch
+
+        Args:
+            values: 2-D array-like with one column per sketch column
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=float).reshape(-1, len(self.columns))
+        values = values[np.isfinite(values).all(axis=1)]
+        if not len(values):
+            return self
+        chunk = MomentSketch(self.columns)
+        chunk.n = len(values)
+        chunk.mean = values.mean(axis=0)
+        centered = values - chunk.mean
+        chunk.comoment = centered.T @ centered
+        return self.merge(chunk)
+
+    def merge(self, other: 'MomentSketch') -> 'MomentSketch':
+        """
+        Fold another sketch of the same columns into this one
+
+        Args:
+            other: Sketch of other rows
+
+        Returns:
+            self
+        """
+        if other.columns != self.columns:
+            raise ValueError(f"Cannot merge moment sketches of {self.columns} and {other.columns}")
+        if other.n:
+            n = self.n + other.n
+            delta = other.mean - self.mean
+            self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.n * other.n / n)
+            self.mean = self.mean + delta * (other.n / n)
+            self.n = n
+        return self
+
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        """Covariance matrix (NaN with too few rows)"""
+        if self.n <= ddof:
+            return np.full_like(self.comoment, np.nan)
+        return self.comoment / (self.n - ddof)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        """Standard deviation of every column"""
+        return np.sqrt(np.clip(np.diag(self.covariance(ddof)), 0, None))
+
+    def correlation(self) -> np.ndarray:
+        """Pearson correlation matrix (NaN for constant columns)"""
+        scale = self.std()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.clip(self.covariance() / np.outer(scale, scale), -1, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable state of the sketch"""
+        return {
+            'columns': self.columns,
+            'n': self.n,
+            'mean': self.mean.tolist(),
+            'comoment': self.comoment.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'MomentSketch':
+        """Rebuild a sketch saved with to_dict"""
+        sketch = cls(payload['columns'])
+        sketch.n = payload['n']
+        sketch.mean = np.asarray(payload['mean'], dtype=float).reshape(len(sketch.columns))
+        sketch.comoment = np.asarray(payload['comoment'], dtype=float).reshape(len(sketch.columns), -1)
+        return sketch
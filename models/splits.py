@@ -0,0 +1,242 @@
+"""
+Train/test split storage
+
+Rows are assigned to the test split by a hash of their content, so the
+assignment is deterministic, independent of row order and chunking, and
+can be made while streaming. Split files are written as Parquet (or the
+legacy CSVs) next to the paths in config.settings; readers resolve
+whichever format is present.
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import (
+    X_TRAIN_PATH, X_TEST_PATH, Y_TRAIN_PATH, Y_TEST_PATH,
+    TARGET_COL, SPLIT_MANIFEST_PATH
+)
+
+
+SPLIT_PATHS = {
+    'X_train': X_TRAIN_PATH,
+    'X_test': X_TEST_PATH,
+    'y_train': Y_TRAIN_PATH,
+    'y_test': Y_TEST_PATH,
+}
+
+SPLIT_FORMATS = ['parquet', 'csv']
+
+# Resolution of the test-fraction threshold
+HASH_BUCKETS = 10_000
+
+HASH_SCHEME = 'pandas-hash-v1: numeric/bool as float64, others as str, bucket = hash % 10000'
+
+
+def split_path(csv_path: str) -> str:
+    """
+    Resolve a split file to the format on disk
+
+    Args:
+        csv_path: Configured path (X_TRAIN_PATH etc.)
+
+    Returns:
+        The Parquet sibling if it exists, else csv_path
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    return parquet_path if os.path.exists(parquet_path) else csv_path
+
+
+def read_split(csv_path: str) -> pd.DataFrame:
+    """
+    Read a split file in whichever format is on disk
+
+    Args:
+        csv_path: Configured path (X_TRAIN_PATH etc.)
+
+    Returns:
+        DataFrame
+    """
+    path = split_path(csv_path)
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def row_hash(df: pd.DataFrame) -> np.ndarray:
+    """
+    Content hash of each row, stable across chunking and dtype inference
+
+    Args:
+        df: Rows in the raw dataset schema
+
+    Returns:
+        uint64 array, one hash per row
+    """
+    canonical = pd.DataFrame({
+        col: (df[col].astype('float64')
+              if pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_bool_dtype(df[col])
+              else df[col].astype(str))
+        for col in df.columns
+    })
+    return pd.util.hash_pandas_object(canonical, index=False).to_numpy()
+
+
+def test_mask(df: pd.DataFrame, test_fraction: float) -> np.ndarray:
+    """
+    Which rows belong to the test split
+
+    Args:
+        df: Rows in the raw dataset schema
+        test_fraction: Expected share of test rows
+
+    Returns:
+        Boolean array
+    """
+    return (row_hash(df) % HASH_BUCKETS) < int(round(test_fraction * HASH_BUCKETS))
+
+
+def encoded_row_hash(X: pd.DataFrame, y) -> np.ndarray:
+    """
+    Content hash of encoded rows together with their targets
+
+    Args:
+        X: Encoded features (as written to the X splits)
+        y: Targets, one per row
+
+    Returns:
+        uint64 array, one hash per row
+    """
+    return row_hash(X.assign(**{TARGET_COL: np.asarray(y, dtype='float64').ravel()}))
+
+
+def test_row_hashes() -> Optional[np.ndarray]:
+    """
+    Hashes of the test split rows, to keep them out of other training data
+
+    Returns:
+        Sorted unique encoded_row_hash values, or None if there is no split
+    """
+    if not (os.path.exists(split_path(X_TEST_PATH)) and os.path.exists(split_path(Y_TEST_PATH))):
+        return None
+    return np.unique(encoded_row_hash(read_split(X_TEST_PATH), read_split(Y_TEST_PATH).values))
+
+
+class _SplitWriter:
+    """Appends chunks to one split file as Parquet or CSV"""
+
+    def __init__(self, path: str, file_format: str):
+        self.path = path
+        self.file_format = file_format
+        self.rows = 0
+        self._writer = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.file_format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema, compression='zstd')
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode='w' if self.rows == 0 else 'a', index=False, header=(self.rows == 0))
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def write_splits(source: str, test_fraction: float = 0.2, file_format: str = 'parquet',
+                 chunk_rows: int = 100_000, output_dir: Optional[str] = None,
+                 log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Stream a raw dataset into encoded train/test split files
+
+    Two passes over the source: the first reads only the categorical
+    columns to fit the encoder, the second encodes each chunk once and
+    routes its rows by hash. Memory is bounded by chunk_rows. The
+    encoder's feature schema is recorded in the manifest.
+
+    Args:
+        source: Raw dataset (CSV in the dataset_800.csv format, or Parquet)
+        test_fraction: Expected share of test rows
+        file_format: 'parquet' or 'csv'
+        chunk_rows: Rows per streamed chunk
+        output_dir: Write the split files and manifest here instead of the
+            configured paths (used by benchmarks)
+        log: Progress callback
+
+    Returns:
+        Split manifest (also written to SPLIT_MANIFEST_PATH)
+    """
+    from models.data_loader import iter_dataset_chunks
+    from models.metrics_store import file_digest, atomic_write
+    from models.preprocessing import FeatureEncoder, ONE_HOT_ORDER
+    from models.feature_schema import build_schema
+
+    if file_format not in SPLIT_FORMATS:
+        raise ValueError(f"Unknown split format: {file_format}")
+
+    first_row = next(iter_dataset_chunks(source, chunk_rows=1))
+    encoder = FeatureEncoder.fit(iter_dataset_chunks(source, chunk_rows, columns=ONE_HOT_ORDER),
+                                 columns=first_row.columns.tolist())
+    schema = build_schema(encoder, encoder.transform(first_row.drop(columns=[TARGET_COL])))
+    log(f"Encoder fitted: {len(encoder.columns)} columns (schema {schema['version']})")
+
+    paths, manifest_path = SPLIT_PATHS, SPLIT_MANIFEST_PATH
+    if output_dir is not None:
+        paths = {name: os.path.join(output_dir, os.path.basename(path)) for name, path in paths.items()}
+        manifest_path = os.path.join(output_dir, os.path.basename(manifest_path))
+
+    extension = '.parquet' if file_format == 'parquet' else '.csv'
+    writers = {name: _SplitWriter(os.path.splitext(path)[0] + extension, file_format)
+               for name, path in paths.items()}
+    try:
+        for chunk in iter_dataset_chunks(source, chunk_rows):
+            is_test = test_mask(chunk, test_fraction)
+            X = encoder.transform(chunk.drop(columns=[TARGET_COL]))
+            y = chunk[[TARGET_COL]]
+            writers['X_train'].write(X[~is_test])
+            writers['X_test'].write(X[is_test])
+            writers['y_train'].write(y[~is_test])
+            writers['y_test'].write(y[is_test])
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    # Drop the other format's files so readers can't pick up a stale split
+    other = '.csv' if file_format == 'parquet' else '.parquet'
+    for path in paths.values():
+        stale = os.path.splitext(path)[0] + other
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    manifest = {
+        'source': os.path.abspath(source),
+        'source_sha256': file_digest(source),
+        'format': file_format,
+        'test_fraction': test_fraction,
+        'hash_scheme': HASH_SCHEME,
+        'rows': {'train': writers['X_train'].rows, 'test': writers['X_test'].rows},
+        'files': {name: os.path.basename(writer.path) for name, writer in writers.items()},
+        'schema': schema,
+    }
+    atomic_write(manifest_path, json.dumps(manifest, indent=2, ensure_ascii=False))
+    return manifest
+
+
+def read_split_manifest() -> Optional[Dict[str, Any]]:
+    """Manifest of the current split, or None if missing or unreadable"""
+    try:
+        with open(SPLIT_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,130 @@
+"""
+System status
+
+Model availability, versions and the best model, assembled from file
+stats, the training manifest, the metrics cache and the published metrics
+CSV. Nothing is deserialized, so the status is cheap enough for every
+rerun of every page. A daemon thread refreshes the snapshot in the background and
+readers get the latest one without waiting.
+"""
+import os
+import csv
+import time
+import threading
+from typing import Any, Dict, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import MODEL_PATHS, METRICS_PATH, STATUS_REFRESH_SECONDS
+from models.metrics_store import current_metrics, file_digest
+
+
+_LOCK = threading.Lock()
+_snapshot: Optional[Dict[str, Any]] = None
+_refresher: Optional[threading.Thread] = None
+
+
+def _modified_at(path: str) -> Optional[str]:
+    try:
+        return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(os.path.getmtime(path)))
+    except OSError:
+        return None
+
+
+def _published_scores() -> Dict[str, float]:
+    """R² per available model from the published metrics CSV (empty if unreadable)"""
+    try:
+        with open(METRICS_PATH, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        return {row['Model']: float(row['R²']) for row in rows
+                if row.get('Model') in MODEL_PATHS and file_digest(MODEL_PATHS[row['Model']]) is not None}
+    except (OSError, KeyError, TypeError, ValueError):
+        return {}
+
+
+def collect_status() -> Dict[str, Any]:
+    """
+    Build a status snapshot from metadata only
+
+    Every model is scored from the cached metrics of its current file,
+    else the test metrics in the training manifest when its artifact is
+    the one on disk, else the published METRICS_PATH (which ships with
+    the repository). The best model is taken over all of those scores, so
+    one model with a fresh cache entry doesn't hide the others.
+
+    Returns:
+        Dict with per-model 'models' entries (available, version,
+        published, modified_at), 'available' count, 'best_model',
+        'best_r2', 'trained_at', 'schema_version' and 'checked_at'
+    """
+    from models.training import read_manifest
+
+    manifest = read_manifest() or {}
+    artifacts = manifest.get('artifacts', {})
+
+    models = {}
+    for name, path in MODEL_PATHS.items():
+        digest = file_digest(path)
+        models[name] = {
+            'available': digest is not None,
+            'version': digest[:12] if digest else None,
+            'published': digest is not None and digest == artifacts.get(name, {}).get('sha256'),
+            'modified_at': _modified_at(path),
+        }
+
+    # Lowest priority first, so each source overrides the ones before it per model
+    scores = _published_scores()
+    for source in (
+        {row['Model']: row.get('R²') for row in manifest.get('metrics', [])
+         if models.get(row['Model'], {}).get('published')},
+        {name: row.get('R²') for name, row in current_metrics().items()},
+    ):
+        scores.update({name: r2 for name, r2 in source.items() if r2 is not None})
+    best_model = max(scores, key=scores.get) if scores else None
+
+    return {
+        'checked_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'models': models,
+        'available': sum(entry['available'] for entry in models.values()),
+        'best_model': best_model,
+        'best_r2': scores.get(best_model),
+        'trained_at': manifest.get('trained_at'),
+        'schema_version': manifest.get('schema_version'),
+    }
+
+
+def _refresh_loop(interval: float) -> None:
+    """Re-collect the snapshot every interval seconds"""
+    global _snapshot
+    while True:
+        time.sleep(interval)
+        try:
+            snapshot = collect_status()
+        except Exception:
+            continue
+        with _LOCK:
+            _snapshot = snapshot
+
+
+def get_status() -> Dict[str, Any]:
+    """
+    Latest status snapshot
+
+    The first call collects synchronously and starts the background
+    refresher; later calls return immediately.
+
+    Returns:
+        Snapshot from collect_status
+    """
+    global _snapshot, _refresher
+    with _LOCK:
+        if _snapshot is None:
+            _snapshot = collect_status()
+        if _refresher is None and STATUS_REFRESH_SECONDS > 0:
+            _refresher = threading.Thread(target=_refresh_loop, args=(STATUS_REFRESH_SECONDS,),
+                                          name='status-refresh', daemon=True)
+            _refresher.start()
+        return _snapshot
+
@@ -0,0 +1,235 @@
+"""
+Synthetic dataset generation
+
+A profile is fitted once on the real dataset (numeric quantiles, boolean
+rates, category frequencies and a linear yield model with empirical
+residuals) and then sampled chunk by chunk, so millions of rows can be
+streamed to CSV or Parquet without holding them in memory.
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterator, Optional
+
+
+# Get settings from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import DATASET_PATH, CATEGORICAL_COLS, TARGET_COL, ENCODED_FEATURE_COLUMNS
+
+
+PROFILE_QUANTILES = 101
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def fit_profile(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Fit per-column distributions of a dataset in the dataset_800.csv schema
+
+    Args:
+        df: Reference dataset with the raw columns
+
+    Returns:
+        JSON-serializable profile
+    """
+    from models.preprocessing import encode_for_model
+
+    probs = np.linspace(0, 1, PROFILE_QUANTILES)
+    profile = {'columns': df.columns.tolist(), 'numeric': {}, 'boolean': {}, 'categorical': {}}
+
+    for col in df.columns:
+        if col == TARGET_COL:
+            continue
+        if col in CATEGORICAL_COLS:
+            freq = df[col].value_counts(normalize=True).sort_index()
+            profile['categorical'][col] = {'values': freq.index.tolist(), 'probs': freq.values.tolist()}
+        elif pd.api.types.is_bool_dtype(df[col]):
+            profile['boolean'][col] = float(df[col].mean())
+        else:
+            profile['numeric'][col] = {
+                'quantiles': np.quantile(df[col], probs).tolist(),
+                'integer': bool(pd.api.types.is_integer_dtype(df[col])),
+            }
+
+    # Linear yield model keeps the feature/yield relationship; residuals are resampled
+    X = encode_for_model(df.drop(columns=[TARGET_COL]), ENCODED_FEATURE_COLUMNS).astype('float64')
+    design = np.column_stack([np.ones(len(X)), X.to_numpy()])
+    y = df[TARGET_COL].to_numpy(dtype='float64')
+    coef, *_ = np.linalg.lstsq(design, y, rcond=None)
+    residuals = y - design @ coef
+    profile['target'] = {
+        'name': TARGET_COL,
+        'coef': coef.tolist(),
+        'residual_quantiles': np.quantile(residuals, probs).tolist(),
+        'min': float(y.min()),
+        'max': float(y.max()),
+    }
+    return profile
+
+
+def save_profile(profile: Dict[str, Any], path: str) -> None:
+    """Write a fitted profile as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, indent=2)
+
+
+def load_profile(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load a saved profile, or fit one on DATASET_PATH when no path is given
+
+    Args:
+        path: Profile JSON written by save_profile
+
+    Returns:
+        Fitted profile
+    """
+    if path is None:
+        from models.data_loader import read_dataset
+        return fit_profile(read_dataset(DATASET_PATH))
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _sample_quantiles(rng: np.random.Generator, quantiles, size: int) -> np.ndarray:
+    """Inverse-CDF sampling from piecewise-linear empirical quantiles"""
+    probs = np.linspace(0, 1, len(quantiles))
+    return np.interp(rng.random(size), probs, quantiles)
+
+
+def sample_chunk(profile: Dict[str, Any], n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Draw one chunk of synthetic rows from a profile
+
+    Args:
+        profile: Fitted profile
+        n_rows: Rows in the chunk
+        rng: Random generator
+
+    Returns:
+        DataFrame with the raw dataset columns in original order
+    """
+    from models.preprocessing import encode_for_model
+
+    data = {}
+    for col, spec in profile['categorical'].items():
+        data[col] = rng.choice(np.array(spec['values'], dtype=object), size=n_rows, p=spec['probs'])
+    for col, rate in profile['boolean'].items():
+        data[col] = rng.random(n_rows) < rate
+    for col, spec in profile['numeric'].items():
+        values = _sample_quantiles(rng, spec['quantiles'], n_rows)
+        data[col] = np.round(values).astype('int64') if spec['integer'] else values
+
+    target = profile['target']
+    features = pd.DataFrame(data)
+    X = encode_for_model(features, ENCODED_FEATURE_COLUMNS).to_numpy(dtype='float64')
+    coef = np.asarray(target['coef'])
+    y = coef[0] + X @ coef[1:] + _sample_quantiles(rng, target['residual_quantiles'], n_rows)
+    data[target['name']] = np.clip(y, target['min'], target['max'])
+
+    return pd.DataFrame(data)[profile['columns']]
+
+
+def iter_synthetic_chunks(profile: Dict[str, Any], n_rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          seed: int = 42, label_model: Any = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream synthetic rows chunk by chunk
+
+    Each chunk gets its own child seed, so output is reproducible for a
+    given (seed, chunk_size) pair.
+
+    Args:
+        profile: Fitted profile
+        n_rows: Total rows to generate
+        chunk_size: Rows per chunk
+        seed: Random seed
+        label_model: Optional fitted model whose predictions replace the target
+
+    Yields:
+        DataFrames with the raw dataset columns
+    """
+    from models.preprocessing import encode_for_model
+
+    n_chunks = max(1, int(np.ceil(n_rows / chunk_size)))
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    remaining = n_rows
+
+    for child_seed in seeds:
+        size = min(chunk_size, remaining)
+        if size <= 0:
+            break
+        chunk = sample_chunk(profile, size, np.random.default_rng(child_seed))
+        if label_model is not None:
+            target_col = profile['target']['name']
+            X = encode_for_model(chunk.drop(columns=[target_col]), ENCODED_FEATURE_COLUMNS)
+            chunk[target_col] = label_model.predict(X)
+        remaining -= size
+        yield chunk
+
+
+def generate_dataset(n_rows: int, seed: int = 42, reference: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Generate rows following the dataset_800.csv schema in memory
+
+    Args:
+        n_rows: Number of rows to generate
+        seed: Random seed for reproducibility
+        reference: Dataset to fit the profile on; defaults to DATASET_PATH
+
+    Returns:
+        DataFrame with the raw dataset columns
+    """
+    profile = fit_profile(reference) if reference is not None else load_profile()
+    return pd.concat(iter_synthetic_chunks(profile, n_rows, seed=seed), ignore_index=True)
+
+
+def write_dataset_csv(df: pd.DataFrame, path) -> None:
+    """
+    Write rows in the raw dataset CSV format (semicolon separator, decimal comma)
+
+    Args:
+        df: Rows with the raw dataset columns
+        path: Destination file path or buffer
+    """
+    df.to_csv(path, sep=';', decimal=',', index=False)
+
+
+def write_chunks(chunks: Iterator[pd.DataFrame], path: str, file_format: str = 'csv') -> int:
+    """
+    Write streamed chunks to a single CSV or Parquet file
+
+    Args:
+        chunks: DataFrames with identical columns
+        path: Destination file
+        file_format: 'csv' (dataset_800.csv format) or 'parquet'
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    if file_format == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, sep=';', decimal=',', index=False, header=(i == 0))
+            rows += len(chunk)
+    return rows
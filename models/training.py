@@ -0,0 +1,1009 @@
+"""
+Headless training pipeline
+
+Reproduces notebooks/Final_Model_XGBoost.ipynb as resumable stages:
+cross-validation, XGBoost hyperparameter search (exhaustive grid or
+successive halving over the same grid), final fit, test-set evaluation
+and publishing. Each finished stage is checkpointed in
+TRAINING_RUN_DIR, so an interrupted run picks up where it stopped. Model
+files are published with atomic renames and described by a manifest
+(hashes, parameters, timings).
+
+update_xgboost continues boosting the published XGBoost model on newly
+labeled rows instead of retraining from scratch, and only publishes the
+result if it does not regress on a rolling holdout.
+train_xgboost_out_of_core trains on files larger than memory through
+XGBoost external memory (see models/external_memory.py).
+"""
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Get paths from config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from config.settings import (
+    MODEL_PATHS, X_TRAIN_PATH, X_TEST_PATH, Y_TRAIN_PATH, Y_TEST_PATH,
+    TRAINING_RUN_DIR, TRAINING_MANIFEST_PATH, FEATURE_SCHEMA_PATH, CV_PREDICTIONS_PATH, CV_REPORT_PATH
+)
+from models.metrics_store import file_digest, atomic_write
+from models.splits import split_path, read_split
+
+
+# Search space from the notebook (81 configurations)
+PARAM_GRID_XGB = {
+    'n_estimators': [100, 200, 300],
+    'max_depth': [3, 5, 7],
+    'learning_rate': [0.01, 0.05, 0.1],
+    'subsample': [0.8, 0.9, 1.0]
+}
+
+DEFAULT_TRAINING_CONFIG = {
+    'random_state': 42,
+    'cv_folds': 5,
+    'search_cv_folds': 3,
+    'param_grid': PARAM_GRID_XGB,
+    'search': 'halving',
+    'halving_factor': 3,
+    'min_rounds': 10,
+    'early_stopping_rounds': 20,
+    'max_bin': 256,
+}
+
+SEARCH_METHODS = ['halving', 'grid']
+
+STAGES = ['cross_validate', 'search', 'fit', 'evaluate', 'publish']
+
+STATE_FILE = 'state.json'
+
+
+def load_training_data() -> Dict[str, Any]:
+    """
+    Load the encoded train/test split written by split_dataset.py (Parquet or CSV)
+
+    Returns:
+        Dict with X_train, X_test (DataFrames) and y_train, y_test (1D arrays)
+
+    Raises:
+        FileNotFoundError: If any split file is missing
+    """
+    paths = {'X_train': X_TRAIN_PATH, 'X_test': X_TEST_PATH,
+             'y_train': Y_TRAIN_PATH, 'y_test': Y_TEST_PATH}
+    missing = [path for path in paths.values() if not os.path.exists(split_path(path))]
+    if missing:
+        raise FileNotFoundError(f"Split files not found: {', '.join(missing)}. Run split_dataset.py first.")
+
+    return {
+        'X_train': read_split(X_TRAIN_PATH),
+        'X_test': read_split(X_TEST_PATH),
+        'y_train': read_split(Y_TRAIN_PATH).values.ravel(),
+        'y_test': read_split(Y_TEST_PATH).values.ravel(),
+    }
+
+
+def data_digests() -> Dict[str, Optional[str]]:
+    """SHA-256 digests of the four split files"""
+    return {
+        'X_train': file_digest(split_path(X_TRAIN_PATH)),
+        'X_test': file_digest(split_path(X_TEST_PATH)),
+        'y_train': file_digest(split_path(Y_TRAIN_PATH)),
+        'y_test': file_digest(split_path(Y_TEST_PATH)),
+    }
+
+
+def run_key(config: Dict[str, Any], digests: Dict[str, Optional[str]]) -> str:
+    """
+    Identify a run by its configuration and input data
+
+    Checkpoints are only reused when this key matches, so changing the
+    grid, the seed or the split always starts a fresh run.
+
+    Args:
+        config: Training configuration (without parallelism settings)
+        digests: Input data digests
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps({'config': config, 'data': digests}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def build_models(random_state: int, n_jobs: int) -> Dict[str, Any]:
+    """
+    Baseline estimators compared in the notebook
+
+    Args:
+        random_state: Seed shared by all estimators
+        n_jobs: Threads per XGBoost fit
+
+    Returns:
+        Dict mapping model names to unfitted estimators
+    """
+    import xgboost as xgb
+    from sklearn.tree import DecisionTreeRegressor
+
+    return {
+        'Decision Tree': DecisionTreeRegressor(random_state=random_state),
+        'XGBoost': xgb.XGBRegressor(n_estimators=100, random_state=random_state, n_jobs=n_jobs)
+    }
+
+
+def _model_threads(n_jobs: int) -> int:
+    """Threads per XGBoost fit: one when fits already run in parallel workers"""
+    return -1 if n_jobs == 1 else 1
+
+
+def cross_validate_models(X, y, config: Dict[str, Any], n_jobs: int = -1) -> Dict[str, Any]:
+    """
+    K-fold cross-validation of the baseline estimators
+
+    Out-of-fold predictions, their segments and the fold timings are
+    checkpointed in TRAINING_RUN_DIR and published with the models.
+
+    Args:
+        X: Encoded training features
+        y: Training targets
+        config: Training configuration
+        n_jobs: Worker processes for the (model, fold) fits
+
+    Returns:
+        Dict mapping model names to fold R² scores, mean and std
+    """
+    from models.cv_report import decode_segments, run_cv, save_cv_report, summarize
+    from models.feature_schema import schema_for_split
+
+    segments = decode_segments(X, schema_for_split(X.columns))
+    predictions, timings = run_cv(build_models(config['random_state'], _model_threads(n_jobs)), X, y,
+                                  config['cv_folds'], config['random_state'], segments, n_jobs)
+    save_cv_report(predictions, timings,
+                   {'folds': config['cv_folds'], 'random_state': config['random_state'], 'data': data_digests()},
+                   predictions_path=_cv_checkpoint_path(CV_PREDICTIONS_PATH),
+                   report_path=_cv_checkpoint_path(CV_REPORT_PATH))
+    return summarize(predictions)
+
+
+def build_fold_cache(X, y, n_splits: int, max_bin: int = 256) -> List[tuple]:
+    """
+    Build the search folds once as quantized XGBoost matrices
+
+    Converting pandas data and sketching feature quantiles dominates short
+    trials, so every trial of a search trains on these shared matrices
+    instead of rebuilding them. Validation matrices reuse the cuts of
+    their training fold.
+
+    Args:
+        X: Encoded training features
+        y: Training targets
+        n_splits: Number of folds (unshuffled, as in GridSearchCV)
+        max_bin: Histogram bins per feature
+
+    Returns:
+        List of (train QuantileDMatrix, validation QuantileDMatrix, validation targets)
+    """
+    import xgboost as xgb
+    from sklearn.model_selection import KFold
+
+    X_values = np.asarray(X, dtype='float32')
+    y_values = np.asarray(y, dtype='float64')
+    folds = []
+    for train_idx, val_idx in KFold(n_splits=n_splits).split(X_values):
+        dtrain = xgb.QuantileDMatrix(X_values[train_idx], label=y_values[train_idx], max_bin=max_bin)
+        dval = xgb.QuantileDMatrix(X_values[val_idx], label=y_values[val_idx], ref=dtrain)
+        folds.append((dtrain, dval, y_values[val_idx]))
+    return folds
+
+
+def _grid_configs(grid: Dict[str, List[Any]]) -> tuple:
+    """Split a parameter grid into per-booster configurations and the n_estimators values"""
+    import itertools
+
+    estimator_grid = sorted(grid['n_estimators'])
+    other_keys = sorted(key for key in grid if key != 'n_estimators')
+    configs = [dict(zip(other_keys, values)) for values in itertools.product(*(grid[k] for k in other_keys))]
+    return configs, estimator_grid
+
+
+def _booster_params(params: Dict[str, Any], config: Dict[str, Any], n_jobs: int) -> Dict[str, Any]:
+    """Native xgb.train parameters equivalent to XGBRegressor(**params)"""
+    return {
+        'objective': 'reg:squarederror',
+        'tree_method': 'hist',
+        'max_bin': config['max_bin'],
+        'eta': params['learning_rate'],
+        'max_depth': params['max_depth'],
+        'subsample': params['subsample'],
+        'seed': config['random_state'],
+        'nthread': n_jobs,
+    }
+
+
+def _reached_rounds(booster, stopped: bool = False) -> int:
+    """Rounds a booster was validated up to (its best iteration if early stopping cut it short)"""
+    if stopped:
+        return booster.best_iteration + 1
+    return booster.num_boosted_rounds()
+
+
+def _score_rounds(booster, fold: tuple, estimator_grid: List[int], scores: Dict[tuple, float],
+                  key: int, fold_index: int, budget: int, stopped: bool = False) -> None:
+    """
+    Record validation R² of a booster truncated at each n_estimators it has reached
+
+    A booster that stopped early is not scored at grid values past its best
+    iteration, so a chosen n_estimators is always a round count that was grown.
+    """
+    from sklearn.metrics import r2_score
+
+    _, dval, y_val = fold
+    reached = min(budget, _reached_rounds(booster, stopped))
+    for n_estimators in estimator_grid:
+        if n_estimators <= reached and (key, n_estimators, fold_index) not in scores:
+            y_pred = booster.predict(dval, iteration_range=(0, n_estimators))
+            scores[(key, n_estimators, fold_index)] = r2_score(y_val, y_pred)
+
+
+def _score_truncated(boosters: Dict[int, list], stopped: Dict[int, List[bool]], folds: List[tuple],
+                     scores: Dict[tuple, float]) -> None:
+    """Score every configuration at the fewest rounds any of its folds reached before stopping early"""
+    from sklearn.metrics import r2_score
+
+    for key, fold_boosters in boosters.items():
+        if None in fold_boosters:
+            continue
+        n_rounds = min(_reached_rounds(booster, stop) for booster, stop in zip(fold_boosters, stopped[key]))
+        for fold_index, (booster, (_, dval, y_val)) in enumerate(zip(fold_boosters, folds)):
+            y_pred = booster.predict(dval, iteration_range=(0, n_rounds))
+            scores[(key, n_rounds, fold_index)] = r2_score(y_val, y_pred)
+
+
+def _best_candidate(scores: Dict[tuple, float], configs: List[Dict[str, Any]], n_folds: int) -> tuple:
+    """Best (params, mean R²) among candidates scored on every fold"""
+    candidates = {}
+    for key, n_estimators, _ in scores:
+        fold_scores = [scores.get((key, n_estimators, f)) for f in range(n_folds)]
+        if None not in fold_scores:
+            candidates[(key, n_estimators)] = float(np.mean(fold_scores))
+    (best_key, best_n), best_score = max(candidates.items(), key=lambda item: item[1])
+    return {**configs[best_key], 'n_estimators': best_n}, best_score
+
+
+def search_xgboost(folds: List[tuple], config: Dict[str, Any], n_jobs: int = -1) -> Dict[str, Any]:
+    """
+    Exhaustive search over config['param_grid'] on cached folds
+
+    Configurations that differ only in n_estimators share their first
+    trees, so one booster per configuration and fold is grown to the
+    largest n_estimators and scored at each grid value. This evaluates the
+    same candidates as GridSearchCV with half of the boosting rounds.
+
+    Args:
+        folds: Fold matrices from build_fold_cache
+        config: Training configuration
+        n_jobs: Threads per booster (-1 = all cores)
+
+    Returns:
+        Dict with best_params, best_score, the number of candidates and rounds trained
+    """
+    import xgboost as xgb
+
+    configs, estimator_grid = _grid_configs(config['param_grid'])
+    budget = estimator_grid[-1]
+    scores: Dict[tuple, float] = {}
+
+    for i, params in enumerate(configs):
+        for f, fold in enumerate(folds):
+            booster = xgb.train(_booster_params(params, config, n_jobs), fold[0], num_boost_round=budget)
+            _score_rounds(booster, fold, estimator_grid, scores, i, f, budget)
+
+    best_params, best_score = _best_candidate(scores, configs, len(folds))
+    return {
+        'best_params': best_params,
+        'best_score': best_score,
+        'candidates': len(configs) * len(estimator_grid),
+        'rounds_trained': len(configs) * budget * len(folds),
+    }
+
+
+def run_search(X, y, config: Dict[str, Any], n_jobs: int = -1, compare_grid: bool = False,
+               log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Run the configured hyperparameter search and report its cost
+
+    Folds are built once and shared by every trial (and by the grid when
+    comparing). For successive halving the wall-clock saving is estimated
+    from the boosting rounds the exhaustive grid would have trained; with
+    compare_grid the grid is also run and timed for a measured speedup.
+
+    Args:
+        X: Encoded training features
+        y: Training targets
+        config: Training configuration ('search' selects the method)
+        n_jobs: Threads per booster (-1 = all cores)
+        compare_grid: Also run the exhaustive grid and time it
+        log: Progress callback
+
+    Returns:
+        Search result with best_params, best_score and timing fields
+    """
+    if config['search'] not in SEARCH_METHODS:
+        raise ValueError(f"Unknown search method: {config['search']}")
+
+    start = time.perf_counter()
+    folds = build_fold_cache(X, y, config['search_cv_folds'], config['max_bin'])
+    fold_cache_seconds = time.perf_counter() - start
+
+    if config['search'] == 'grid':
+        result = search_xgboost(folds, config, n_jobs)
+    else:
+        result = search_xgboost_halving(folds, config, n_jobs)
+    result['method'] = config['search']
+    result['fold_cache_seconds'] = fold_cache_seconds
+    result['seconds'] = time.perf_counter() - start
+    log(f"  Best params: {result['best_params']} (CV R² {result['best_score']:.4f}, {result['seconds']:.1f}s, "
+        f"folds built in {fold_cache_seconds:.2f}s)")
+
+    if 'grid_rounds' in result:
+        # Rounds cost roughly the same whatever the configuration, so time scales with them
+        result['estimated_grid_seconds'] = result['seconds'] * result['grid_rounds'] / max(result['rounds_trained'], 1)
+        log(f"  Trained {result['rounds_trained']:,} of {result['grid_rounds']:,} grid boosting rounds "
+            f"(rungs {result['rungs']}); estimated grid time {result['estimated_grid_seconds']:.1f}s")
+
+    if compare_grid and config['search'] != 'grid':
+        grid_start = time.perf_counter()
+        grid = search_xgboost(folds, config, n_jobs)
+        result['grid_seconds'] = time.perf_counter() - grid_start
+        result['grid_best_params'] = grid['best_params']
+        result['grid_best_score'] = grid['best_score']
+        log(f"  Exhaustive grid: {result['grid_seconds']:.1f}s "
+            f"({result['grid_seconds'] / result['seconds']:.1f}x slower), "
+            f"best {grid['best_params']} (CV R² {grid['best_score']:.4f})")
+
+    return result
+
+
+def _halving_rungs(max_rounds: int, n_configs: int, factor: int, min_rounds: int) -> List[int]:
+    """
+    Boosting-round budget of each successive-halving rung
+
+    Args:
+        max_rounds: Budget of the last rung (largest n_estimators in the grid)
+        n_configs: Configurations entering the first rung
+        factor: Fraction 1/factor of configurations kept after each rung
+        min_rounds: Smallest useful budget
+
+    Returns:
+        Increasing list of round budgets ending at max_rounds
+    """
+    rungs = [max_rounds]
+    while n_configs > factor ** (len(rungs) - 1) and rungs[0] // factor >= min_rounds:
+        rungs.insert(0, rungs[0] // factor)
+    return rungs
+
+
+def search_xgboost_halving(folds: List[tuple], config: Dict[str, Any], n_jobs: int = -1) -> Dict[str, Any]:
+    """
+    Successive-halving search over the same grid as search_xgboost
+
+    n_estimators is treated as the budget: every other combination is
+    boosted on each fold for a small number of rounds, the best third
+    continues to the next rung, and so on up to max(n_estimators). One
+    booster per configuration and fold is grown incrementally, and it is
+    scored at every grid n_estimators it reaches, so the search space is
+    identical to the exhaustive grid. Boosters that stop improving on
+    their validation fold (early stopping) are not grown further, and
+    grid values past their best iteration are left unscored rather than
+    credited with the truncated booster. If that leaves no configuration
+    scored on every fold, each is scored at the rounds its folds reached
+    and that count is reported as n_estimators.
+
+    Args:
+        folds: Fold matrices from build_fold_cache
+        config: Training configuration
+        n_jobs: Threads per booster (-1 = all cores)
+
+    Returns:
+        Dict with best_params, best_score, the number of candidates and
+        the boosting rounds trained versus what the grid would train
+    """
+    import xgboost as xgb
+
+    configs, estimator_grid = _grid_configs(config['param_grid'])
+    factor = config['halving_factor']
+    rungs = _halving_rungs(estimator_grid[-1], len(configs), factor, config['min_rounds'])
+
+    boosters = {i: [None] * len(folds) for i in range(len(configs))}
+    stopped = {i: [False] * len(folds) for i in range(len(configs))}
+    scores: Dict[tuple, float] = {}
+    rounds_trained = 0
+    survivors = list(range(len(configs)))
+
+    for rung, budget in enumerate(rungs):
+        rung_scores = {}
+        for i in survivors:
+            params = _booster_params(configs[i], config, n_jobs)
+            for f, fold in enumerate(folds):
+                dtrain, dval, _ = fold
+                booster = boosters[i][f]
+                done = booster.num_boosted_rounds() if booster is not None else 0
+                if budget > done and not stopped[i][f]:
+                    booster = xgb.train(params, dtrain, num_boost_round=budget - done,
+                                        evals=[(dval, 'val')], verbose_eval=False,
+                                        early_stopping_rounds=config['early_stopping_rounds'],
+                                        xgb_model=booster)
+                    rounds_trained += booster.num_boosted_rounds() - done
+                    stopped[i][f] = booster.num_boosted_rounds() < budget
+                    boosters[i][f] = booster
+                _score_rounds(booster, fold, estimator_grid, scores, i, f, budget, stopped[i][f])
+            rung_scores[i] = float(np.mean([_rung_score(boosters[i][f], folds[f]) for f in range(len(folds))]))
+
+        if rung < len(rungs) - 1:
+            keep = max(1, len(survivors) // factor)
+            survivors = sorted(survivors, key=lambda i: rung_scores[i], reverse=True)[:keep]
+
+    if not any(all((i, n, f) in scores for f in range(len(folds))) for i in boosters for n in estimator_grid):
+        # Every configuration stopped short of the grid on some fold; report the rounds actually reached
+        _score_truncated(boosters, stopped, folds, scores)
+    best_params, best_score = _best_candidate(scores, configs, len(folds))
+    return {
+        'best_params': best_params,
+        'best_score': best_score,
+        'candidates': len(configs) * len(estimator_grid),
+        'rungs': rungs,
+        'rounds_trained': rounds_trained,
+        'grid_rounds': len(configs) * estimator_grid[-1] * len(folds),
+    }
+
+
+def _rung_score(booster, fold: tuple) -> float:
+    """Validation R² of a booster with all of its rounds"""
+    from sklearn.metrics import r2_score
+
+    _, dval, y_val = fold
+    return r2_score(y_val, booster.predict(dval, iteration_range=(0, booster.num_boosted_rounds())))
+
+
+def fit_final_models(X, y, best_params: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fit the Decision Tree and the tuned XGBoost on the full training set
+
+    Args:
+        X: Encoded training features
+        y: Training targets
+        best_params: XGBoost parameters chosen by the search
+        config: Training configuration
+
+    Returns:
+        Dict mapping model names to fitted estimators
+    """
+    import xgboost as xgb
+
+    models = build_models(config['random_state'], n_jobs=-1)
+    models['XGBoost'] = xgb.XGBRegressor(random_state=config['random_state'], **best_params)
+    for model in models.values():
+        model.fit(X, y)
+    return models
+
+
+def evaluate_models(models: Dict[str, Any], X_test, y_test) -> List[Dict[str, Any]]:
+    """
+    Test-set metrics in the model_comparison.csv layout
+
+    Args:
+        models: Fitted estimators
+        X_test: Encoded test features
+        y_test: Test targets
+
+    Returns:
+        List of metric rows
+    """
+    from utils.helpers import calculate_metrics
+
+    rows = []
+    for name, model in models.items():
+        scores = calculate_metrics(y_test, model.predict(X_test))
+        rows.append({'Model': name, 'R²': float(scores['R2']), 'MAE': float(scores['MAE']),
+                     'RMSE': float(scores['RMSE']), 'MAPE': float(scores['MAPE'])})
+    return rows
+
+
+def save_model_file(model_name: str, model: Any, path: str) -> None:
+    """
+    Serialize a model the way the notebook does, via temp file and rename
+
+    Args:
+        model_name: Model name as used in MODEL_PATHS
+        model: Fitted estimator (or a raw Booster for XGBoost)
+        path: Destination file
+    """
+    import joblib
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', suffix=os.path.basename(path))
+    os.close(fd)
+    try:
+        if model_name == 'XGBoost':
+            # Booster JSON keeps the file loadable by load_model_file
+            booster = model.get_booster() if hasattr(model, 'get_booster') else model
+            booster.save_model(tmp_path)
+        else:
+            joblib.dump(model, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def publish_file(src: str, dst: str) -> None:
+    """
+    Copy a checkpointed artifact into place atomically
+
+    Args:
+        src: Checkpoint file
+        dst: Published location
+    """
+    directory = os.path.dirname(os.path.abspath(dst))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', suffix=os.path.basename(dst))
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_manifest(path: str = TRAINING_MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Read the manifest of the last published training run
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Manifest dict or None if missing or unreadable
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _checkpoint_path(name: str) -> str:
+    """Checkpointed model file for a model name"""
+    return os.path.join(TRAINING_RUN_DIR, os.path.basename(MODEL_PATHS[name]))
+
+
+def _cv_checkpoint_path(path: str) -> str:
+    """Checkpointed cross-validation artifact for a published path"""
+    return os.path.join(TRAINING_RUN_DIR, os.path.basename(path))
+
+
+def _load_checkpoint_models() -> Dict[str, Any]:
+    """Load fitted models saved by the fit stage"""
+    from models.model_loader import load_model_file
+
+    return {name: load_model_file(name, _checkpoint_path(name)) for name in MODEL_PATHS}
+
+
+def _read_state(key: str) -> Dict[str, Any]:
+    """Checkpoint state for a run key; empty when missing or from another run"""
+    try:
+        with open(os.path.join(TRAINING_RUN_DIR, STATE_FILE), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('run_key') == key:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'run_key': key, 'stages': {}}
+
+
+def _write_state(state: Dict[str, Any]) -> None:
+    """Persist checkpoint state after a stage finishes"""
+    atomic_write(os.path.join(TRAINING_RUN_DIR, STATE_FILE), json.dumps(state, indent=2, ensure_ascii=False))
+
+
+def run_training(config: Optional[Dict[str, Any]] = None, n_jobs: int = -1, resume: bool = False,
+                 publish: bool = True, compare_grid: bool = False,
+                 log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Run the training pipeline end to end
+
+    Args:
+        config: Training configuration; defaults to DEFAULT_TRAINING_CONFIG
+        n_jobs: Parallel workers for cross-validation and search (-1 = all cores)
+        resume: Reuse stages checkpointed by an interrupted run with the same key
+        publish: Copy models into MODEL_PATHS, refresh metrics and write the manifest
+        compare_grid: Also time the exhaustive grid to report the search speedup
+        log: Progress callback
+
+    Returns:
+        Manifest of the run
+    """
+    config = {**DEFAULT_TRAINING_CONFIG, **(config or {})}
+    digests = data_digests()
+    key = run_key(config, digests)
+
+    os.makedirs(TRAINING_RUN_DIR, exist_ok=True)
+    state = _read_state(key) if resume else {'run_key': key, 'stages': {}}
+    stages = state['stages']
+    if resume and stages:
+        log(f"Resuming run {key[:12]}: {', '.join(stages)} already done")
+
+    data = load_training_data()
+    models = None
+
+    for stage in STAGES:
+        if stage == 'publish' and not publish:
+            break
+        if stage in stages:
+            log(f"✓ {stage} (checkpoint)")
+            continue
+
+        log(f"… {stage}")
+        start = time.perf_counter()
+
+        if stage == 'cross_validate':
+            result = cross_validate_models(data['X_train'], data['y_train'], config, n_jobs)
+            for name, scores in result.items():
+                log(f"  {name:15s} | R² = {scores['mean']:.4f} (±{scores['std']:.4f})")
+        elif stage == 'search':
+            result = run_search(data['X_train'], data['y_train'], config, n_jobs, compare_grid, log)
+        elif stage == 'fit':
+            models = fit_final_models(data['X_train'], data['y_train'],
+                                      stages['search']['result']['best_params'], config)
+            for name, model in models.items():
+                save_model_file(name, model, _checkpoint_path(name))
+            result = {name: file_digest(_checkpoint_path(name)) for name in models}
+        elif stage == 'evaluate':
+            models = models or _load_checkpoint_models()
+            result = evaluate_models(models, data['X_test'], data['y_test'])
+            for row in result:
+                log(f"  {row['Model']:<15} R² {row['R²']:.4f}  MAE {row['MAE']:.4f}  "
+                    f"RMSE {row['RMSE']:.4f}  MAPE {row['MAPE']:.2f}%")
+        else:
+            result = _publish(state, data['X_train'].columns, log)
+
+        stages[stage] = {'seconds': time.perf_counter() - start,
+                         'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                         'result': result}
+        _write_state(state)
+
+    manifest = _build_manifest(state, config, digests, n_jobs)
+    if publish:
+        atomic_write(TRAINING_MANIFEST_PATH, json.dumps(manifest, indent=2, ensure_ascii=False))
+    return manifest
+
+
+def _publish(state: Dict[str, Any], columns, log: Callable[[str], None]) -> Dict[str, Any]:
+    """Move checkpointed models, feature schema and CV report into place and refresh model_comparison.csv"""
+    from models.metrics_store import refresh_metrics
+    from models.feature_schema import schema_for_split, save_schema
+
+    schema = schema_for_split(columns)
+    expected = state['stages']['fit']['result']
+    for name, model_path in MODEL_PATHS.items():
+        checkpoint = _checkpoint_path(name)
+        if file_digest(checkpoint) != expected[name]:
+            raise RuntimeError(f"Checkpoint for {name} changed since it was fitted: {checkpoint}")
+        publish_file(checkpoint, model_path)
+        log(f"  {name} → {os.path.relpath(model_path)}")
+
+    save_schema(schema)
+    log(f"  Feature schema {schema['version']} → {os.path.relpath(FEATURE_SCHEMA_PATH)}")
+
+    for path in (CV_PREDICTIONS_PATH, CV_REPORT_PATH):
+        if os.path.exists(_cv_checkpoint_path(path)):
+            publish_file(_cv_checkpoint_path(path), path)
+            log(f"  CV report → {os.path.relpath(path)}")
+
+    refresh_metrics(publish=True, check_split=False)
+    return {'models': {name: file_digest(path) for name, path in MODEL_PATHS.items()},
+            'schema_version': schema['version']}
+
+
+def _build_manifest(state: Dict[str, Any], config: Dict[str, Any],
+                    digests: Dict[str, Optional[str]], n_jobs: int) -> Dict[str, Any]:
+    """Summarize a run: inputs, parameters, per-stage timings and published artifacts"""
+    import sklearn
+    import xgboost as xgb
+
+    stages = state['stages']
+    published = stages.get('publish', {}).get('result', {})
+    published_models = published.get('models', {})
+    return {
+        'run_key': state['run_key'],
+        'trained_at': stages.get('fit', {}).get('finished_at'),
+        'published_at': stages.get('publish', {}).get('finished_at'),
+        'config': config,
+        'n_jobs': n_jobs,
+        'data': digests,
+        'best_params': stages.get('search', {}).get('result', {}).get('best_params'),
+        'search': {key: value for key, value in stages.get('search', {}).get('result', {}).items()
+                   if key not in ('best_params',)},
+        'cv': stages.get('cross_validate', {}).get('result'),
+        'metrics': stages.get('evaluate', {}).get('result'),
+        'timings_s': {stage: stages[stage]['seconds'] for stage in STAGES if stage in stages},
+        'artifacts': {
+            name: {'path': os.path.relpath(path, os.path.dirname(TRAINING_MANIFEST_PATH)),
+                   'sha256': published_models.get(name)}
+            for name, path in MODEL_PATHS.items()
+        },
+        'schema_version': published.get('schema_version'),
+        'versions': {'python': sys.version.split()[0], 'numpy': np.__version__,
+                     'pandas': pd.__version__, 'sklearn': sklearn.__version__, 'xgboost': xgb.__version__},
+    }
+
+
+def read_labeled_rows(path: str) -> pd.DataFrame:
+    """
+    Read newly labeled rows in the raw dataset schema
+
+    Args:
+        path: CSV in the dataset_800.csv format, or a Parquet file
+
+    Returns:
+        DataFrame with the raw feature columns and the target
+    """
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+
+    from models.data_loader import read_dataset
+    return read_dataset(path)
+
+
+def _manifest_params(n_jobs: int, required: bool = False) -> Dict[str, Any]:
+    """
+    Booster parameters of the last published run
+
+    The saved booster JSON doesn't keep training parameters (its config
+    reads back as XGBoost defaults), so the ones chosen by the search are
+    taken from the manifest.
+
+    Args:
+        n_jobs: Threads for boosting (-1 = all cores)
+        required: Raise instead of falling back to XGBoost defaults
+
+    Raises:
+        ValueError: If required and the manifest has no chosen parameters
+    """
+    manifest = read_manifest() or {}
+    best_params = manifest.get('best_params') or {}
+    if required and not best_params:
+        raise ValueError(f"No model parameters in {os.path.relpath(TRAINING_MANIFEST_PATH)}; "
+                         "run a full training before updating the model")
+    config = {**DEFAULT_TRAINING_CONFIG, **manifest.get('config', {})}
+    params = {'learning_rate': 0.3, 'max_depth': 6, 'subsample': 1.0}  # XGBoost defaults
+    params.update({key: value for key, value in best_params.items() if key in params})
+    return _booster_params(params, config, n_jobs)
+
+
+def update_xgboost(new_rows: pd.DataFrame, rounds: int = 50, holdout_fraction: float = 0.2,
+                   tolerance: float = 0.0, publish: bool = True, n_jobs: int = -1,
+                   log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Continue boosting the published XGBoost model on newly labeled rows
+
+    The most recent holdout_fraction of the new rows (file order) is held
+    back and combined with the existing test split into a rolling holdout.
+    The updated model is published only if its holdout RMSE is no worse
+    than the current model's by more than tolerance. Rows with categories
+    outside the feature schema are dropped, and boosting continues with the
+    parameters recorded in the training manifest.
+
+    Args:
+        new_rows: Labeled rows in the raw dataset schema, oldest first
+        rounds: Boosting rounds added on top of the current model
+        holdout_fraction: Share of the newest rows held out for evaluation
+        tolerance: Allowed relative RMSE increase (0.01 = 1%)
+        publish: Replace the published model when the update is accepted
+        n_jobs: Threads for boosting (-1 = all cores)
+        log: Progress callback
+
+    Returns:
+        Update record with row counts, before/after metrics and the decision
+
+    Raises:
+        FileNotFoundError: If there is no published XGBoost model
+        ValueError: If the manifest has no model parameters or too few rows remain
+    """
+    import xgboost as xgb
+    from config.settings import TARGET_COL
+    from models.feature_schema import resolve_schema, schema_encoder
+    from models.model_loader import load_model_file
+    from utils.helpers import calculate_metrics
+
+    model_path = MODEL_PATHS['XGBoost']
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model file not found: {model_path}. Run a full training first.")
+
+    params = _manifest_params(n_jobs, required=True)
+    schema = resolve_schema()
+    encoder = schema_encoder(schema)
+
+    # Unknown categories would encode as all zeros; leave those rows out
+    known = encoder.known_rows(new_rows)
+    unknown_rows = int((~known).sum())
+    if unknown_rows:
+        unknown = '; '.join(f"{col}: {', '.join(values)}"
+                            for col, values in encoder.unknown_categories(new_rows).items())
+        log(f"  ⚠️ Dropped {unknown_rows:,} rows with categories outside the feature schema ({unknown})")
+        new_rows = new_rows[known]
+
+    n_holdout = max(1, int(round(len(new_rows) * holdout_fraction)))
+    if len(new_rows) <= n_holdout:
+        raise ValueError(f"Need more than {n_holdout} new rows to train and hold out")
+
+    X_new = encoder.transform(new_rows.drop(columns=[TARGET_COL])).astype('float32')
+    y_new = new_rows[TARGET_COL].to_numpy(dtype='float64')
+    X_fit, y_fit = X_new.iloc[:-n_holdout], y_new[:-n_holdout]
+
+    X_holdout, y_holdout = X_new.iloc[-n_holdout:], y_new[-n_holdout:]
+    if os.path.exists(split_path(X_TEST_PATH)) and os.path.exists(split_path(Y_TEST_PATH)):
+        X_holdout = pd.concat([read_split(X_TEST_PATH)[schema['feature_order']].astype('float32'), X_holdout],
+                              ignore_index=True)
+        y_holdout = np.concatenate([read_split(Y_TEST_PATH).values.ravel(), y_holdout])
+    dholdout = xgb.DMatrix(X_holdout, label=y_holdout)
+
+    booster = load_model_file('XGBoost', model_path).get_booster()
+    base_rounds = booster.num_boosted_rounds()
+    before = calculate_metrics(y_holdout, booster.predict(dholdout))
+
+    start = time.perf_counter()
+    updated = xgb.train(params, xgb.DMatrix(X_fit, label=y_fit),
+                        num_boost_round=rounds, xgb_model=booster)
+    seconds = time.perf_counter() - start
+    after = calculate_metrics(y_holdout, updated.predict(dholdout))
+
+    accepted = after['RMSE'] <= before['RMSE'] * (1 + tolerance)
+    log(f"  Holdout ({len(y_holdout):,} rows): RMSE {before['RMSE']:.4f} → {after['RMSE']:.4f}, "
+        f"R² {before['R2']:.4f} → {after['R2']:.4f}")
+
+    record = {
+        'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'rows': len(new_rows),
+        'unknown_rows': unknown_rows,
+        'holdout_rows': len(y_holdout),
+        'base_rounds': base_rounds,
+        'added_rounds': updated.num_boosted_rounds() - base_rounds,
+        'seconds': seconds,
+        'before': {key: float(value) for key, value in before.items()},
+        'after': {key: float(value) for key, value in after.items()},
+        'accepted': bool(accepted),
+        'published': False,
+    }
+
+    if not accepted:
+        log("  ✗ Update regresses on the holdout; keeping the current model")
+    elif publish:
+        publish_xgboost(updated, 'updates', record, log)
+        log(f"  {record['added_rounds']} rounds added")
+
+    return record
+
+
+def publish_xgboost(booster, history_key: str, record: Dict[str, Any], log: Callable[[str], None] = print) -> None:
+    """
+    Replace the published XGBoost model and log the change in the manifest
+
+    Saves the booster over MODEL_PATHS['XGBoost'], republishes the metrics
+    and appends record (marked published) to the manifest's history_key list.
+
+    Args:
+        booster: Model to publish
+        history_key: Manifest list the record is appended to ('updates', 'compressions', ...)
+        record: Description of the change
+        log: Progress callback
+    """
+    from models.metrics_store import refresh_metrics
+
+    model_path = MODEL_PATHS['XGBoost']
+    save_model_file('XGBoost', booster, model_path)
+    refresh_metrics(publish=True, check_split=False)
+    record['published'] = True
+    log(f"  ✓ XGBoost → {os.path.relpath(model_path)}")
+
+    manifest = read_manifest() or {}
+    manifest.setdefault(history_key, []).append(record)
+    manifest.setdefault('artifacts', {})['XGBoost'] = {
+        'path': os.path.relpath(model_path, os.path.dirname(TRAINING_MANIFEST_PATH)),
+        'sha256': file_digest(model_path),
+    }
+    manifest['published_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    atomic_write(TRAINING_MANIFEST_PATH, json.dumps(manifest, indent=2, ensure_ascii=False))
+
+
+def train_xgboost_out_of_core(paths: List[str], rounds: Optional[int] = None, batch_rows: Optional[int] = None,
+                              tolerance: float = 0.0, publish: bool = True, n_jobs: int = -1,
+                              log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Train XGBoost from scratch on files too large for memory
+
+    Uses the parameters of the last published run. Rows of the test split
+    and rows with categories outside the feature schema are left out of
+    training. Like update_xgboost, the model is published only if its
+    test-split RMSE is no worse than the current model's by more than
+    tolerance; without a test split it is never published.
+
+    Args:
+        paths: Training files in the raw dataset schema (CSV or Parquet)
+        rounds: Boosting rounds; defaults to the published n_estimators
+        batch_rows: Rows per streamed batch
+        tolerance: Allowed relative test RMSE increase (0.01 = 1%)
+        publish: Replace the published model when the new one is accepted
+        n_jobs: Threads for sketching and boosting (-1 = all cores)
+        log: Progress callback
+
+    Returns:
+        Training record with row counts, timings, before/after test
+        metrics and the decision
+    """
+    import xgboost as xgb
+    from models.external_memory import DEFAULT_BATCH_ROWS, train_external_memory
+    from models.feature_schema import resolve_schema, schema_encoder
+    from models.model_loader import load_model_file
+    from models.splits import test_row_hashes
+    from utils.helpers import calculate_metrics
+
+    manifest = read_manifest() or {}
+    config = {**DEFAULT_TRAINING_CONFIG, **manifest.get('config', {})}
+    rounds = rounds or (manifest.get('best_params') or {}).get('n_estimators', 100)
+
+    schema = resolve_schema()
+    result = train_external_memory(paths, _manifest_params(n_jobs), rounds, schema_encoder(schema),
+                                   batch_rows=batch_rows or DEFAULT_BATCH_ROWS,
+                                   max_bin=config['max_bin'], exclude_hashes=test_row_hashes(), log=log)
+    booster = result['booster']
+
+    record = {
+        'trained_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'files': [os.path.abspath(path) for path in paths],
+        'rows': result['rows'],
+        'unknown_rows': result['unknown_rows'],
+        'test_rows_excluded': result['excluded_rows'],
+        'rounds': rounds,
+        'sketch_seconds': result['sketch_seconds'],
+        'train_seconds': result['train_seconds'],
+        'before': None,
+        'metrics': None,
+        'accepted': False,
+        'published': False,
+    }
+
+    if not (os.path.exists(split_path(X_TEST_PATH)) and os.path.exists(split_path(Y_TEST_PATH))):
+        log("  ✗ No test split to check the model against; not publishing (run split_dataset.py)")
+        return record
+
+    X_test = read_split(X_TEST_PATH)[schema['feature_order']].astype('float32')
+    y_test = read_split(Y_TEST_PATH).values.ravel()
+    dtest = xgb.DMatrix(X_test)
+    scores = calculate_metrics(y_test, booster.predict(dtest))
+    record['metrics'] = {key: float(value) for key, value in scores.items()}
+
+    model_path = MODEL_PATHS['XGBoost']
+    if os.path.exists(model_path):
+        current = load_model_file('XGBoost', model_path).get_booster()
+        before = calculate_metrics(y_test, current.predict(dtest))
+        record['before'] = {key: float(value) for key, value in before.items()}
+        record['accepted'] = bool(scores['RMSE'] <= before['RMSE'] * (1 + tolerance))
+        log(f"  Test split ({len(y_test):,} rows): RMSE {before['RMSE']:.4f} → {scores['RMSE']:.4f}, "
+            f"R² {before['R2']:.4f} → {scores['R2']:.4f}")
+    else:
+        record['accepted'] = True
+        log(f"  Test split: R² {scores['R2']:.4f}  RMSE {scores['RMSE']:.4f}")
+
+    if not record['accepted']:
+        log("  ✗ New model regresses on the test split; keeping the current model")
+    elif publish:
+        publish_xgboost(booster, 'out_of_core', record, log)
+    return record
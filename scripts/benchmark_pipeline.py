@@ -0,0 +1,240 @@
+"""
+Benchmark the end-to-end prediction pipeline stage by stage
+
+Generates synthetic datasets in the dataset_800.csv schema, times each
+pipeline stage and writes a JSON report that can be diffed between commits.
+
+Usage:
+    python scripts/benchmark_pipeline.py --rows 800 10000 100000
+    python scripts/benchmark_pipeline.py --compare benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from config.settings import MODEL_PATHS, TARGET_COL
+from models.data_loader import read_dataset
+from models.model_loader import load_model_file
+from models.feature_schema import resolve_schema, schema_encoder
+from models.preprocessing import FeatureEncoder
+from models.splits import write_splits
+from models.synthetic import generate_dataset, write_dataset_csv
+from utils.helpers import calculate_metrics
+
+
+DEFAULT_OUTPUT = os.path.join('benchmarks', 'results.json')
+SHAP_BACKGROUND_ROWS = 100
+
+
+def _time(fn, repeats):
+    """Run fn repeats times and return (durations, last result)"""
+    durations = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        durations.append(time.perf_counter() - start)
+    return durations, result
+
+
+def _record(results, stage, durations, rows=None, model=None):
+    """Append a timing record keyed by stage, rows and model"""
+    median = float(np.median(durations))
+    key = '|'.join(str(part) for part in (stage, rows, model) if part is not None)
+    results[key] = {
+        'stage': stage,
+        'rows': rows,
+        'model': model,
+        'median_s': median,
+        'min_s': float(np.min(durations)),
+        'rows_per_sec': float(rows / median) if rows and median > 0 else None,
+    }
+    label = f"{stage}" + (f" [{model}]" if model else "") + (f" rows={rows:,}" if rows else "")
+    print(f"  {label:<48} {median * 1000:>10.2f} ms")
+
+
+def _git_commit():
+    """Current commit hash, if available"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=project_root,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def _versions():
+    """Versions of the libraries on the hot path"""
+    versions = {'python': platform.python_version()}
+    for module in ('numpy', 'pandas', 'sklearn', 'xgboost', 'shap'):
+        try:
+            versions[module] = __import__(module).__version__
+        except Exception:
+            versions[module] = None
+    return versions
+
+
+def run_benchmarks(sizes, repeats, seed, shap_rows):
+    """
+    Time every pipeline stage for each dataset size
+
+    Args:
+        sizes: Dataset sizes (rows) to generate
+        repeats: Timed repetitions per stage
+        seed: Seed for synthetic data
+        shap_rows: Rows explained in the SHAP stage; 0 disables SHAP
+
+    Returns:
+        Dict of timing records keyed by 'stage|rows|model'
+    """
+    results = {}
+
+    print("Model load")
+    models = {}
+    for model_name, model_path in MODEL_PATHS.items():
+        if not os.path.exists(model_path):
+            print(f"  ⚠️ Model file not found: {model_path}")
+            continue
+        durations, models[model_name] = _time(lambda: load_model_file(model_name, model_path), repeats)
+        _record(results, 'model_load', durations, model=model_name)
+
+    encoder = schema_encoder(resolve_schema())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in sizes:
+            print(f"\nDataset: {n_rows:,} rows")
+            df = generate_dataset(n_rows, seed=seed)
+            csv_path = os.path.join(tmp_dir, f'synthetic_{n_rows}.csv')
+            write_dataset_csv(df, csv_path)
+
+            durations, df = _time(lambda: read_dataset(csv_path), repeats)
+            _record(results, 'csv_parse', durations, rows=n_rows)
+
+            X = df.drop(TARGET_COL, axis=1)
+            y = df[TARGET_COL].to_numpy()
+
+            # As batch_prediction does: drop unknown categories, encode with the published schema
+            durations, X_encoded = _time(lambda: encoder.transform(X[encoder.known_rows(X)]), repeats)
+            y = y[encoder.known_rows(X).to_numpy()]
+            _record(results, 'encode_upload', durations, rows=n_rows)
+
+            # split_dataset.py: fit the vocabulary and encode, then the full streamed write
+            durations, _ = _time(lambda: FeatureEncoder.fit([df]).transform(X), repeats)
+            _record(results, 'encode_split', durations, rows=n_rows)
+
+            split_dir = os.path.join(tmp_dir, f'splits_{n_rows}')
+            os.makedirs(split_dir, exist_ok=True)
+            durations, _ = _time(lambda: write_splits(csv_path, output_dir=split_dir, log=lambda message: None),
+                                 repeats)
+            _record(results, 'write_splits', durations, rows=n_rows)
+
+            for model_name, model in models.items():
+                durations, y_pred = _time(lambda: model.predict(X_encoded), repeats)
+                _record(results, 'predict', durations, rows=n_rows, model=model_name)
+
+                durations, _ = _time(lambda: calculate_metrics(y, y_pred), repeats)
+                _record(results, 'metrics', durations, rows=n_rows, model=model_name)
+
+            # SHAP cost depends on explained rows, not dataset size: run it once
+            if shap_rows and n_rows == sizes[0]:
+                import shap
+
+                X_float = X_encoded.astype('float64')
+                background = X_float.sample(min(SHAP_BACKGROUND_ROWS, len(X_float)), random_state=seed)
+                explain_rows = X_float.iloc[:min(shap_rows, len(X_float))]
+                for model_name, model in models.items():
+                    def _explain():
+                        explainer = shap.Explainer(model, background)
+                        return explainer(explain_rows)
+                    durations, _ = _time(_explain, repeats)
+                    _record(results, 'shap', durations, rows=len(explain_rows), model=model_name)
+
+    return results
+
+
+def compare(current, baseline, threshold, min_delta_ms):
+    """
+    Print stages whose median time regressed beyond threshold
+
+    Args:
+        current: Timing records from this run
+        baseline: Timing records from a previous report
+        threshold: Allowed relative slowdown (0.2 = 20%)
+        min_delta_ms: Absolute slowdown below which changes are treated as noise
+
+    Returns:
+        List of regressed record keys
+    """
+    regressions = []
+    print(f"\nComparison against baseline (threshold +{threshold:.0%})")
+    for key in sorted(current):
+        if key not in baseline:
+            continue
+        before = baseline[key]['median_s']
+        after = current[key]['median_s']
+        change = (after - before) / before if before > 0 else 0.0
+        regressed = change > threshold and (after - before) * 1000 > min_delta_ms
+        flag = '❌' if regressed else '✓'
+        print(f"  {flag} {key:<48} {before * 1000:>10.2f} → {after * 1000:>10.2f} ms ({change:+.1%})")
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[800, 10000, 100000],
+                        help='Synthetic dataset sizes to benchmark')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed repetitions per stage')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for synthetic data')
+    parser.add_argument('--shap-rows', type=int, default=200,
+                        help='Rows explained in the SHAP stage (0 to skip)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='JSON report path')
+    parser.add_argument('--compare', help='Baseline JSON report to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative slowdown that counts as a regression')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                        help='Ignore slowdowns smaller than this many milliseconds')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.rows, args.repeats, args.seed, args.shap_rows)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'platform': platform.platform(),
+            'versions': _versions(),
+            'config': {'rows': args.rows, 'repeats': args.repeats, 'seed': args.seed,
+                       'shap_rows': args.shap_rows},
+        },
+        'results': results,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\n✓ Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold, args.min_delta_ms):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Build the EDA summary shown by the Home and Data Visualization pages
+
+Every input is sketched in one chunked pass and the sketches are merged,
+so inputs that don't fit in memory together (one file per region, say)
+can be summarized, in parallel with --workers or on separate machines:
+
+    python scripts/build_eda_summary.py --input region_a.parquet --sketch-output region_a.sketch.json
+    python scripts/build_eda_summary.py --input region_a.sketch.json region_b.sketch.json
+
+Usage:
+    python scripts/build_eda_summary.py [--input FILE ...] [--workers N] [--chunk-rows 100000]
+"""
+import argparse
+import os
+import sys
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from models.eda_summary import SKETCH_SUFFIX, save_eda_summary, save_sketch, sketch_sources
+from models.metrics_store import file_digest
+from models.sketches import DEFAULT_K
+from config.settings import DATASET_PATH, EDA_SUMMARY_PATH
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--input', nargs='+', default=[DATASET_PATH],
+                        help=f'Dataset CSV (dataset format) or Parquet files, or saved *{SKETCH_SUFFIX} sketches')
+    parser.add_argument('--output', default=EDA_SUMMARY_PATH, help='Summary JSON to write')
+    parser.add_argument('--sketch-output', default=None,
+                        help=f'Also write the merged sketch (*{SKETCH_SUFFIX}) for merging elsewhere')
+    parser.add_argument('--chunk-rows', type=int, default=100_000, help='Rows read per chunk')
+    parser.add_argument('--workers', type=int, default=1, help='Inputs sketched in parallel')
+    parser.add_argument('--k', type=int, default=DEFAULT_K,
+                        help='Quantile sketch size (higher is more accurate)')
+    args = parser.parse_args()
+
+    missing = [path for path in args.input if not os.path.exists(path)]
+    if missing:
+        print(f"❌ Input not found: {', '.join(missing)}")
+        return 1
+    if args.sketch_output and not args.sketch_output.endswith(SKETCH_SUFFIX):
+        print(f"❌ --sketch-output must end with {SKETCH_SUFFIX}")
+        return 1
+
+    print(f"Sketching {len(args.input)} input(s)...")
+    sketch = sketch_sources(args.input, args.chunk_rows, args.k, workers=args.workers, log=print)
+
+    # A summary of exactly one data file is tied to it; merged summaries are not
+    single = len(args.input) == 1 and not args.input[0].endswith(SKETCH_SUFFIX)
+    summary = sketch.summary(file_digest(args.input[0]) if single else None,
+                             [os.path.basename(path) for path in args.input])
+    save_eda_summary(summary, args.output)
+    if args.sketch_output:
+        save_sketch(sketch, args.sketch_output)
+
+    error = max(summary['rank_error'].values(), default=0.0)
+    print(f"✓ {summary['rows']:,} rows, {len(summary['numeric_columns'])} numeric columns, "
+          f"quantile rank error ≤ {error:.2%} (99% confidence)")
+    print(f"  - {os.path.relpath(args.output)}")
+    if args.sketch_output:
+        print(f"  - {os.path.relpath(args.sketch_output)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Report app startup import time and check it against the budget
+
+Imports src/app.py and one page's view in a fresh interpreter with
+`python -X importtime`, prints the slowest imports and fails when the
+total exceeds STARTUP_IMPORT_BUDGET_MS or when a heavy package listed in
+STARTUP_DEFERRED_MODULES is pulled in by the app shell or the home page.
+
+Usage:
+    python scripts/check_startup.py
+    python scripts/check_startup.py --page shap --budget-ms 5000
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from config.settings import PAGES, HIDDEN_PAGES, STARTUP_IMPORT_BUDGET_MS, STARTUP_DEFERRED_MODULES
+from views import VIEW_MODULES
+
+
+def _importtime(code: str) -> List[Tuple[int, int, str]]:
+    """
+    Run code in a fresh interpreter and parse its -X importtime log
+
+    Returns:
+        (depth, cumulative microseconds, module) per import, in log order
+    """
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([os.path.abspath(project_root),
+                                                        os.path.abspath(os.path.join(project_root, 'src'))])}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env,
+                            cwd=os.path.join(project_root, 'src'), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, int(cumulative), name.strip()))
+    return entries
+
+
+def _importers(entries: List[Tuple[int, int, str]]) -> Dict[str, str]:
+    """Module -> module that imported it (a parent is logged after its children)"""
+    parents = {}
+    for i, (depth, _, name) in enumerate(entries):
+        for parent_depth, _, parent in entries[i + 1:]:
+            if parent_depth < depth:
+                parents[name] = parent
+                break
+    return parents
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--page', default='home', choices=list(PAGES) + list(HIDDEN_PAGES),
+                        help='View imported after the app, as on first render')
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_IMPORT_BUDGET_MS,
+                        help='Maximum import time of app plus view')
+    parser.add_argument('--top', type=int, default=15, help='Slowest imports to list')
+    args = parser.parse_args()
+
+    # Modules the bare interpreter imports anyway are not the app's cost.
+    # A plain import statement (not importlib) keeps the view in the log.
+    baseline = {name for _, _, name in _importtime('pass')}
+    view = f"views.{VIEW_MODULES[args.page]}"
+    entries = _importtime(f"import app\nimport {view}")
+    app_entries = [entry for entry in entries if entry[2] not in baseline]
+
+    # A top-level entry is logged after its subtree: split off the view's imports
+    view_end = next(i for i, (depth, _, name) in enumerate(app_entries) if depth == 0 and name == view)
+    view_start = max([i + 1 for i, (depth, _, _) in enumerate(app_entries[:view_end]) if depth == 0], default=0)
+    shell_entries = app_entries[:view_start] + app_entries[view_end + 1:]
+
+    shell_ms = sum(cumulative for depth, cumulative, _ in shell_entries if depth == 0) / 1000
+    view_ms = app_entries[view_end][1] / 1000
+    total_ms = shell_ms + view_ms
+    print(f"Startup imports: {total_ms:.0f} ms (app {shell_ms:.0f} ms + {args.page} view {view_ms:.0f} ms), "
+          f"budget {args.budget_ms:.0f} ms\n")
+    for depth, cumulative, name in sorted(app_entries, key=lambda entry: -entry[1])[:args.top]:
+        print(f"  {cumulative / 1000:>8.1f} ms  {'  ' * depth}{name}")
+
+    # Deferred packages may be imported by the page that needs them, but
+    # not by the app shell or the landing page
+    checked = app_entries if args.page == 'home' else shell_entries
+    imported = {name for _, _, name in checked}
+    deferred = [module for module in STARTUP_DEFERRED_MODULES if module in imported]
+    parents = _importers(entries)
+
+    failed = False
+    if total_ms > args.budget_ms:
+        print(f"\n❌ Import time over budget by {total_ms - args.budget_ms:.0f} ms")
+        failed = True
+    for module in deferred:
+        chain, name = [module], module
+        while name in parents:
+            name = parents[name]
+            chain.append(name)
+        print(f"\n❌ {module} imported at startup via {' ← '.join(chain)}")
+        failed = True
+
+    if not failed:
+        print(f"\n✓ Within budget; deferred: {', '.join(STARTUP_DEFERRED_MODULES)}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Compress the published XGBoost model by merging leaves and dropping trees
+
+Writes models/xgboost_model.compressed.json and models/compression_report.json
+with tree/node counts, file size, load time, single-row latency and test
+metrics before and after. --publish swaps the compressed model in.
+
+Usage:
+    python scripts/compress_model.py
+    python scripts/compress_model.py --rmse-tolerance 0.01 --leaf-tolerance 0.02
+    python scripts/compress_model.py --publish
+"""
+import argparse
+import os
+import sys
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from config.settings import MODEL_PATHS, COMPRESSED_MODEL_PATH, COMPRESSION_REPORT_PATH
+from models.compression import DEFAULT_RMSE_TOLERANCE, DEFAULT_LEAF_TOLERANCE, compress_xgboost
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rmse-tolerance', type=float, default=DEFAULT_RMSE_TOLERANCE,
+                        help='Allowed relative RMSE increase on the training split from dropping trees')
+    parser.add_argument('--leaf-tolerance', type=float, default=DEFAULT_LEAF_TOLERANCE,
+                        help='Merge sibling leaves whose values differ by at most this (tons/ha)')
+    parser.add_argument('--publish', action='store_true',
+                        help='Replace the published XGBoost model with the compressed one')
+    args = parser.parse_args()
+
+    if not os.path.exists(MODEL_PATHS['XGBoost']):
+        print(f"❌ Model not found: {MODEL_PATHS['XGBoost']}")
+        return 1
+
+    print("Compressing XGBoost")
+    report = compress_xgboost(rmse_tolerance=args.rmse_tolerance, leaf_tolerance=args.leaf_tolerance)
+
+    before, after = report['before'], report['after']
+    print(f"\n{'':<16}{'before':>12}{'after':>12}")
+    for label, key, fmt in [('Trees', 'trees', '{:,}'), ('Nodes', 'nodes', '{:,}'),
+                            ('File (KB)', 'file_kb', '{:.1f}'), ('Load (ms)', 'load_ms', '{:.1f}'),
+                            ('Latency p50 (ms)', 'latency_p50_ms', '{:.3f}')]:
+        print(f"{label:<16}{fmt.format(before[key]):>12}{fmt.format(after[key]):>12}")
+    for metric in ('R2', 'MAE', 'RMSE', 'MAPE'):
+        print(f"{'Test ' + metric:<16}{before['metrics'][metric]:>12.4f}{after['metrics'][metric]:>12.4f}")
+
+    if args.publish:
+        from models.model_loader import load_model_file
+        from models.training import publish_xgboost
+
+        record = {
+            'compressed_at': report['created_at'],
+            'rmse_tolerance': args.rmse_tolerance,
+            'leaf_tolerance': args.leaf_tolerance,
+            'trees': [before['trees'], after['trees']],
+            'metrics_before': before['metrics'],
+            'metrics_after': after['metrics'],
+        }
+        booster = load_model_file('XGBoost', COMPRESSED_MODEL_PATH).get_booster()
+        publish_xgboost(booster, 'compressions', record, print)
+
+    print(f"\n✓ {os.path.relpath(COMPRESSED_MODEL_PATH)}")
+    print(f"  - {os.path.relpath(COMPRESSION_REPORT_PATH)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
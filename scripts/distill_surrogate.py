@@ -0,0 +1,60 @@
+"""
+Distill the published XGBoost model into a fast surrogate tree
+
+Samples the observed range of every input feature, labels the samples with
+the XGBoost model and fits a shallow decision tree on them. Writes
+models/surrogate_tree.pkl and models/surrogate_report.json with fidelity to
+XGBoost (on fresh samples and the test split) and single-row latency.
+The Single Prediction page offers the surrogate as a fast preview.
+
+Usage:
+    python scripts/distill_surrogate.py
+    python scripts/distill_surrogate.py --samples 500000 --max-depth 12
+"""
+import argparse
+import os
+import sys
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from config.settings import MODEL_PATHS, SURROGATE_MODEL_PATH, SURROGATE_REPORT_PATH
+from models.distillation import DEFAULT_SAMPLES, DEFAULT_MAX_DEPTH, TEACHER, distill_surrogate
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help='Teacher-labeled training samples')
+    parser.add_argument('--max-depth', type=int, default=DEFAULT_MAX_DEPTH, help='Surrogate tree depth')
+    parser.add_argument('--seed', type=int, default=42, help='Random state for sampling and the tree')
+    args = parser.parse_args()
+
+    if not os.path.exists(MODEL_PATHS[TEACHER]):
+        print(f"❌ Model not found: {MODEL_PATHS[TEACHER]}")
+        return 1
+
+    print(f"Distilling {TEACHER} into a depth-{args.max_depth} tree")
+    report = distill_surrogate(args.samples, args.max_depth, args.seed)
+
+    sampled = report['fidelity_sampled']
+    print(f"\nFidelity on fresh samples: R² {sampled['R2']:.4f}  MAE {sampled['MAE']:.4f}  "
+          f"p95 |error| {sampled['P95_abs_error']:.4f}")
+    if 'fidelity_test' in report:
+        test = report['fidelity_test']
+        metrics = report['test_metrics']
+        latency = report['latency_p50_ms']
+        print(f"Fidelity on test split:    R² {test['R2']:.4f}  MAE {test['MAE']:.4f}")
+        print(f"Test R² vs actual:         {TEACHER} {metrics['teacher']['R2']:.4f}  "
+              f"surrogate {metrics['surrogate']['R2']:.4f}")
+        print(f"Single-row latency p50:    {TEACHER} {latency['teacher']:.3f} ms  "
+              f"surrogate {latency['surrogate']:.3f} ms")
+
+    print(f"\n✓ {os.path.relpath(SURROGATE_MODEL_PATH)}")
+    print(f"  - {os.path.relpath(SURROGATE_REPORT_PATH)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
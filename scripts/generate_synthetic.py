@@ -0,0 +1,61 @@
+"""
+Generate a large synthetic dataset that follows dataset_800.csv
+
+Usage:
+    python scripts/generate_synthetic.py --rows 5000000 --output data/synthetic_5m.parquet
+    python scripts/generate_synthetic.py --rows 100000 --output data/synthetic.csv --label-model XGBoost
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from config.settings import MODEL_PATHS
+from models.synthetic import (
+    DEFAULT_CHUNK_SIZE, load_profile, save_profile, iter_synthetic_chunks, write_chunks
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, required=True, help='Number of rows to generate')
+    parser.add_argument('--output', required=True, help='Output file (.csv or .parquet)')
+    parser.add_argument('--format', choices=['csv', 'parquet'],
+                        help='Output format (default: from the file extension)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows per chunk')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--profile', help='Use a saved profile instead of fitting on dataset_800.csv')
+    parser.add_argument('--save-profile', help='Write the fitted profile to this JSON file')
+    parser.add_argument('--label-model', choices=list(MODEL_PATHS.keys()),
+                        help='Replace the target with predictions from this model')
+    args = parser.parse_args()
+
+    file_format = args.format or ('parquet' if args.output.endswith('.parquet') else 'csv')
+
+    profile = load_profile(args.profile)
+    if args.save_profile:
+        save_profile(profile, args.save_profile)
+        print(f"✓ Profile saved to {args.save_profile}")
+
+    label_model = None
+    if args.label_model:
+        from models.model_loader import load_model_file
+        label_model = load_model_file(args.label_model, MODEL_PATHS[args.label_model])
+
+    start = time.perf_counter()
+    chunks = iter_synthetic_chunks(profile, args.rows, chunk_size=args.chunk_size,
+                                   seed=args.seed, label_model=label_model)
+    rows = write_chunks(chunks, args.output, file_format)
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ {rows:,} rows written to {args.output} ({file_format}) in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Re-evaluate changed models into the metrics cache
+
+The tracked models/model_comparison.csv is only rewritten with --publish
+(training publishes it on its own).
+
+Usage:
+    python scripts/refresh_metrics.py [--force] [--publish]
+"""
+import argparse
+import os
+import sys
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from models.metrics_store import refresh_metrics
+from config.settings import METRICS_CACHE_PATH, METRICS_PATH
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--force', action='store_true',
+                        help='Re-evaluate every model even if fingerprints match')
+    parser.add_argument('--publish', action='store_true',
+                        help='Also rewrite the accuracy columns of the tracked metrics CSV')
+    args = parser.parse_args()
+
+    try:
+        evaluated = refresh_metrics(force=args.force, publish=args.publish)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    if evaluated is None:
+        print("❌ Test data not found. Please run split_dataset.py first.")
+        return 1
+
+    if evaluated:
+        print(f"✓ Re-evaluated: {', '.join(evaluated)}")
+    else:
+        print("✓ Metrics already up to date")
+    print(f"  - {os.path.relpath(METRICS_CACHE_PATH)}")
+    if args.publish:
+        print(f"  - {os.path.relpath(METRICS_PATH)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
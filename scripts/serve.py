@@ -0,0 +1,51 @@
+"""
+Run the Streamlit app with a warm-up phase and a readiness endpoint
+
+Starts the app in this process, preloads the data, models and views
+selected by WARMUP_* in config/settings.py (optionally the SHAP
+explainers) and serves GET /health and GET /ready on a separate port.
+/ready answers 503 until the warm-up has finished, so a load balancer
+only routes users to warm workers.
+
+Usage:
+    python scripts/serve.py
+    python scripts/serve.py --port 8501 --health-port 8502
+    CROPYIELD_WARMUP_SHAP=1 python scripts/serve.py
+"""
+import argparse
+import os
+import sys
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from config.settings import HEALTH_PORT
+from utils.warmup import start_health_server, start_warmup
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8501, help='Streamlit server port')
+    parser.add_argument('--health-port', type=int, default=HEALTH_PORT, help='Port of /health and /ready')
+    parser.add_argument('--no-warmup', action='store_true', help='Report ready without preloading')
+    args = parser.parse_args()
+
+    from streamlit.web import bootstrap
+
+    start_health_server(args.health_port)
+    print(f"Health endpoints on :{args.health_port} (/health, /ready)")
+    if args.no_warmup:
+        start_warmup(models=[], data=[], views=[], shap=False)
+    else:
+        start_warmup()
+
+    flag_options = {'server_port': args.port, 'server_headless': True, 'server_enableStaticServing': True}
+    bootstrap.load_config_options(flag_options)
+    bootstrap.run(os.path.join(project_root, 'src', 'app.py'), False, [], flag_options)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
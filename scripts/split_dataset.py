@@ -1,74 +1,69 @@
-import pandas as pd
-from sklearn.model_selection import train_test_split
+"""
+Split the raw dataset into encoded train/test files
 
-# Load dataset
-df = pd.read_csv('data/dataset_800.csv', sep=';', decimal=',')
+Streams the input in chunks, assigns each row to train or test by a hash
+of its content (deterministic, no shuffling in memory), encodes every
+chunk with one encoder fitted on the whole input and writes
+data/X_train, X_test, y_train and y_test plus data/split_manifest.json.
 
-print(f"Total data: {len(df)} rows")
-print(f"Columns: {df.columns.tolist()}")
+Usage:
+    python scripts/split_dataset.py
+    python scripts/split_dataset.py --input data/synthetic_5m.parquet --chunk-rows 500000
+    python scripts/split_dataset.py --format csv
+"""
+import argparse
+import os
+import sys
+import time
 
-# Pisahkan features (X) dan target (y)
-X = df.drop('Yield_tons_per_hectare', axis=1)
-y = df['Yield_tons_per_hectare']
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
 
-# Split 80:20 dengan random_state untuk reproducibility
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, 
-    test_size=0.2, 
-    random_state=42
-)
+from config.settings import DATASET_PATH, ENCODED_FEATURE_COLUMNS, MODEL_PATHS
+from models.splits import SPLIT_FORMATS, write_splits
 
-print(f"\nTraining set: {len(X_train)} rows ({len(X_train)/len(df)*100:.1f}%)")
-print(f"Testing set: {len(X_test)} rows ({len(X_test)/len(df)*100:.1f}%)")
 
-# Preprocessing: Convert boolean to int
-X_train['Fertilizer_Used'] = X_train['Fertilizer_Used'].astype(int)
-X_train['Irrigation_Used'] = X_train['Irrigation_Used'].astype(int)
-X_test['Fertilizer_Used'] = X_test['Fertilizer_Used'].astype(int)
-X_test['Irrigation_Used'] = X_test['Irrigation_Used'].astype(int)
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--input', default=DATASET_PATH,
+                        help='Raw dataset (dataset_800.csv format or Parquet)')
+    parser.add_argument('--test-fraction', type=float, default=0.2, help='Expected share of test rows')
+    parser.add_argument('--format', choices=SPLIT_FORMATS, default='parquet',
+                        help='Output format (csv writes the legacy X_train.csv etc.)')
+    parser.add_argument('--chunk-rows', type=int, default=100_000, help='Rows per streamed chunk')
+    args = parser.parse_args()
 
-# One-hot encode categorical columns in specific order to match training
-X_train_encoded = pd.get_dummies(X_train, columns=['Crop'], drop_first=True)
-X_train_encoded = pd.get_dummies(X_train_encoded, columns=['Soil_Type'], drop_first=True)
-X_train_encoded = pd.get_dummies(X_train_encoded, columns=['Weather_Condition'], drop_first=True)
+    if not os.path.exists(args.input):
+        print(f"❌ Dataset not found: {args.input}")
+        return 1
 
-X_test_encoded = pd.get_dummies(X_test, columns=['Crop'], drop_first=True)
-X_test_encoded = pd.get_dummies(X_test_encoded, columns=['Soil_Type'], drop_first=True)
-X_test_encoded = pd.get_dummies(X_test_encoded, columns=['Weather_Condition'], drop_first=True)
+    start = time.perf_counter()
+    manifest = write_splits(args.input, args.test_fraction, args.format, args.chunk_rows)
+    elapsed = time.perf_counter() - start
 
-# Align test data columns with train data
-for col in X_train_encoded.columns:
-    if col not in X_test_encoded.columns:
-        X_test_encoded[col] = 0
+    rows = manifest['rows']
+    total = rows['train'] + rows['test']
+    print(f"\nTraining set: {rows['train']:,} rows ({rows['train'] / max(total, 1) * 100:.1f}%)")
+    print(f"Testing set: {rows['test']:,} rows ({rows['test'] / max(total, 1) * 100:.1f}%)")
 
-for col in X_test_encoded.columns:
-    if col not in X_train_encoded.columns:
-        X_test_encoded.drop(col, axis=1, inplace=True)
+    if manifest['schema']['feature_order'] != ENCODED_FEATURE_COLUMNS:
+        print("⚠️ Encoded columns differ from ENCODED_FEATURE_COLUMNS (new or missing categories); "
+              "retrain the models before serving this split")
 
-# Expected column order from trained model
-expected_columns = [
-    'Rainfall_mm', 'Temperature_Celsius', 'Fertilizer_Used', 'Irrigation_Used', 'Days_to_Harvest',
-    'Crop_Cotton', 'Crop_Maize', 'Crop_Rice', 'Crop_Soybean', 'Crop_Wheat',
-    'Soil_Type_Clay', 'Soil_Type_Loam', 'Soil_Type_Peaty', 'Soil_Type_Sandy', 'Soil_Type_Silt',
-    'Weather_Condition_Rainy', 'Weather_Condition_Sunny'
-]
+    if any(os.path.exists(path) for path in MODEL_PATHS.values()):
+        print("⚠️ Rows are assigned by content hash, not by the train_test_split(random_state=42) the "
+              "published models may have been trained on, so some of their training rows can now be "
+              "test rows. Retrain them (scripts/train_models.py) before trusting test metrics; "
+              "refresh_metrics.py refuses to re-score models whose training manifest names another split.")
 
-# Reorder columns to match model expectations
-X_train_encoded = X_train_encoded[expected_columns]
-X_test_encoded = X_test_encoded[expected_columns]
+    print(f"\n✓ Split written in {elapsed:.1f}s:")
+    for name in manifest['files'].values():
+        print(f"  - data/{name}")
+    print("  - data/split_manifest.json")
+    return 0
 
-print(f"\nAfter encoding:")
-print(f"Training features: {X_train_encoded.shape[1]} columns")
-print(f"Testing features: {X_test_encoded.shape[1]} columns")
 
-# Save ke CSV (dengan encoding sudah diterapkan)
-X_train_encoded.to_csv('data/X_train.csv', index=False)
-X_test_encoded.to_csv('data/X_test.csv', index=False)
-y_train.to_csv('data/y_train.csv', index=False, header=True)
-y_test.to_csv('data/y_test.csv', index=False, header=True)
-
-print("\n✓ Dataset berhasil dibagi dan disimpan (one-hot encoded):")
-print("  - data/X_train.csv (640 rows)")
-print("  - data/X_test.csv (160 rows)")
-print("  - data/y_train.csv (640 rows)")
-print("  - data/y_test.csv (160 rows)")
+if __name__ == '__main__':
+    sys.exit(main())
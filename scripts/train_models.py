@@ -0,0 +1,130 @@
+"""
+Train and publish the Decision Tree and XGBoost models without Jupyter
+
+Runs the steps of notebooks/Final_Model_XGBoost.ipynb (cross-validation,
+hyperparameter search, final fit, evaluation, saving) on the split written by split_dataset.py.
+
+Usage:
+    python scripts/train_models.py --n-jobs 8
+    python scripts/train_models.py --resume
+    python scripts/train_models.py --search grid           # exact notebook grid search
+    python scripts/train_models.py --compare-grid --no-publish
+    python scripts/train_models.py --update data/harvest_2025.csv --update-rounds 50
+    python scripts/train_models.py --out-of-core data/history_*.parquet --batch-rows 500000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root and src to Python path
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from config.settings import TRAINING_MANIFEST_PATH
+from models.training import (
+    DEFAULT_TRAINING_CONFIG, SEARCH_METHODS, run_training, read_labeled_rows, update_xgboost,
+    train_xgboost_out_of_core
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--n-jobs', type=int, default=-1,
+                        help='Parallel workers for cross-validation, threads per search booster (-1 = all cores)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip stages finished by an interrupted run with the same data and config')
+    parser.add_argument('--seed', type=int, default=DEFAULT_TRAINING_CONFIG['random_state'],
+                        help='Random state for folds and estimators')
+    parser.add_argument('--cv-folds', type=int, default=DEFAULT_TRAINING_CONFIG['cv_folds'],
+                        help='Folds for the baseline cross-validation')
+    parser.add_argument('--search-folds', type=int, default=DEFAULT_TRAINING_CONFIG['search_cv_folds'],
+                        help='Folds for the hyperparameter search')
+    parser.add_argument('--search', choices=SEARCH_METHODS, default=DEFAULT_TRAINING_CONFIG['search'],
+                        help='Successive halving with early stopping, or the exhaustive grid')
+    parser.add_argument('--halving-factor', type=int, default=DEFAULT_TRAINING_CONFIG['halving_factor'],
+                        help='Keep 1/factor of the configurations after each halving rung')
+    parser.add_argument('--compare-grid', action='store_true',
+                        help='Also run the exhaustive grid and report the measured speedup')
+    parser.add_argument('--no-publish', action='store_true',
+                        help='Stop after evaluation; leave published models untouched')
+    parser.add_argument('--update', metavar='NEW_ROWS',
+                        help='Continue boosting the published XGBoost model on these labeled rows '
+                             '(dataset CSV or Parquet) instead of retraining')
+    parser.add_argument('--update-rounds', type=int, default=50, help='Boosting rounds added by --update')
+    parser.add_argument('--holdout-fraction', type=float, default=0.2,
+                        help='Newest share of the update rows held out for the regression check')
+    parser.add_argument('--tolerance', type=float, default=0.0,
+                        help='Allowed relative holdout RMSE increase before an --update or --out-of-core '
+                             'model is rejected')
+    parser.add_argument('--out-of-core', nargs='+', metavar='DATA',
+                        help='Train XGBoost from scratch on these raw dataset files (CSV or Parquet), '
+                             'streamed from disk through XGBoost external memory')
+    parser.add_argument('--rounds', type=int,
+                        help='Boosting rounds for --out-of-core (default: published n_estimators)')
+    parser.add_argument('--batch-rows', type=int, help='Rows per streamed batch for --out-of-core')
+    args = parser.parse_args()
+
+    if args.update:
+        return _update(args)
+    if args.out_of_core:
+        return _out_of_core(args)
+
+    config = {
+        'random_state': args.seed,
+        'cv_folds': args.cv_folds,
+        'search_cv_folds': args.search_folds,
+        'search': args.search,
+        'halving_factor': args.halving_factor,
+    }
+
+    start = time.perf_counter()
+    try:
+        manifest = run_training(config, n_jobs=args.n_jobs, resume=args.resume,
+                                publish=not args.no_publish, compare_grid=args.compare_grid)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"\n✓ Training finished in {time.perf_counter() - start:.1f}s")
+    for stage, seconds in manifest['timings_s'].items():
+        print(f"  - {stage:<15} {seconds:>8.1f}s")
+    if not args.no_publish:
+        print(f"  - {os.path.relpath(TRAINING_MANIFEST_PATH)}")
+    return 0
+
+
+def _update(args) -> int:
+    """Run an incremental XGBoost update"""
+    try:
+        new_rows = read_labeled_rows(args.update)
+        print(f"Updating XGBoost with {len(new_rows):,} rows from {args.update}")
+        record = update_xgboost(new_rows, rounds=args.update_rounds, holdout_fraction=args.holdout_fraction,
+                                tolerance=args.tolerance, publish=not args.no_publish, n_jobs=args.n_jobs)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"\n✓ Update finished in {record['seconds']:.1f}s "
+          f"({'published' if record['published'] else 'not published'})")
+    return 0 if record['accepted'] else 2
+
+
+def _out_of_core(args) -> int:
+    """Run out-of-core XGBoost training"""
+    missing = [path for path in args.out_of_core if not os.path.exists(path)]
+    if missing:
+        print(f"❌ Data files not found: {', '.join(missing)}")
+        return 1
+
+    print(f"Training XGBoost out of core on {len(args.out_of_core)} file(s)")
+    record = train_xgboost_out_of_core(args.out_of_core, rounds=args.rounds, batch_rows=args.batch_rows,
+                                       tolerance=args.tolerance, publish=not args.no_publish, n_jobs=args.n_jobs)
+    print(f"\n✓ {record['rows']:,} rows trained in {record['sketch_seconds'] + record['train_seconds']:.1f}s "
+          f"({'published' if record['published'] else 'not published'})")
+    return 0 if record['accepted'] else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,18 +8,11 @@ sys.path.insert(0, str(project_root))
 
 import streamlit as st
 
-from config.settings import APP_TITLE, APP_ICON, APP_LAYOUT, PAGES
+from config.settings import APP_TITLE, APP_ICON, APP_LAYOUT, PAGES, HIDDEN_PAGES
 from utils.styling import apply_custom_css
 from components.sidebar import render_sidebar
-from views import (
-    home,
-    single_prediction,
-    model_performance,
-    shap_analysis,
-    data_visualization,
-    batch_prediction,
-    model_comparison,
-)
+from utils.instrumentation import span
+from views import load_view
 
 
 def main() -> None:
@@ -42,21 +35,13 @@ def main() -> None:
     # Sidebar navigation
     selected_page = render_sidebar()
 
-    # Route to the chosen view
-    if selected_page == PAGES["home"]:
-        home.render()
-    elif selected_page == PAGES["prediction"]:
-        single_prediction.render()
-    elif selected_page == PAGES["performance"]:
-        model_performance.render()
-    elif selected_page == PAGES["shap"]:
-        shap_analysis.render()
-    elif selected_page == PAGES["visualization"]:
-        data_visualization.render()
-    elif selected_page == PAGES["batch"]:
-        batch_prediction.render()
-    elif selected_page == PAGES["comparison"]:
-        model_comparison.render()
+    # Route to the chosen view, importing it on first use
+    page_keys = {label: key for key, label in {**PAGES, **HIDDEN_PAGES}.items()}
+    if selected_page in page_keys:
+        page_key = page_keys[selected_page]
+        view = load_view(page_key)
+        with span(f"view.{page_key}"):
+            view.render()
 
 
 if __name__ == "__main__":
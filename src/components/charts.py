@@ -0,0 +1,173 @@
+"""
+Chart traces with bounded payloads
+
+Histograms and box plots are summarized in NumPy, so the figure carries
+bin counts and quartiles instead of every row. Scatter traces are drawn
+with WebGL; above CHART_MAX_POINTS rows they are thinned by a uniform
+sample (which keeps the point density) plus one point from every occupied
+grid cell (which keeps sparse regions and outliers visible).
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from config.settings import CHART_MAX_POINTS
+
+
+DOWNSAMPLE_GRID = 32
+
+
+def _cells(values: np.ndarray, grid: int) -> np.ndarray:
+    """Grid column of every value over the value range"""
+    low, high = np.nanmin(values), np.nanmax(values)
+    if high <= low:
+        return np.zeros(len(values), dtype=int)
+    return np.clip(((values - low) / (high - low) * grid).astype(int), 0, grid - 1)
+
+
+def downsample_index(x, y, max_points: int = CHART_MAX_POINTS, grid: int = DOWNSAMPLE_GRID,
+                     seed: int = 0) -> np.ndarray:
+    """
+    Rows to draw of a scatter, at most max_points + grid² of them
+
+    Args:
+        x: X values
+        y: Y values
+        max_points: Rows drawn as they are up to this many
+        grid: Cells per axis that keep at least one point each
+        seed: Sampling seed, fixed so reruns draw the same points
+
+    Returns:
+        Sorted row positions
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+
+    rng = np.random.default_rng(seed)
+    keep = np.zeros(n, dtype=bool)
+    keep[rng.choice(n, max_points, replace=False)] = True
+
+    order = rng.permutation(n)
+    cells = (_cells(x, grid) * grid + _cells(y, grid))[order]
+    _, first = np.unique(cells, return_index=True)
+    keep[order[first]] = True
+    return np.flatnonzero(keep)
+
+
+def _take(value, index: np.ndarray, n: int):
+    """Subset per-row arrays (colors, sizes, labels) and pass scalars through"""
+    if isinstance(value, (list, tuple, np.ndarray, pd.Series, pd.Index)) and len(value) == n:
+        return np.asarray(value)[index]
+    return value
+
+
+def scatter_trace(x, y, max_points: int = CHART_MAX_POINTS, **kwargs) -> go.Scattergl:
+    """
+    WebGL scatter trace, downsampled above max_points rows
+
+    Per-row 'text', 'customdata' and marker 'color'/'size' arrays are
+    subset along with the points.
+
+    Args:
+        x: X values
+        y: Y values
+        max_points: Row threshold for downsampling
+        **kwargs: go.Scattergl properties
+
+    Returns:
+        go.Scattergl trace
+    """
+    x, y = np.asarray(x).ravel(), np.asarray(y).ravel()
+    index = downsample_index(x, y, max_points)
+    for key in ('text', 'customdata', 'hovertext'):
+        if key in kwargs:
+            kwargs[key] = _take(kwargs[key], index, len(x))
+    if isinstance(kwargs.get('marker'), dict):
+        kwargs['marker'] = {key: _take(value, index, len(x)) for key, value in kwargs['marker'].items()}
+    kwargs.setdefault('mode', 'markers')
+    return go.Scattergl(x=x[index], y=y[index], **kwargs)
+
+
+def binned_histogram_trace(edges, counts, **kwargs) -> go.Bar:
+    """
+    Histogram of already-binned counts, drawn as adjacent bars
+
+    Args:
+        edges: Bin edges (one more than counts)
+        counts: Count per bin
+        **kwargs: go.Bar properties (marker, name, ...)
+
+    Returns:
+        go.Bar trace with one bar per bin
+    """
+    edges = np.asarray(edges, dtype=float)
+    kwargs.setdefault('hovertemplate', '%{customdata[0]:.2f} to %{customdata[1]:.2f}<br>Count: %{y}<extra></extra>')
+    return go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=np.asarray(counts), width=np.diff(edges),
+                  customdata=np.column_stack([edges[:-1], edges[1:]]), **kwargs)
+
+
+def histogram_trace(values, nbins: int = 30, **kwargs) -> go.Bar:
+    """
+    Histogram pre-binned with NumPy, drawn as adjacent bars
+
+    Args:
+        values: Values to bin (NaN and inf are skipped)
+        nbins: Number of equal-width bins
+        **kwargs: go.Bar properties (marker, name, ...)
+
+    Returns:
+        go.Bar trace with one bar per bin
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=nbins)
+    return binned_histogram_trace(edges, counts, **kwargs)
+
+
+def box_stats_trace(stats: dict, name: str = '', **kwargs) -> go.Box:
+    """
+    Box plot from precomputed statistics
+
+    Args:
+        stats: Dict with q1, median, q3, lowerfence, upperfence and mean
+        name: Box label
+        **kwargs: go.Box properties (marker, ...)
+
+    Returns:
+        go.Box trace
+    """
+    return go.Box(x=[name], name=name, boxpoints=False, **{key: [value] for key, value in stats.items()}, **kwargs)
+
+
+def box_trace(values, name: str = '', **kwargs) -> go.Box:
+    """
+    Box plot from precomputed quartiles and Tukey fences
+
+    Outlier points are not drawn; the whiskers end at the most extreme
+    values within 1.5 IQR of the box.
+
+    Args:
+        values: Values to summarize (NaN and inf are skipped)
+        name: Box label
+        **kwargs: go.Box properties (marker, ...)
+
+    Returns:
+        go.Box trace
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    values = values[np.isfinite(values)]
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    return box_stats_trace({
+        'q1': q1, 'median': median, 'q3': q3,
+        'lowerfence': values[values >= q1 - 1.5 * iqr].min(),
+        'upperfence': values[values <= q3 + 1.5 * iqr].max(),
+        'mean': values.mean(),
+    }, name, **kwargs)
+
+
+def points_note(trace, total: int) -> str:
+    """Title suffix saying how many of total points a downsampled trace shows"""
+    shown = len(trace.x)
+    return f" ({shown:,} of {total:,} points)" if shown < total else ""
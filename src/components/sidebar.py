@@ -11,44 +11,47 @@ sys.path.insert(0, str(project_root))
 
 import streamlit as st
 from datetime import datetime
-from models.model_loader import load_models
-from models.data_loader import get_best_model
-from config.settings import PAGES
+from models.status import get_status
+from config.settings import PAGES, HIDDEN_PAGES
+from utils.instrumentation import is_enabled
 
 
 def render_sidebar():
     """Render the enhanced sidebar with navigation"""
     
     # Logo and branding
+    # Classes are styled by the theme bundle (config.theme.SIDEBAR_CSS)
     st.sidebar.markdown("""
-    <div style='text-align: center; padding: 1.4rem 0; border: 1px solid rgba(255,255,255,0.06);
-                border-radius: 16px; background: rgba(255,255,255,0.04);
-                backdrop-filter: blur(12px); box-shadow: 0 16px 40px rgba(0,0,0,0.25);'>
-        <h1 style='color: #93c5fd; margin: 0; font-size: 2.4rem;'>🌾</h1>
-        <h2 style='background: linear-gradient(135deg, #60a5fa 0%, #a78bfa 100%);
-                   -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-                   margin: 0.35rem 0; font-size: 1.4rem; font-weight: 800;'>CropYield AI</h2>
-        <p style='color: #cbd5e1; font-size: 0.92rem; margin: 0;'>Production ML Platform</p>
+    <div class='sidebar-brand'>
+        <h1>🌾</h1>
+        <h2>CropYield AI</h2>
+        <p>Production ML Platform</p>
     </div>
     """, unsafe_allow_html=True)
     
     st.sidebar.markdown("---")
     
     # Navigation with query params routing
-    page_list = list(PAGES.values())
+    all_pages = {**PAGES, **HIDDEN_PAGES}
     
     # Get current page from query params or session state
     query_params = st.query_params
     if 'page' in query_params:
         current_page = query_params['page']
-        # Find matching page in PAGES
-        for key, value in PAGES.items():
+        # Find matching page in PAGES (hidden pages can be opened directly)
+        for key, value in all_pages.items():
             if key == current_page or value == current_page:
                 st.session_state['selected_page'] = value
                 break
     elif 'selected_page' not in st.session_state:
         st.session_state['selected_page'] = PAGES['home']
     
+    # Hidden pages are listed while instrumentation is on or while they are open
+    page_list = list(PAGES.values()) + [
+        value for value in HIDDEN_PAGES.values()
+        if is_enabled() or value == st.session_state['selected_page']
+    ]
+    
     # Get the current index
     try:
         current_index = page_list.index(st.session_state['selected_page'])
@@ -68,7 +71,7 @@ def render_sidebar():
         st.session_state['selected_page'] = selected_page
         # Find page key for query param
         page_key = 'home'
-        for key, value in PAGES.items():
+        for key, value in all_pages.items():
             if value == selected_page:
                 page_key = key
                 break
@@ -79,39 +82,32 @@ def render_sidebar():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📊 System Status")
     
-    models = load_models()
+    # Metadata only: models are loaded by the pages that predict
+    status = get_status()
     
-    if models:
+    if status['available']:
         st.sidebar.markdown(f"""
-        <div style='background: linear-gradient(135deg, rgba(16,185,129,0.18) 0%, rgba(16,185,129,0.08) 100%);
-                padding: 1rem; border-radius: 14px; margin: 0.5rem 0;
-                border: 1px solid rgba(16,185,129,0.35); backdrop-filter: blur(10px);
-                color: #ecfdf3; box-shadow: 0 12px 32px rgba(16,185,129,0.18);'>
-            <div style='font-size: 1.4rem; text-align: center;'>✓</div>
-            <div style='text-align: center; font-weight: 700;'>System Ready</div>
-            <div style='text-align: center; font-size: 0.92rem;'>{len(models)} Models Active</div>
+        <div class='status-card status-card--ready'>
+            <div class='status-card__icon'>✓</div>
+            <div class='status-card__title'>System Ready</div>
+            <div class='status-card__detail'>{status['available']} Models Active</div>
         </div>
         """, unsafe_allow_html=True)
         
-        best_model = get_best_model()
+        best_model = status['best_model']
         if best_model:
             st.sidebar.markdown(f"""
-            <div style='background: linear-gradient(135deg, rgba(245,158,11,0.2) 0%, rgba(245,158,11,0.08) 100%);
-                        padding: 0.85rem; border-radius: 14px; margin: 0.5rem 0;
-                        border: 1px solid rgba(245,158,11,0.35); backdrop-filter: blur(10px);
-                        color: #fef3c7;'>
-                <div style='font-size: 0.85rem;'>Best Model</div>
-                <div style='font-weight: 700; font-size: 1.05rem;'>🏆 {best_model}</div>
+            <div class='status-card status-card--best'>
+                <div class='status-card__label'>Best Model</div>
+                <div class='status-card__value'>🏆 {best_model}</div>
+                <div class='status-card__meta'>R² {status['best_r2']:.4f} · v{status['models'][best_model]['version'][:7]}</div>
             </div>
             """, unsafe_allow_html=True)
     else:
         st.sidebar.markdown("""
-        <div style='background: linear-gradient(135deg, rgba(239,68,68,0.18) 0%, rgba(239,68,68,0.08) 100%);
-                    padding: 1rem; border-radius: 14px; margin: 0.5rem 0;
-                    border: 1px solid rgba(239,68,68,0.35); backdrop-filter: blur(10px);
-                    color: #fee2e2;'>
-            <div style='font-size: 1.4rem; text-align: center;'>⚠</div>
-            <div style='text-align: center; font-weight: 700;'>No Models Loaded</div>
+        <div class='status-card status-card--missing'>
+            <div class='status-card__icon'>⚠</div>
+            <div class='status-card__title'>No Models Found</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -119,12 +115,12 @@ def render_sidebar():
     
     # Footer
     st.sidebar.markdown(f"""
-    <div style='text-align: center; padding: 1rem 0; color: #cbd5e1;'>
-        <div style='font-size: 0.9rem; margin-bottom: 0.5rem; color: #e5e7eb;'>👥 <strong>ML Team</strong></div>
-        <div style='font-size: 0.82rem;'>📅 Updated: {datetime.now().strftime('%Y-%m-%d')}</div>
-        <div style='margin-top: 1rem;'>
-            <a href='https://github.com' target='_blank' style='color: #a5b4fc; text-decoration: none; margin: 0 0.5rem; font-weight: 600;'>📚 Docs</a>
-            <a href='https://github.com' target='_blank' style='color: #a5b4fc; text-decoration: none; margin: 0 0.5rem; font-weight: 600;'>💻 GitHub</a>
+    <div class='sidebar-footer'>
+        <div class='sidebar-footer__team'>👥 <strong>ML Team</strong></div>
+        <div class='sidebar-footer__date'>📅 Updated: {datetime.now().strftime('%Y-%m-%d')}</div>
+        <div class='sidebar-footer__links'>
+            <a href='https://github.com' target='_blank'>📚 Docs</a>
+            <a href='https://github.com' target='_blank'>💻 GitHub</a>
         </div>
     </div>
     """, unsafe_allow_html=True)
@@ -0,0 +1,132 @@
+"""
+Paginated tables
+
+The full DataFrame stays on the server and only the requested page is
+sent to the browser. Filtering and sorting run in pandas/NumPy; the row
+positions they select are kept in session state until the settings
+change, so paging through them does not redo that work.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from config.settings import TABLE_PAGE_SIZES
+
+
+NO_FILTER = '(no filter)'
+NO_SORT = '(original order)'
+MAX_FILTER_CHOICES = 100
+
+
+def filter_mask(series: pd.Series, value) -> np.ndarray:
+    """
+    Rows of a column matching a filter value
+
+    Args:
+        series: Column to filter
+        value: (low, high) range for numeric columns, a list of allowed
+            values, or a substring to search for
+
+    Returns:
+        Boolean mask over the column
+    """
+    if isinstance(value, tuple):
+        return series.between(*value).to_numpy()
+    if isinstance(value, list):
+        return series.isin(value).to_numpy()
+    return series.astype(str).str.contains(value, case=False, regex=False).to_numpy()
+
+
+def select_rows(df: pd.DataFrame, filter_column=None, filter_value=None, sort_by=None,
+                descending: bool = False) -> np.ndarray:
+    """
+    Row positions after filtering and sorting
+
+    Args:
+        df: Table
+        filter_column: Column to filter on, or None
+        filter_value: Filter value (see filter_mask)
+        sort_by: Column to sort by, or None to keep the original order
+        descending: Sort direction
+
+    Returns:
+        Row positions into df, in display order
+    """
+    positions = np.arange(len(df))
+    if filter_column is not None and filter_value not in (None, '', []):
+        positions = positions[filter_mask(df[filter_column], filter_value)]
+    if sort_by is not None:
+        values = df[sort_by].iloc[positions].reset_index(drop=True)
+        order = values.sort_values(ascending=not descending, kind='stable', na_position='last').index
+        positions = positions[np.asarray(order)]
+    return positions
+
+
+def _filter_widget(series: pd.Series, key: str):
+    """Range slider, value picker or text search, depending on the column"""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        low, high = float(series.min()), float(series.max())
+        if low < high:
+            return st.slider("Range", low, high, (low, high), key=f"{key}_range")
+        return None
+    choices = series.drop_duplicates()
+    if len(choices) <= MAX_FILTER_CHOICES:
+        return st.multiselect("Values", choices.tolist(), key=f"{key}_values")
+    return st.text_input("Contains", key=f"{key}_contains")
+
+
+@st.fragment
+def paginated_table(df: pd.DataFrame, key: str):
+    """
+    Filterable, sortable table that sends one page at a time
+
+    Runs as a fragment: paging, sorting and filtering rerun only the table.
+
+    Args:
+        df: Full table, kept server-side
+        key: Unique prefix for the widget and cache keys
+    """
+    columns = list(df.columns)
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+    with col1:
+        filter_column = st.selectbox("Filter", [NO_FILTER] + columns, key=f"{key}_filter")
+    with col2:
+        filter_value = None
+        if filter_column != NO_FILTER:
+            filter_value = _filter_widget(df[filter_column], f"{key}_{filter_column}")
+    with col3:
+        sort_by = st.selectbox("Sort by", [NO_SORT] + columns, key=f"{key}_sort")
+    with col4:
+        descending = st.toggle("Descending", key=f"{key}_desc", disabled=sort_by == NO_SORT)
+
+    # Positions are recomputed only when the data or the settings change
+    signature = (id(df), len(df), filter_column, repr(filter_value), sort_by, descending)
+    cached = st.session_state.get(f"{key}_rows")
+    if cached is None or cached[0] != signature:
+        positions = select_rows(df, None if filter_column == NO_FILTER else filter_column, filter_value,
+                                None if sort_by == NO_SORT else sort_by, descending)
+        st.session_state[f"{key}_rows"] = (signature, positions)
+        st.session_state[f"{key}_page"] = 1
+    else:
+        positions = cached[1]
+
+    total = len(positions)
+    page_size = st.session_state.get(f"{key}_size", TABLE_PAGE_SIZES[0])
+    pages = max(1, -(-total // page_size))
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+
+    start = (st.session_state.get(f"{key}_page", 1) - 1) * page_size
+    st.dataframe(df.iloc[positions[start:start + page_size]], use_container_width=True)
+
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        filtered = f" (filtered from {len(df):,})" if total < len(df) else ""
+        if total:
+            st.caption(f"Rows {start + 1:,}–{min(start + page_size, total):,} of {total:,}{filtered}")
+        else:
+            st.caption(f"No matching rows{filtered}")
+    with col2:
+        st.number_input("Page", 1, pages, key=f"{key}_page")
+    with col3:
+        st.selectbox("Rows per page", TABLE_PAGE_SIZES, key=f"{key}_size")
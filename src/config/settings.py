@@ -2,6 +2,7 @@
 Configuration settings for the Crop Yield Prediction System
 """
 import os
+import tempfile
 
 # Paths
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -14,6 +15,8 @@ X_TRAIN_PATH = os.path.join(DATA_DIR, 'X_train.csv')
 X_TEST_PATH = os.path.join(DATA_DIR, 'X_test.csv')
 Y_TRAIN_PATH = os.path.join(DATA_DIR, 'y_train.csv')
 Y_TEST_PATH = os.path.join(DATA_DIR, 'y_test.csv')
+# Written by split_dataset.py: feature schema, row counts and hash rule of the current split
+SPLIT_MANIFEST_PATH = os.path.join(DATA_DIR, 'split_manifest.json')
 
 # Model paths (only Decision Tree and XGBoost)
 MODEL_PATHS = {
@@ -22,6 +25,30 @@ MODEL_PATHS = {
 }
 
 METRICS_PATH = os.path.join(MODEL_DIR, 'model_comparison.csv')
+METRICS_CACHE_PATH = os.path.join(MODEL_DIR, 'metrics_cache.json')
+BENCHMARK_CACHE_PATH = os.path.join(MODEL_DIR, 'benchmark_cache.json')
+
+# Encoded feature layout published with the models
+FEATURE_SCHEMA_PATH = os.path.join(MODEL_DIR, 'feature_schema.json')
+
+# Training pipeline (scripts/train_models.py)
+TRAINING_RUN_DIR = os.path.join(MODEL_DIR, 'training_run')
+TRAINING_MANIFEST_PATH = os.path.join(MODEL_DIR, 'training_manifest.json')
+
+# Compressed XGBoost model (scripts/compress_model.py)
+COMPRESSED_MODEL_PATH = os.path.join(MODEL_DIR, 'xgboost_model.compressed.json')
+COMPRESSION_REPORT_PATH = os.path.join(MODEL_DIR, 'compression_report.json')
+
+# Distilled surrogate of the XGBoost model for fast previews (scripts/distill_surrogate.py)
+SURROGATE_MODEL_PATH = os.path.join(MODEL_DIR, 'surrogate_tree.pkl')
+SURROGATE_REPORT_PATH = os.path.join(MODEL_DIR, 'surrogate_report.json')
+
+# Cross-validation out-of-fold predictions and fold report
+CV_PREDICTIONS_PATH = os.path.join(MODEL_DIR, 'cv_predictions.parquet')
+CV_REPORT_PATH = os.path.join(MODEL_DIR, 'cv_report.json')
+
+# Precomputed EDA statistics of the dataset (scripts/build_eda_summary.py, or built on first use)
+EDA_SUMMARY_PATH = os.path.join(DATA_DIR, 'eda_summary.json')
 
 # App configuration
 APP_TITLE = "Crop Yield Prediction System"
@@ -40,6 +67,17 @@ FEATURE_NAMES = [
     'Fertilizer_Used', 'Irrigation_Used', 'Weather_Condition', 'Days_to_Harvest'
 ]
 
+# Target column
+TARGET_COL = 'Yield_tons_per_hectare'
+
+# One-hot encoded column order expected by the trained models
+ENCODED_FEATURE_COLUMNS = [
+    'Rainfall_mm', 'Temperature_Celsius', 'Fertilizer_Used', 'Irrigation_Used', 'Days_to_Harvest',
+    'Crop_Cotton', 'Crop_Maize', 'Crop_Rice', 'Crop_Soybean', 'Crop_Wheat',
+    'Soil_Type_Clay', 'Soil_Type_Loam', 'Soil_Type_Peaty', 'Soil_Type_Sandy', 'Soil_Type_Silt',
+    'Weather_Condition_Rainy', 'Weather_Condition_Sunny'
+]
+
 # Page names
 PAGES = {
     'home': '🏠 Home',
@@ -50,3 +88,42 @@ PAGES = {
     'batch': '🤖 Batch Prediction',
     'comparison': '⚖️ Model Comparison'
 }
+
+# Pages reachable only via ?page=<key> or when instrumentation is enabled
+HIDDEN_PAGES = {
+    'diagnostics': '🩺 Diagnostics'
+}
+
+# Sidebar status snapshot refresh interval (0 disables the background refresher)
+STATUS_REFRESH_SECONDS = float(os.environ.get('CROPYIELD_STATUS_REFRESH', '30'))
+
+# Charts: scatter points sent to the browser before downsampling kicks in
+CHART_MAX_POINTS = int(os.environ.get('CROPYIELD_CHART_MAX_POINTS', '5000'))
+
+# Paginated result tables: page size choices (the first is the default)
+TABLE_PAGE_SIZES = [20, 50, 100, 500]
+
+# Batch prediction results kept on disk for downloads (removed after RESULTS_TTL_HOURS)
+RESULTS_DIR = os.environ.get('CROPYIELD_RESULTS_DIR', os.path.join(tempfile.gettempdir(), 'cropyield_results'))
+RESULTS_TTL_HOURS = float(os.environ.get('CROPYIELD_RESULTS_TTL_HOURS', '24'))
+EXPORT_CHUNK_ROWS = 100_000
+# Streamlit holds a download in memory while serving it, so larger results are only kept on disk
+DOWNLOAD_MAX_ROWS = int(os.environ.get('CROPYIELD_DOWNLOAD_MAX_ROWS', '1000000'))
+
+# Warm-up of new server processes (scripts/serve.py); comma-separated, empty to skip
+WARMUP_MODELS = [m for m in os.environ.get('CROPYIELD_WARMUP_MODELS', ','.join(MODEL_PATHS)).split(',') if m]
+WARMUP_DATA = [d for d in os.environ.get('CROPYIELD_WARMUP_DATA', 'dataset,eda,splits').split(',') if d]
+WARMUP_VIEWS = [v for v in os.environ.get('CROPYIELD_WARMUP_VIEWS', 'home,prediction,batch').split(',') if v]
+WARMUP_SHAP = os.environ.get('CROPYIELD_WARMUP_SHAP', '0').lower() in ('1', 'true', 'yes')
+# Readiness endpoint for load balancers (GET /ready: 200 when warm, else 503)
+HEALTH_PORT = int(os.environ.get('CROPYIELD_HEALTH_PORT', '8502'))
+
+# Startup import budget (scripts/check_startup.py)
+STARTUP_IMPORT_BUDGET_MS = int(os.environ.get('CROPYIELD_STARTUP_BUDGET_MS', '1500'))
+# Heavy packages only the pages that need them may import
+STARTUP_DEFERRED_MODULES = ['shap', 'matplotlib', 'xgboost', 'sklearn', 'scipy']
+
+# Hot-path timing instrumentation (CROPYIELD_PROFILE=1 to enable at startup)
+INSTRUMENTATION_ENABLED = os.environ.get('CROPYIELD_PROFILE', '0').lower() in ('1', 'true', 'yes')
+INSTRUMENTATION_BUFFER_SIZE = int(os.environ.get('CROPYIELD_PROFILE_BUFFER', '2000'))
+INSTRUMENTATION_EXPORT_PATH = os.environ.get('CROPYIELD_PROFILE_EXPORT') or None
@@ -495,3 +495,242 @@ def get_custom_css():
     }
 
     return css_template.substitute(values)
+
+
+# Home page styles (bundled with the theme, see utils.styling)
+HOME_CSS = """
+    .home-shell {
+        max-width: 1180px;
+        margin: 0 auto;
+        display: flex;
+        flex-direction: column;
+        gap: 32px;
+    }
+    .section-spacing { margin: 2.25rem 0 0; }
+    .hero-banner {
+        position: relative;
+        overflow: hidden;
+        display: grid;
+        grid-template-columns: 1fr;
+        gap: 24px;
+        padding: clamp(24px, 3vw, 36px);
+        border-radius: 24px;
+        background: linear-gradient(135deg, rgba(11,18,32,0.9) 0%, rgba(11,18,32,0.75) 55%, rgba(20,30,48,0.78) 100%);
+        border: 1px solid rgba(255, 255, 255, 0.08);
+        box-shadow: 0 30px 80px rgba(0,0,0,0.45);
+        isolation: isolate;
+        backdrop-filter: blur(18px) saturate(125%);
+    }
+    .hero-banner::before {
+        content: '';
+        position: absolute;
+        inset: 0;
+        background: radial-gradient(circle at 20% 20%, rgba(96,165,250,0.22), transparent 42%),
+                    radial-gradient(circle at 80% 15%, rgba(167,139,250,0.24), transparent 40%),
+                    radial-gradient(circle at 62% 75%, rgba(34,211,238,0.2), transparent 34%);
+        opacity: 1;
+        z-index: 0;
+    }
+    .hero-banner::after {
+        content: '';
+        position: absolute;
+        inset: 0;
+        background: linear-gradient(120deg, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.02) 55%, rgba(255,255,255,0) 100%);
+        z-index: 0;
+    }
+    .hero-content { position: relative; z-index: 1; }
+    .hero__eyebrow {
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+        padding: 8px 12px;
+        border-radius: 999px;
+        background: rgba(96, 165, 250, 0.14);
+        color: #e0f2fe;
+        font-size: 0.95rem;
+        font-weight: 700;
+        border: 1px solid rgba(255,255,255,0.15);
+        backdrop-filter: blur(12px);
+    }
+    .hero__title {
+        margin: 16px 0 10px;
+        font-size: 3rem;
+        font-weight: 800;
+        letter-spacing: -0.03em;
+        background: linear-gradient(135deg, #93c5fd 0%, #a78bfa 40%, #22d3ee 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+    .hero__subtitle {
+        max-width: 820px;
+        color: #dbeafe;
+        font-size: 1.08rem;
+        line-height: 1.7;
+        margin-bottom: 18px;
+    }
+    .hero__actions {
+        display: flex;
+        align-items: center;
+        gap: 12px;
+        margin-top: 12px;
+        flex-wrap: wrap;
+    }
+    .hero-side { display: none; }
+    .btn {
+        padding: 12px 18px;
+        border-radius: 14px;
+        font-weight: 800;
+        text-decoration: none;
+        display: inline-flex;
+        align-items: center;
+        justify-content: center;
+        gap: 8px;
+        backdrop-filter: blur(14px);
+        -webkit-backdrop-filter: blur(14px);
+        border: 1px solid rgba(255, 255, 255, 0.18);
+        box-shadow: 0 18px 48px rgba(0, 0, 0, 0.32);
+        transition: transform 0.2s ease, box-shadow 0.2s ease, background 0.2s ease, border-color 0.2s ease;
+        letter-spacing: 0.01em;
+    }
+    .btn-primary {
+        background: linear-gradient(120deg, rgba(37, 99, 235, 0.92) 0%, rgba(124, 58, 237, 0.92) 100%);
+        color: #fff;
+        box-shadow: 0 22px 55px rgba(124, 58, 237, 0.35);
+    }
+    .btn-primary:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 26px 65px rgba(124, 58, 237, 0.42);
+        border-color: rgba(255, 255, 255, 0.3);
+    }
+    .btn-ghost {
+        background: rgba(255, 255, 255, 0.08);
+        color: #e2e8f0;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+    }
+    .btn-ghost:hover {
+        transform: translateY(-2px);
+        background: rgba(255, 255, 255, 0.12);
+        border-color: rgba(255, 255, 255, 0.32);
+    }
+    .stat-card {
+        background: rgba(15,23,42,0.78);
+        border: 1px solid rgba(255, 255, 255, 0.08);
+        border-radius: 16px;
+        padding: 16px 18px;
+        box-shadow: 0 18px 42px rgba(0, 0, 0, 0.32);
+        backdrop-filter: blur(12px);
+    }
+    .stats-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+        gap: 14px;
+        align-items: stretch;
+    }
+    .stat-label { color: #9ca3af; font-size: 0.95rem; }
+    .stat-value { color: #e5e7eb; font-size: 1.85rem; font-weight: 800; margin-top: 6px; }
+    .stat-sub { color: #93c5fd; font-size: 0.95rem; font-weight: 700; }
+    .section-card {
+        background: rgba(15,23,42,0.8);
+        border: 1px solid rgba(255, 255, 255, 0.08);
+        border-radius: 18px;
+        padding: 20px;
+        box-shadow: 0 18px 48px rgba(0, 0, 0, 0.3);
+        backdrop-filter: blur(12px);
+    }
+    .section-card h3 { color: #e5e7eb; }
+    .section-card p { color: #cbd5e1; }
+    .pill-rail { display: flex; gap: 10px; flex-wrap: wrap; }
+    .pill {
+        padding: 10px 14px;
+        border-radius: 999px;
+        background: rgba(255,255,255,0.06);
+        border: 1px solid rgba(255,255,255,0.1);
+        color: #e5e7eb;
+        font-weight: 700;
+        font-size: 0.95rem;
+        backdrop-filter: blur(10px);
+    }
+    .rail {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
+        gap: 16px;
+    }
+    .rail-card {
+        background: linear-gradient(145deg, rgba(255,255,255,0.05), rgba(255,255,255,0.02));
+        border: 1px solid rgba(255,255,255,0.08);
+        border-radius: 16px;
+        padding: 16px;
+        color: #e5e7eb;
+        box-shadow: 0 16px 44px rgba(0,0,0,0.28);
+        backdrop-filter: blur(12px);
+    }
+    .rail-card h4 { margin: 0 0 8px; }
+    .rail-card p { margin: 0; color: #cbd5e1; font-size: 0.95rem; }
+    .workflow { display: grid; grid-template-columns: repeat(auto-fit, minmax(220px,1fr)); gap: 14px; }
+    .workflow-step {
+        border: 1px dashed rgba(255,255,255,0.14);
+        border-radius: 14px;
+        padding: 14px;
+        background: rgba(255,255,255,0.04);
+        color: #e5e7eb;
+        backdrop-filter: blur(10px);
+    }
+    .workflow-step strong { color: #93c5fd; }
+"""
+
+# Sidebar styles (bundled with the theme, see utils.styling)
+SIDEBAR_CSS = """
+    .sidebar-brand {
+        text-align: center;
+        padding: 1.4rem 0;
+        border: 1px solid rgba(255,255,255,0.06);
+        border-radius: 16px;
+        background: rgba(255,255,255,0.04);
+        backdrop-filter: blur(12px);
+        box-shadow: 0 16px 40px rgba(0,0,0,0.25);
+    }
+    .sidebar-brand h1 { color: #93c5fd; margin: 0; font-size: 2.4rem; }
+    .sidebar-brand h2 {
+        background: linear-gradient(135deg, #60a5fa 0%, #a78bfa 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin: 0.35rem 0;
+        font-size: 1.4rem;
+        font-weight: 800;
+    }
+    .sidebar-brand p { color: #cbd5e1; font-size: 0.92rem; margin: 0; }
+    .status-card {
+        padding: 1rem;
+        border-radius: 14px;
+        margin: 0.5rem 0;
+        backdrop-filter: blur(10px);
+    }
+    .status-card--ready {
+        background: linear-gradient(135deg, rgba(16,185,129,0.18) 0%, rgba(16,185,129,0.08) 100%);
+        border: 1px solid rgba(16,185,129,0.35);
+        color: #ecfdf3;
+        box-shadow: 0 12px 32px rgba(16,185,129,0.18);
+    }
+    .status-card--best {
+        padding: 0.85rem;
+        background: linear-gradient(135deg, rgba(245,158,11,0.2) 0%, rgba(245,158,11,0.08) 100%);
+        border: 1px solid rgba(245,158,11,0.35);
+        color: #fef3c7;
+    }
+    .status-card--missing {
+        background: linear-gradient(135deg, rgba(239,68,68,0.18) 0%, rgba(239,68,68,0.08) 100%);
+        border: 1px solid rgba(239,68,68,0.35);
+        color: #fee2e2;
+    }
+    .status-card__icon { font-size: 1.4rem; text-align: center; }
+    .status-card__title { text-align: center; font-weight: 700; }
+    .status-card__detail { text-align: center; font-size: 0.92rem; }
+    .status-card__label { font-size: 0.85rem; }
+    .status-card__value { font-weight: 700; font-size: 1.05rem; }
+    .status-card__meta { font-size: 0.8rem; }
+    .sidebar-footer { text-align: center; padding: 1rem 0; color: #cbd5e1; }
+    .sidebar-footer__team { font-size: 0.9rem; margin-bottom: 0.5rem; color: #e5e7eb; }
+    .sidebar-footer__date { font-size: 0.82rem; }
+    .sidebar-footer__links { margin-top: 1rem; }
+    .sidebar-footer__links a { color: #a5b4fc; text-decoration: none; margin: 0 0.5rem; font-weight: 600; }
+"""
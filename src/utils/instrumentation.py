@@ -0,0 +1,186 @@
+"""
+Lightweight hot-path timing instrumentation
+
+Spans are recorded into an in-process ring buffer and optionally appended
+to a JSON-lines file (CROPYIELD_PROFILE_EXPORT; the path is only taken
+from the environment). When disabled, ``timed`` wrappers and ``span``
+blocks do nothing beyond checking a flag.
+"""
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import (
+    INSTRUMENTATION_ENABLED, INSTRUMENTATION_BUFFER_SIZE, INSTRUMENTATION_EXPORT_PATH
+)
+
+
+class _State:
+    """Mutable instrumentation state shared by the whole process"""
+    enabled = INSTRUMENTATION_ENABLED
+    export_path = INSTRUMENTATION_EXPORT_PATH
+    export_error: Optional[str] = None
+
+
+_BUFFER: deque = deque(maxlen=INSTRUMENTATION_BUFFER_SIZE)
+_EXPORT_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+
+def is_enabled() -> bool:
+    """Whether spans are currently recorded"""
+    return _State.enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn recording on or off for this process"""
+    _State.enabled = bool(enabled)
+
+
+def get_export_path() -> Optional[str]:
+    """JSON-lines export path (None if unset or disabled after a write error)"""
+    return _State.export_path
+
+
+def get_export_error() -> Optional[str]:
+    """Why the export was disabled, if a write to it failed"""
+    return _State.export_error
+
+
+def row_count(result: Any) -> Optional[int]:
+    """
+    Best-effort row count of a loader or predictor result
+
+    Args:
+        result: Return value of an instrumented call
+
+    Returns:
+        Number of rows, or None if it can't be determined
+    """
+    if result is None:
+        return None
+    if hasattr(result, 'shape') and len(getattr(result, 'shape', ())) > 0:
+        return int(result.shape[0])
+    if isinstance(result, dict):
+        counts = [row_count(value) for value in result.values()]
+        counts = [count for count in counts if count is not None]
+        return max(counts) if counts else len(result)
+    return None
+
+
+def _record(name: str, start: float, duration: float, rows: Optional[int], parent: Optional[str]) -> None:
+    """Append a finished span to the ring buffer and the export file"""
+    record = {
+        'name': name,
+        'start': start,
+        'duration_ms': duration * 1000,
+        'rows': rows,
+        'parent': parent,
+        'thread': threading.current_thread().name,
+    }
+    _BUFFER.append(record)
+
+    path = _State.export_path
+    if path:
+        line = json.dumps(record) + '\n'
+        with _EXPORT_LOCK:
+            try:
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            except OSError as e:
+                # A bad export path must not break the instrumented loaders
+                _State.export_path = None
+                _State.export_error = f"{path}: {e}"
+
+
+def _stack() -> List[str]:
+    """Per-thread stack of open span names"""
+    stack = getattr(_LOCAL, 'stack', None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+class _SpanHandle:
+    """Lets a span body report its row count after the fact"""
+    __slots__ = ('rows',)
+
+    def __init__(self, rows: Optional[int]):
+        self.rows = rows
+
+
+@contextmanager
+def span(name: str, rows: Optional[int] = None):
+    """
+    Time a block of code
+
+    Usage:
+        with span('encode_upload', rows=len(df)) as s:
+            ...
+            s.rows = len(result)
+
+    Args:
+        name: Span name shown on the diagnostics page
+        rows: Rows processed by the block, if known up front
+    """
+    handle = _SpanHandle(rows)
+    if not _State.enabled:
+        yield handle
+        return
+
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    stack.append(name)
+    wall_start = time.time()
+    start = time.perf_counter()
+    try:
+        yield handle
+    finally:
+        duration = time.perf_counter() - start
+        stack.pop()
+        _record(name, wall_start, duration, handle.rows, parent)
+
+
+def timed(name: Optional[str] = None, rows: Callable[[Any], Optional[int]] = row_count):
+    """
+    Decorator recording the duration and result row count of every call
+
+    Args:
+        name: Span name; defaults to module.qualname of the function
+        rows: Function mapping the return value to a row count
+    """
+    def decorator(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return fn(*args, **kwargs)
+            with span(label) as handle:
+                result = fn(*args, **kwargs)
+                handle.rows = rows(result)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_records() -> List[Dict[str, Any]]:
+    """Snapshot of the ring buffer, oldest first"""
+    return list(_BUFFER)
+
+
+def clear_records() -> None:
+    """Empty the ring buffer"""
+    _BUFFER.clear()
+
+
+def records_as_jsonl(records: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Serialize records (default: the whole buffer) as JSON lines"""
+    records = get_records() if records is None else records
+    return ''.join(json.dumps(record) + '\n' for record in records)
@@ -1,10 +1,86 @@
 """
 Styling utilities
+
+The theme, home and sidebar stylesheets are built into one minified,
+content-hashed bundle once per process. With static serving enabled the
+bundle is published under src/static/ and every rerun only sends a short
+<link> to it, which the browser caches; otherwise the minified CSS is
+inlined.
 """
+import hashlib
+import os
+import re
+import tempfile
+from functools import lru_cache
+from typing import Optional, Tuple
+
 import streamlit as st
-from config.theme import get_custom_css
+from config.theme import get_custom_css, HOME_CSS, SIDEBAR_CSS
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+
+def minify_css(css: str) -> str:
+    """
+    Strip comments and insignificant whitespace from a stylesheet
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+@lru_cache(maxsize=1)
+def get_css_bundle() -> Tuple[str, str]:
+    """
+    Minified app stylesheet and its content hash
+
+    Returns:
+        (css, first 12 hex digits of its sha256)
+    """
+    theme = re.sub(r'</?style>', '', get_custom_css())
+    css = minify_css('\n'.join([theme, HOME_CSS, SIDEBAR_CSS]))
+    return css, hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]
+
+
+@lru_cache(maxsize=1)
+def _publish_bundle() -> Optional[str]:
+    """
+    Write the bundle to STATIC_DIR as theme.<hash>.css
+
+    Returns:
+        URL the static file server serves it at, or None if it can't be written
+    """
+    css, digest = get_css_bundle()
+    name = f"theme.{digest}.css"
+    path = os.path.join(STATIC_DIR, name)
+    try:
+        if not os.path.exists(path):
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=STATIC_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(css)
+            os.replace(tmp, path)
+            for stale in os.listdir(STATIC_DIR):
+                if re.fullmatch(r'theme\.[0-9a-f]{12}\.css', stale) and stale != name:
+                    os.remove(os.path.join(STATIC_DIR, stale))
+    except OSError:
+        return None
+    return f"app/static/{name}"
 
 
 def apply_custom_css():
     """Apply custom CSS styling to the app"""
-    st.markdown(get_custom_css(), unsafe_allow_html=True)
+    href = _publish_bundle() if st.get_option('server.enableStaticServing') else None
+    if href:
+        st.markdown(f"<link rel='stylesheet' href='{href}'>", unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{get_css_bundle()[0]}</style>", unsafe_allow_html=True)
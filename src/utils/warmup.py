@@ -0,0 +1,190 @@
+"""
+Worker warm-up and readiness
+
+A fresh server process pays for CSV parsing, model deserialization and
+each model's first predict on the first request. run_warmup does that
+work up front through the same cached loaders the pages use, and a small
+HTTP server reports readiness so a load balancer only routes traffic to
+warm processes.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import WARMUP_MODELS, WARMUP_DATA, WARMUP_VIEWS, WARMUP_SHAP
+from utils.instrumentation import span
+
+
+_LOCK = threading.Lock()
+_STATE: Dict[str, Any] = {'state': 'cold', 'started_at': None, 'finished_at': None, 'steps': []}
+
+
+def get_warmup_state() -> Dict[str, Any]:
+    """
+    Current warm-up progress
+
+    Returns:
+        Dict with 'state' (cold, warming, ready or failed), 'started_at',
+        'finished_at' and per-step 'steps' (name, seconds, ok, error)
+    """
+    with _LOCK:
+        return {**_STATE, 'steps': [dict(step) for step in _STATE['steps']]}
+
+
+def _step(name: str, func: Callable[[], Any]) -> bool:
+    """Run one warm-up step as a 'warmup.<name>' span and record the outcome"""
+    start = time.perf_counter()
+    error = None
+    try:
+        with span(f"warmup.{name}"):
+            func()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    with _LOCK:
+        _STATE['steps'].append({'name': name, 'seconds': round(time.perf_counter() - start, 3),
+                                'ok': error is None, 'error': error})
+    return error is None
+
+
+def _warm_models(names: List[str]) -> None:
+    """Load the models and run a single-row and a batch prediction on each"""
+    from models.data_loader import load_train_test_data
+    from models.model_loader import load_feature_schema, load_models
+
+    models = load_models()
+    missing = [name for name in names if name not in models]
+    if missing:
+        raise RuntimeError(f"models not available: {', '.join(missing)}")
+
+    X_test = load_train_test_data().get('X_test')
+    if X_test is None:
+        raise RuntimeError("test split not available for the dummy predictions")
+    rows = X_test.reindex(columns=load_feature_schema()['feature_order'], fill_value=0)
+    for name in names:
+        models[name].predict(rows.head(1))
+        models[name].predict(rows.head(1000))
+
+
+def _warm_shap(names: List[str]) -> None:
+    """Build the explainers of the warmed models and explain one row each"""
+    from models.data_loader import load_train_test_data
+    from models.explainers import align_features, load_explainer
+
+    row = align_features(load_train_test_data()['X_test'].head(1))
+    for name in names:
+        load_explainer(name)(row)
+
+
+def run_warmup(models: Optional[List[str]] = None, data: Optional[List[str]] = None,
+               views: Optional[List[str]] = None, shap: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Preload the configured data, models, views and explainers
+
+    Every step runs even if an earlier one failed; the state ends as
+    'ready' only when all of them succeeded.
+
+    Args:
+        models: Models to load and predict with (default WARMUP_MODELS)
+        data: Any of 'dataset', 'eda' and 'splits' to load (default WARMUP_DATA)
+        views: Page keys whose views to import (default WARMUP_VIEWS)
+        shap: Build the explainers of the models (default WARMUP_SHAP)
+
+    Returns:
+        Final state from get_warmup_state
+    """
+    from models.data_loader import load_dataset, load_eda_summary, load_train_test_data
+    from models.model_loader import load_feature_schema
+    from models.status import get_status
+    from views import load_view
+
+    models = WARMUP_MODELS if models is None else models
+    data = WARMUP_DATA if data is None else data
+    views = WARMUP_VIEWS if views is None else views
+    shap = WARMUP_SHAP if shap is None else shap
+
+    with _LOCK:
+        _STATE.update(state='warming', started_at=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                      finished_at=None, steps=[])
+
+    steps = [('status', get_status), ('schema', load_feature_schema)]
+    if 'dataset' in data:
+        steps.append(('dataset', load_dataset))
+    if 'eda' in data:
+        steps.append(('eda', load_eda_summary))
+    if 'splits' in data:
+        steps.append(('splits', load_train_test_data))
+    if models:
+        steps.append(('models', lambda: _warm_models(models)))
+    steps += [(f"view.{key}", lambda key=key: load_view(key)) for key in views]
+    if shap and models:
+        steps.append(('shap', lambda: _warm_shap(models)))
+
+    ok = all([_step(name, func) for name, func in steps])
+    with _LOCK:
+        _STATE.update(state='ready' if ok else 'failed', finished_at=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    return get_warmup_state()
+
+
+def start_warmup(wait_for_runtime: bool = True, **options) -> threading.Thread:
+    """
+    Run the warm-up in a daemon thread
+
+    Args:
+        wait_for_runtime: Wait until the Streamlit runtime exists, so the
+            caches filled here are the ones the sessions use
+        **options: Overrides passed to run_warmup
+
+    Returns:
+        The started thread
+    """
+    def target():
+        if wait_for_runtime:
+            from streamlit.runtime import Runtime
+            while not Runtime.exists():
+                time.sleep(0.1)
+        run_warmup(**options)
+
+    thread = threading.Thread(target=target, name='warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    """GET /health: process is up; GET /ready: 200 once warm, else 503"""
+
+    def do_GET(self):
+        if self.path == '/health':
+            status, body = 200, {'status': 'ok'}
+        elif self.path == '/ready':
+            body = get_warmup_state()
+            status = 200 if body['state'] == 'ready' else 503
+        else:
+            status, body = 404, {'error': 'not found'}
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_health_server(port: int, host: str = '0.0.0.0') -> ThreadingHTTPServer:
+    """
+    Serve /health and /ready in a daemon thread
+
+    Args:
+        port: Port to listen on
+        host: Interface to bind
+
+    Returns:
+        The running server
+    """
+    server = ThreadingHTTPServer((host, port), _HealthHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='health-server', daemon=True).start()
+    return server
@@ -1,20 +1,52 @@
 """
 Views package
+
+View modules are imported on first use, not with the package, so a page's
+heavy dependencies (shap, matplotlib, sklearn, ...) are only loaded when
+that page is opened.
 """
-from . import home
-from . import single_prediction
-from . import model_performance
-from . import shap_analysis
-from . import data_visualization
-from . import batch_prediction
-from . import model_comparison
-
-__all__ = [
-    'home',
-    'single_prediction',
-    'model_performance',
-    'shap_analysis',
-    'data_visualization',
-    'batch_prediction',
-    'model_comparison'
-]
+import importlib
+import sys
+
+from utils.instrumentation import span
+
+
+# Page key (config.settings.PAGES / HIDDEN_PAGES) -> view module
+VIEW_MODULES = {
+    'home': 'home',
+    'prediction': 'single_prediction',
+    'performance': 'model_performance',
+    'shap': 'shap_analysis',
+    'visualization': 'data_visualization',
+    'batch': 'batch_prediction',
+    'comparison': 'model_comparison',
+    'diagnostics': 'diagnostics',
+}
+
+__all__ = list(VIEW_MODULES.values()) + ['VIEW_MODULES', 'load_view']
+
+
+def load_view(page_key: str):
+    """
+    Import the view module of a page on demand
+
+    The first import of each view is timed as an 'import.view.<key>' span.
+
+    Args:
+        page_key: Key from PAGES or HIDDEN_PAGES
+
+    Returns:
+        View module exposing render()
+    """
+    name = f"{__name__}.{VIEW_MODULES[page_key]}"
+    if name in sys.modules:
+        return sys.modules[name]
+    with span(f"import.view.{page_key}"):
+        return importlib.import_module(name)
+
+
+def __getattr__(name: str):
+    """Keep `from views import home` working without eager imports"""
+    if name in VIEW_MODULES.values():
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,8 +14,15 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from models.model_loader import load_models
+from models.model_loader import load_models, load_feature_schema
 from models.data_loader import load_train_test_data
+from models.feature_schema import schema_encoder, schema_raw_columns
+from models.splits import split_path
+from config.settings import DOWNLOAD_MAX_ROWS, X_TEST_PATH
+from utils.instrumentation import span
+from components.charts import histogram_trace, points_note, scatter_trace
+from components.tables import paginated_table
+from models.results_store import EXPORT_FORMATS, export_results, write_results
 
 
 def render():
@@ -33,7 +40,7 @@ def render():
     st.info("📋 **Required columns:** Soil_Type, Crop, Rainfall_mm, Temperature_Celsius, Fertilizer_Used, Irrigation_Used, Weather_Condition, Days_to_Harvest")
     
     # Option to use test dataset
-    use_test_data = st.checkbox("📊 Use Test Dataset (160 samples)", help="Automatically load X_test.csv for batch prediction")
+    use_test_data = st.checkbox("📊 Use Test Dataset", help="Automatically load the X_test split for batch prediction")
     
     col1, col2 = st.columns([2, 1])
     
@@ -42,7 +49,7 @@ def render():
             uploaded_file = st.file_uploader("📁 Upload CSV File", type=['csv'])
         else:
             uploaded_file = None
-            st.info("✓ Using test dataset: data/X_test.csv")
+            st.info(f"✓ Using test dataset: data/{os.path.basename(split_path(X_TEST_PATH))}")
     
     with col2:
         selected_model = st.selectbox("🤖 Select Model", list(models.keys()))
@@ -56,7 +63,7 @@ def render():
 
 
 def _process_test_dataset(selected_model, models):
-    """Process test dataset (160 samples)"""
+    """Process test dataset"""
     try:
         train_data = load_train_test_data()
         
@@ -79,7 +86,8 @@ def _process_test_dataset(selected_model, models):
                 try:
                     # Make predictions
                     model = models[selected_model]
-                    predictions = model.predict(X_test)
+                    with span('predict', rows=len(X_test)):
+                        predictions = model.predict(X_test)
                     
                     # Create results dataframe with original features
                     # Convert y_test to Series if it's a DataFrame
@@ -99,95 +107,17 @@ def _process_test_dataset(selected_model, models):
                         'Error': y_test_values - predictions,
                         'Abs_Error': abs(y_test_values - predictions)
                     })
+                    _store_results('test', selected_model, df_results)
                     
                     st.success("✅ Predictions completed!")
                     
-                    # Display results
-                    st.subheader("📊 Prediction Results (First 20 rows)")
-                    st.dataframe(df_results.head(20), use_container_width=True)
-                    
-                    # Calculate metrics
-                    # Convert y_test to 1D array if it's a DataFrame
-                    y_true = y_test.iloc[:, 0].values if isinstance(y_test, pd.DataFrame) else y_test
-                    
-                    mae = mean_absolute_error(y_true, predictions)
-                    rmse = np.sqrt(mean_squared_error(y_true, predictions))
-                    r2 = r2_score(y_true, predictions)
-                    
-                    col1, col2, col3, col4 = st.columns(4)
-                    col1.metric("Total Samples", len(predictions))
-                    col2.metric("MAE", f"{mae:.3f}")
-                    col3.metric("RMSE", f"{rmse:.3f}")
-                    col4.metric("R² Score", f"{r2:.3f}")
-                    
-                    # Visualizations
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        # Actual vs Predicted
-                        fig1 = go.Figure()
-                        fig1.add_trace(go.Scatter(
-                            x=y_test, 
-                            y=predictions,
-                            mode='markers',
-                            marker=dict(color='#667eea', size=8, opacity=0.6),
-                            name='Predictions'
-                        ))
-                        fig1.add_trace(go.Scatter(
-                            x=[y_test.min(), y_test.max()],
-                            y=[y_test.min(), y_test.max()],
-                            mode='lines',
-                            line=dict(color='#f87171', dash='dash', width=2),
-                            name='Perfect Prediction'
-                        ))
-                        fig1.update_layout(
-                            title='Actual vs Predicted Yield',
-                            xaxis_title='Actual Yield (tons/ha)',
-                            yaxis_title='Predicted Yield (tons/ha)',
-                            height=400,
-                            plot_bgcolor='#0f172a',
-                            paper_bgcolor='#0f172a',
-                            font=dict(color='#e5e7eb', family='Inter'),
-                            xaxis=dict(gridcolor='#1f2937'),
-                            yaxis=dict(gridcolor='#1f2937')
-                        )
-                        st.plotly_chart(fig1, use_container_width=True)
-                    
-                    with col2:
-                        # Error distribution
-                        fig2 = go.Figure()
-                        fig2.add_trace(go.Histogram(
-                            x=df_results['Error'],
-                            nbinsx=30,
-                            marker_color='#667eea',
-                            marker_line=dict(color='#764ba2', width=1)
-                        ))
-                        fig2.update_layout(
-                            title='Prediction Error Distribution',
-                            xaxis_title='Error (Actual - Predicted)',
-                            yaxis_title='Frequency',
-                            height=400,
-                            plot_bgcolor='#0f172a',
-                            paper_bgcolor='#0f172a',
-                            font=dict(color='#e5e7eb', family='Inter'),
-                            xaxis=dict(gridcolor='#1f2937'),
-                            yaxis=dict(gridcolor='#1f2937')
-                        )
-                        st.plotly_chart(fig2, use_container_width=True)
-                    
-                    # Download results
-                    csv = df_results.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download Test Predictions",
-                        data=csv,
-                        file_name=f"test_predictions_{selected_model}.csv",
-                        mime="text/csv",
-                        type="primary"
-                    )
-                    
                 except Exception as e:
                     st.error(f"❌ Prediction error: {str(e)}")
                     st.exception(e)
+        
+        results = _stored_results('test', selected_model)
+        if results is not None:
+            _render_test_results(results)
     
     except Exception as e:
         st.error(f"❌ Error loading test dataset: {str(e)}")
@@ -196,6 +126,7 @@ def _process_test_dataset(selected_model, models):
 
 def _process_uploaded_file(uploaded_file, selected_model, models):
     """Process uploaded CSV file"""
+    source = f"upload:{uploaded_file.file_id}"
     try:
         # Try different separators
         try:
@@ -205,101 +136,234 @@ def _process_uploaded_file(uploaded_file, selected_model, models):
         
         st.success(f"✅ File loaded: {df_input.shape[0]} rows, {df_input.shape[1]} columns")
         
+        schema = load_feature_schema()
+        missing = [col for col in schema_raw_columns(schema) if col not in df_input.columns]
+        if missing:
+            st.error(f"❌ Missing required columns: {', '.join(missing)}")
+            return
+        
+        # Unknown categories would encode as all zeros, i.e. as each column's first category
+        encoder = schema_encoder(schema)
+        known = encoder.known_rows(df_input)
+        if not known.all():
+            _show_unknown_categories(encoder.unknown_categories(df_input), int((~known).sum()))
+            if not known.any():
+                st.error("❌ No rows left to predict")
+                return
+            df_input = df_input[known]
+        
         st.subheader("📋 Preview Uploaded Data")
         st.dataframe(df_input.head(10), use_container_width=True)
         
         if st.button("🚀 Run Batch Prediction", type="primary"):
             with st.spinner("🔄 Processing predictions..."):
                 try:
-                    # Load training columns template for one-hot alignment
-                    train_data = load_train_test_data()
-                    train_columns = train_data['X_train'].columns.tolist()
-                    
-                    # Prepare features with one-hot encoding
-                    df_processed = df_input.copy()
-                    
-                    # Convert boolean columns to int first
-                    if 'Fertilizer_Used' in df_processed.columns:
-                        df_processed['Fertilizer_Used'] = df_processed['Fertilizer_Used'].astype(int)
-                    if 'Irrigation_Used' in df_processed.columns:
-                        df_processed['Irrigation_Used'] = df_processed['Irrigation_Used'].astype(int)
-                    
-                    # One-hot encode categorical columns
-                    categorical_cols = [col for col in ['Soil_Type', 'Crop', 'Weather_Condition'] 
-                                      if col in df_processed.columns]
-                    
-                    if categorical_cols:
-                        df_processed = pd.get_dummies(df_processed, columns=categorical_cols, drop_first=True)
-                    
-                    # Align to training columns
-                    for col in train_columns:
-                        if col not in df_processed.columns:
-                            df_processed[col] = 0
-                    
-                    # Keep only training columns in correct order
-                    df_processed = df_processed[train_columns]
+                    # One-hot encode with the schema published alongside the models
+                    df_processed = encoder.transform(df_input)
                     
                     # Make predictions
                     model = models[selected_model]
-                    predictions = model.predict(df_processed)
+                    with span('predict', rows=len(df_processed)):
+                        predictions = model.predict(df_processed)
                     
                     # Add predictions to original dataframe
                     df_results = df_input.copy()
                     df_results['Predicted_Yield'] = predictions
+                    _store_results(source, selected_model, df_results)
                     
                     st.success("✅ Predictions completed!")
                     
-                    # Display results
-                    st.subheader("📊 Prediction Results")
-                    st.dataframe(df_results, use_container_width=True)
-                    
-                    # Statistics
-                    col1, col2, col3, col4 = st.columns(4)
-                    col1.metric("Total Predictions", len(predictions))
-                    col2.metric("Avg Predicted Yield", f"{predictions.mean():.2f}")
-                    col3.metric("Max Predicted Yield", f"{predictions.max():.2f}")
-                    col4.metric("Min Predicted Yield", f"{predictions.min():.2f}")
-                    
-                    # Visualization
-                    fig = go.Figure()
-                    fig.add_trace(go.Histogram(
-                        x=predictions,
-                        nbinsx=30,
-                        marker_color='#667eea',
-                        marker_line=dict(color='#764ba2', width=1)
-                    ))
-                    fig.update_layout(
-                        title='Distribution of Predicted Yields',
-                        xaxis_title='Predicted Yield (tons/ha)',
-                        yaxis_title='Frequency',
-                        height=400,
-                        plot_bgcolor='#0f172a',
-                        paper_bgcolor='#0f172a',
-                        font=dict(color='#e5e7eb', family='Inter'),
-                        xaxis=dict(gridcolor='#1f2937'),
-                        yaxis=dict(gridcolor='#1f2937')
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Download results
-                    csv = df_results.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download Predictions",
-                        data=csv,
-                        file_name=f"batch_predictions_{selected_model}.csv",
-                        mime="text/csv",
-                        type="primary"
-                    )
-                    
                 except Exception as e:
                     st.error(f"❌ Prediction error: {str(e)}")
                     st.exception(e)
+        
+        results = _stored_results(source, selected_model)
+        if results is not None:
+            _render_upload_results(results)
     
     except Exception as e:
         st.error(f"❌ Error loading file: {str(e)}")
         st.exception(e)
 
 
+def _show_unknown_categories(unknown, n_rows, max_values=10):
+    """Warn about category values the models were not trained on"""
+    lines = []
+    for col, values in unknown.items():
+        shown = ', '.join(values[:max_values])
+        more = f" (+{len(values) - max_values} more)" if len(values) > max_values else ""
+        lines.append(f"- **{col}**: {shown}{more}")
+    st.warning(f"⚠️ Skipping {n_rows:,} row(s) with categories the models were not trained on:\n\n" + "\n".join(lines))
+
+
+def _render_test_results(results):
+    """Metrics, charts, table and download of test set predictions"""
+    df_results = results['df']
+    y_true = df_results['Actual_Yield'].to_numpy()
+    predictions = df_results['Predicted_Yield'].to_numpy()
+    
+    # Display results
+    st.subheader("📊 Prediction Results")
+    paginated_table(df_results, key='batch_test_results')
+    
+    # Calculate metrics
+    mae = mean_absolute_error(y_true, predictions)
+    rmse = np.sqrt(mean_squared_error(y_true, predictions))
+    r2 = r2_score(y_true, predictions)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Samples", len(predictions))
+    col2.metric("MAE", f"{mae:.3f}")
+    col3.metric("RMSE", f"{rmse:.3f}")
+    col4.metric("R² Score", f"{r2:.3f}")
+
+    # Visualizations
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Actual vs Predicted
+        fig1 = go.Figure()
+        points = scatter_trace(
+            y_true, 
+            predictions,
+            marker=dict(color='#667eea', size=8, opacity=0.6),
+            name='Predictions'
+        )
+        fig1.add_trace(points)
+        fig1.add_trace(go.Scatter(
+            x=[y_true.min(), y_true.max()],
+            y=[y_true.min(), y_true.max()],
+            mode='lines',
+            line=dict(color='#f87171', dash='dash', width=2),
+            name='Perfect Prediction'
+        ))
+        fig1.update_layout(
+            title=f'Actual vs Predicted Yield{points_note(points, len(predictions))}',
+            xaxis_title='Actual Yield (tons/ha)',
+            yaxis_title='Predicted Yield (tons/ha)',
+            height=400,
+            plot_bgcolor='#0f172a',
+            paper_bgcolor='#0f172a',
+            font=dict(color='#e5e7eb', family='Inter'),
+            xaxis=dict(gridcolor='#1f2937'),
+            yaxis=dict(gridcolor='#1f2937')
+        )
+        st.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Error distribution
+        fig2 = go.Figure()
+        fig2.add_trace(histogram_trace(
+            df_results['Error'],
+            nbins=30,
+            marker_color='#667eea',
+            marker_line=dict(color='#764ba2', width=1)
+        ))
+        fig2.update_layout(
+            title='Prediction Error Distribution',
+            xaxis_title='Error (Actual - Predicted)',
+            yaxis_title='Frequency',
+            height=400,
+            plot_bgcolor='#0f172a',
+            paper_bgcolor='#0f172a',
+            font=dict(color='#e5e7eb', family='Inter'),
+            xaxis=dict(gridcolor='#1f2937'),
+            yaxis=dict(gridcolor='#1f2937')
+        )
+        st.plotly_chart(fig2, use_container_width=True)
+
+    _render_download(results, "📥 Download Test Predictions", f"test_predictions_{results['model']}")
+
+
+def _render_upload_results(results):
+    """Statistics, chart, table and download of uploaded file predictions"""
+    df_results = results['df']
+    predictions = df_results['Predicted_Yield'].to_numpy()
+    
+    # Display results
+    st.subheader("📊 Prediction Results")
+    paginated_table(df_results, key='batch_upload_results')
+
+    # Statistics
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Predictions", len(predictions))
+    col2.metric("Avg Predicted Yield", f"{predictions.mean():.2f}")
+    col3.metric("Max Predicted Yield", f"{predictions.max():.2f}")
+    col4.metric("Min Predicted Yield", f"{predictions.min():.2f}")
+
+    # Visualization
+    fig = go.Figure()
+    fig.add_trace(histogram_trace(
+        predictions,
+        nbins=30,
+        marker_color='#667eea',
+        marker_line=dict(color='#764ba2', width=1)
+    ))
+    fig.update_layout(
+        title='Distribution of Predicted Yields',
+        xaxis_title='Predicted Yield (tons/ha)',
+        yaxis_title='Frequency',
+        height=400,
+        plot_bgcolor='#0f172a',
+        paper_bgcolor='#0f172a',
+        font=dict(color='#e5e7eb', family='Inter'),
+        xaxis=dict(gridcolor='#1f2937'),
+        yaxis=dict(gridcolor='#1f2937')
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    _render_download(results, "📥 Download Predictions", f"batch_predictions_{results['model']}")
+
+
+def _render_download(results, label, file_stem):
+    """Download in a chosen format, exported from the results file only when clicked"""
+    if not os.path.exists(results['path']):
+        results['path'] = write_results(results['df'])
+    if len(results['df']) > DOWNLOAD_MAX_ROWS:
+        st.warning(f"⚠️ These results are too large to download: {len(results['df']):,} rows, "
+                   f"and downloads are limited to {DOWNLOAD_MAX_ROWS:,} rows.")
+        return
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        fmt = st.selectbox("Format", list(EXPORT_FORMATS), format_func=lambda key: EXPORT_FORMATS[key][0],
+                           key=f"{file_stem}_format", label_visibility="collapsed")
+    with col2:
+        _, ext, mime = EXPORT_FORMATS[fmt]
+        path = results['path']
+        st.download_button(
+            label=label,
+            data=lambda: _read_export(path, fmt),
+            file_name=f"{file_stem}{ext}",
+            mime=mime,
+            on_click="ignore",
+            type="primary"
+        )
+
+
+def _read_export(path, fmt):
+    """Bytes of the results file exported to fmt (called when the download is clicked)"""
+    with open(export_results(path, fmt), 'rb') as f:
+        return f.read()
+
+
+def _store_results(source, model_name, df_results):
+    """Keep the scored rows server-side (and on disk for downloads) so reruns can show them"""
+    previous = st.session_state.get('batch_results')
+    path = write_results(df_results, replaces=previous['path'] if previous else None)
+    st.session_state['batch_results'] = {'source': source, 'model': model_name, 'df': df_results, 'path': path}
+
+
+def _stored_results(source, model_name):
+    """Stored results of this input, with a note when another model is selected"""
+    results = st.session_state.get('batch_results')
+    if results is None or results['source'] != source:
+        return None
+    if results['model'] != model_name:
+        st.caption(f"ℹ️ Showing predictions of {results['model']}; run the batch prediction again for {model_name}.")
+    return results
+
+
 def _show_sample_format():
     """Show sample file format"""
     st.markdown("### 📄 Sample File Format")
@@ -11,58 +11,61 @@ sys.path.insert(0, str(project_root))
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
-from models.data_loader import load_dataset
+from models.data_loader import load_eda_summary
+from models.eda_summary import box_stats, summary_frame, summary_histogram
+from components.charts import binned_histogram_trace, box_stats_trace
 
 
 def render():
-    """Render data visualization page"""
+    """Render data visualization page from the precomputed EDA summary"""
     st.header("📈 Data Visualization & Exploratory Analysis")
     st.markdown("Explore the dataset with interactive visualizations")
     st.markdown("---")
     
-    df = load_dataset()
+    summary = load_eda_summary()
     
-    if df is None:
+    if summary is None:
         st.error("⚠️ Dataset not found!")
         return
     
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "📈 Distribution", "🔗 Correlation", "📉 Feature Analysis"])
     
     with tab1:
-        _render_overview(df)
+        _render_overview(summary)
     
     with tab2:
-        _render_distribution(df)
+        _render_distribution(summary)
     
     with tab3:
-        _render_correlation(df)
+        _render_correlation(summary)
     
     with tab4:
-        _render_feature_analysis(df)
+        _render_feature_analysis(summary)
 
 
-def _render_overview(df):
+def _render_overview(summary):
     """Render dataset overview"""
     st.subheader("📊 Dataset Overview")
     
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Samples", f"{df.shape[0]:,}")
-    col2.metric("Features", df.shape[1] - 1)
-    col3.metric("Crops Types", df['Crop'].nunique())
-    col4.metric("Soil Types", df['Soil_Type'].nunique())
+    col1.metric("Total Samples", f"{summary['rows']:,}")
+    col2.metric("Features", len(summary['columns']) - 1)
+    col3.metric("Crops Types", len(summary['groups']['Crop']['count']))
+    col4.metric("Soil Types", len(summary['groups']['Soil_Type']['count']))
     
     st.markdown("### 📋 Sample Data")
-    st.dataframe(df.head(20), use_container_width=True)
+    st.dataframe(summary_frame(summary['head']), use_container_width=True)
     
     st.markdown("### 📊 Statistical Summary")
-    st.dataframe(df.describe(), use_container_width=True)
+    describe = pd.DataFrame(summary['describe']).loc[['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']]
+    st.dataframe(describe, use_container_width=True)
+    st.caption(_sketch_note(summary))
     
     # Missing values
     st.markdown("### 🔍 Data Quality Check")
-    missing = df.isnull().sum()
+    missing = pd.Series(summary['missing'])
     if missing.sum() == 0:
         st.success("No missing values detected across all features.")
     else:
@@ -89,7 +92,7 @@ def _render_overview(df):
         st.plotly_chart(fig, use_container_width=True)
 
 
-def _render_distribution(df):
+def _render_distribution(summary):
     """Render feature distributions"""
     st.subheader("📈 Feature Distributions")
 
@@ -98,9 +101,8 @@ def _render_distribution(df):
 
     with col1:
         fig = go.Figure()
-        fig.add_trace(go.Histogram(
-            x=df['Yield_tons_per_hectare'],
-            nbinsx=30,
+        fig.add_trace(binned_histogram_trace(
+            *summary_histogram(summary, 'Yield_tons_per_hectare'),
             marker_color='#4facfe',
             marker_line=dict(color='#00f2fe', width=1)
         ))
@@ -119,8 +121,9 @@ def _render_distribution(df):
 
     with col2:
         fig = go.Figure()
-        fig.add_trace(go.Box(
-            y=df['Yield_tons_per_hectare'],
+        fig.add_trace(box_stats_trace(
+            box_stats(summary, 'Yield_tons_per_hectare'),
+            name='Yield',
             marker_color='#764ba2',
             marker=dict(color='#764ba2', line=dict(color='#667eea', width=2))
         ))
@@ -135,7 +138,7 @@ def _render_distribution(df):
         )
         st.plotly_chart(fig, use_container_width=True)
 
-    numerical_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    numerical_cols = list(summary['numeric_columns'])
     if 'Yield_tons_per_hectare' in numerical_cols:
         numerical_cols.remove('Yield_tons_per_hectare')
 
@@ -145,9 +148,8 @@ def _render_distribution(df):
 
     with col1:
         fig = go.Figure()
-        fig.add_trace(go.Histogram(
-            x=df[selected_feature],
-            nbinsx=30,
+        fig.add_trace(binned_histogram_trace(
+            *summary_histogram(summary, selected_feature),
             marker_color='#4facfe',
             marker_line=dict(color='#00f2fe', width=1)
         ))
@@ -166,8 +168,9 @@ def _render_distribution(df):
 
     with col2:
         fig = go.Figure()
-        fig.add_trace(go.Box(
-            y=df[selected_feature],
+        fig.add_trace(box_stats_trace(
+            box_stats(summary, selected_feature),
+            name=selected_feature,
             marker_color='#fa709a',
             marker=dict(color='#fa709a', line=dict(color='#f5576c', width=2))
         ))
@@ -182,13 +185,31 @@ def _render_distribution(df):
         )
         st.plotly_chart(fig, use_container_width=True)
 
+    st.caption(_sketch_note(summary))
 
-def _render_correlation(df):
+
+def _sketch_note(summary) -> str:
+    """Caption stating how exact the sketched statistics are"""
+    error = max(summary['rank_error'].values(), default=0.0)
+    if not error:
+        return "Statistics are exact over all rows."
+    return (f"Counts, means, std, min and max are exact. Quartiles, box plots and histograms come from "
+            f"streaming quantile sketches of all {summary['rows']:,} rows: ranks within ±{error:.2%}, "
+            f"bin counts within ±{2 * error * summary['rows']:,.0f} rows (99% confidence).")
+
+
+def _render_correlation(summary):
     """Render correlation analysis"""
     st.subheader("🔗 Feature Correlations")
     
-    numerical_df = df.select_dtypes(include=[np.number])
-    corr_matrix = numerical_df.corr()
+    if summary['correlation'] is None:
+        st.info("Not enough complete rows to compute correlations.")
+        return
+    columns = summary['correlation']['columns']
+    corr_matrix = pd.DataFrame(summary['correlation']['matrix'], index=columns, columns=columns, dtype=float)
+    
+    st.caption(f"Pearson correlations over {summary['correlation']['rows']:,} complete rows "
+               f"(exact, from streaming covariances).")
     
     # Correlation heatmap
     fig = go.Figure(data=go.Heatmap(
@@ -243,7 +264,7 @@ def _render_correlation(df):
         st.plotly_chart(fig, use_container_width=True)
 
 
-def _render_feature_analysis(df):
+def _render_feature_analysis(summary):
     """Render yield analysis by categories"""
     st.subheader("📉 Yield Analysis by Categories")
     
@@ -251,7 +272,7 @@ def _render_feature_analysis(df):
     col1, col2 = st.columns(2)
     
     with col1:
-        crop_yield = df.groupby('Crop')['Yield_tons_per_hectare'].mean().sort_values(ascending=False)
+        crop_yield = pd.Series(summary['groups']['Crop']['target_mean']).sort_values(ascending=False)
         
         fig = go.Figure()
         fig.add_trace(go.Bar(
@@ -277,7 +298,7 @@ def _render_feature_analysis(df):
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        soil_yield = df.groupby('Soil_Type')['Yield_tons_per_hectare'].mean().sort_values(ascending=False)
+        soil_yield = pd.Series(summary['groups']['Soil_Type']['target_mean']).sort_values(ascending=False)
         
         fig = go.Figure()
         fig.add_trace(go.Bar(
@@ -303,7 +324,7 @@ def _render_feature_analysis(df):
         st.plotly_chart(fig, use_container_width=True)
     
     # Weather vs Yield
-    weather_yield = df.groupby('Weather_Condition')['Yield_tons_per_hectare'].mean().sort_values(ascending=False)
+    weather_yield = pd.Series(summary['groups']['Weather_Condition']['target_mean']).sort_values(ascending=False)
     
     fig = go.Figure()
     fig.add_trace(go.Bar(
@@ -327,10 +348,10 @@ def _render_feature_analysis(df):
     )
     st.plotly_chart(fig, use_container_width=True)
     
-    # Scatter: Temperature vs Rainfall vs Yield
-    # Create a size column with positive values only
-    df_scatter = df.copy()
+    # Scatter: Temperature vs Rainfall vs Yield, on the stored random sample of the rows
+    df_scatter = summary_frame(summary['sample'])
     df_scatter['size_col'] = df_scatter['Yield_tons_per_hectare'].abs() + 1  # Add 1 to ensure all positive
+    note = f" ({len(df_scatter):,} of {summary['rows']:,} points)" if len(df_scatter) < summary['rows'] else ""
     
     fig = px.scatter(df_scatter, 
                     x='Temperature_Celsius', 
@@ -339,7 +360,8 @@ def _render_feature_analysis(df):
                     size='size_col',
                     hover_data=['Crop', 'Soil_Type'],
                     color_continuous_scale='Viridis',
-                    title='Temperature vs Rainfall (colored by Yield)')
+                    render_mode='webgl',
+                    title=f'Temperature vs Rainfall (colored by Yield){note}')
     fig.update_layout(
         height=500,
         plot_bgcolor='#0f172a',
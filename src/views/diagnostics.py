@@ -0,0 +1,134 @@
+"""
+Diagnostics View (hidden page for hot-path timings)
+"""
+import sys
+import os
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from config.settings import INSTRUMENTATION_ENABLED
+from utils.instrumentation import (
+    is_enabled, set_enabled, get_records, clear_records,
+    records_as_jsonl, get_export_path, get_export_error
+)
+
+
+def render():
+    """Render diagnostics page"""
+    st.header("🩺 Diagnostics")
+    st.markdown("Hot-path timings recorded in this server process")
+    st.markdown("---")
+
+    # Recording is process-wide, so only a server started with profiling exposes it
+    if not INSTRUMENTATION_ENABLED:
+        st.info("💡 Instrumentation is off. Start the server with CROPYIELD_PROFILE=1 "
+                "(and optionally CROPYIELD_PROFILE_EXPORT=<file>) to record timings.")
+        return
+
+    _render_controls()
+
+    records = get_records()
+    if not records:
+        st.info("💡 No timings recorded yet. Enable instrumentation and browse a few pages.")
+        return
+
+    df = pd.DataFrame(records)
+
+    tab1, tab2 = st.tabs(["📊 Summary", "📋 Recent Spans"])
+
+    with tab1:
+        _render_summary(df)
+
+    with tab2:
+        _render_recent(df)
+
+
+def _render_controls():
+    """Render enable/clear controls and the export status"""
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        enabled = st.toggle("⏱️ Record timings", value=is_enabled(),
+                            help="Applies to every session served by this process")
+        if enabled != is_enabled():
+            set_enabled(enabled)
+
+    with col2:
+        if get_export_error():
+            st.warning(f"⚠️ Export disabled after a write error ({get_export_error()})")
+        elif get_export_path():
+            st.caption(f"📝 Appending spans to {get_export_path()}")
+        else:
+            st.caption("📝 No export file (set CROPYIELD_PROFILE_EXPORT)")
+
+    with col3:
+        st.markdown("##")
+        if st.button("🧹 Clear Buffer", use_container_width=True):
+            clear_records()
+            st.rerun()
+
+
+def _render_summary(df):
+    """Render per-span aggregate timings"""
+    st.subheader("📊 Time by Span")
+
+    summary = df.groupby('name').agg(
+        calls=('duration_ms', 'size'),
+        total_ms=('duration_ms', 'sum'),
+        p50_ms=('duration_ms', 'median'),
+        p95_ms=('duration_ms', lambda d: d.quantile(0.95)),
+        max_ms=('duration_ms', 'max'),
+        rows=('rows', 'sum'),
+    ).sort_values('total_ms', ascending=False)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Spans Recorded", f"{len(df):,}")
+    col2.metric("Distinct Spans", len(summary))
+    col3.metric("Slowest Span", summary['max_ms'].idxmax(), f"{summary['max_ms'].max():.1f} ms",
+                delta_color="off")
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=summary['total_ms'],
+        y=summary.index,
+        orientation='h',
+        marker_color='#4facfe',
+        text=summary['total_ms'].round(1),
+        textposition='auto',
+        textfont=dict(color='white', size=12, family='Inter')
+    ))
+    fig.update_layout(
+        title='Total Time per Span (ms)',
+        xaxis_title='Milliseconds',
+        height=max(300, 32 * len(summary)),
+        plot_bgcolor='#0f172a',
+        paper_bgcolor='#0f172a',
+        font=dict(color='#e5e7eb', family='Inter'),
+        xaxis=dict(gridcolor='#1f2937'),
+        yaxis=dict(categoryorder='total ascending', gridcolor='#1f2937')
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.dataframe(summary.round(3), use_container_width=True)
+
+
+def _render_recent(df):
+    """Render the most recent raw spans"""
+    st.subheader("📋 Recent Spans")
+
+    recent = df.iloc[::-1].head(200).copy()
+    recent['start'] = pd.to_datetime(recent['start'], unit='s')
+    st.dataframe(recent, use_container_width=True)
+
+    st.download_button(
+        label="📥 Download Buffer (JSON lines)",
+        data=records_as_jsonl(),
+        file_name="timings.jsonl",
+        mime="application/x-ndjson"
+    )
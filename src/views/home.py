@@ -11,201 +11,12 @@ sys.path.insert(0, str(project_root))
 
 import streamlit as st
 import plotly.graph_objects as go
-from models.data_loader import load_dataset, load_metrics
-
-
-def _inject_styles():
-    """Inject custom CSS styles"""
-    st.markdown(
-        """
-        <style>
-            .home-shell {
-                max-width: 1180px;
-                margin: 0 auto;
-                display: flex;
-                flex-direction: column;
-                gap: 32px;
-            }
-            .section-spacing { margin: 2.25rem 0 0; }
-            .hero-banner {
-                position: relative;
-                overflow: hidden;
-                display: grid;
-                grid-template-columns: 1fr;
-                gap: 24px;
-                padding: clamp(24px, 3vw, 36px);
-                border-radius: 24px;
-                background: linear-gradient(135deg, rgba(11,18,32,0.9) 0%, rgba(11,18,32,0.75) 55%, rgba(20,30,48,0.78) 100%);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                box-shadow: 0 30px 80px rgba(0,0,0,0.45);
-                isolation: isolate;
-                backdrop-filter: blur(18px) saturate(125%);
-            }
-            .hero-banner::before {
-                content: '';
-                position: absolute;
-                inset: 0;
-                background: radial-gradient(circle at 20% 20%, rgba(96,165,250,0.22), transparent 42%),
-                            radial-gradient(circle at 80% 15%, rgba(167,139,250,0.24), transparent 40%),
-                            radial-gradient(circle at 62% 75%, rgba(34,211,238,0.2), transparent 34%);
-                opacity: 1;
-                z-index: 0;
-            }
-            .hero-banner::after {
-                content: '';
-                position: absolute;
-                inset: 0;
-                background: linear-gradient(120deg, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.02) 55%, rgba(255,255,255,0) 100%);
-                z-index: 0;
-            }
-            .hero-content { position: relative; z-index: 1; }
-            .hero__eyebrow {
-                display: inline-flex;
-                align-items: center;
-                gap: 8px;
-                padding: 8px 12px;
-                border-radius: 999px;
-                background: rgba(96, 165, 250, 0.14);
-                color: #e0f2fe;
-                font-size: 0.95rem;
-                font-weight: 700;
-                border: 1px solid rgba(255,255,255,0.15);
-                backdrop-filter: blur(12px);
-            }
-            .hero__title {
-                margin: 16px 0 10px;
-                font-size: 3rem;
-                font-weight: 800;
-                letter-spacing: -0.03em;
-                background: linear-gradient(135deg, #93c5fd 0%, #a78bfa 40%, #22d3ee 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-            }
-            .hero__subtitle {
-                max-width: 820px;
-                color: #dbeafe;
-                font-size: 1.08rem;
-                line-height: 1.7;
-                margin-bottom: 18px;
-            }
-            .hero__actions {
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                margin-top: 12px;
-                flex-wrap: wrap;
-            }
-            .hero-side { display: none; }
-            .btn {
-                padding: 12px 18px;
-                border-radius: 14px;
-                font-weight: 800;
-                text-decoration: none;
-                display: inline-flex;
-                align-items: center;
-                justify-content: center;
-                gap: 8px;
-                backdrop-filter: blur(14px);
-                -webkit-backdrop-filter: blur(14px);
-                border: 1px solid rgba(255, 255, 255, 0.18);
-                box-shadow: 0 18px 48px rgba(0, 0, 0, 0.32);
-                transition: transform 0.2s ease, box-shadow 0.2s ease, background 0.2s ease, border-color 0.2s ease;
-                letter-spacing: 0.01em;
-            }
-            .btn-primary {
-                background: linear-gradient(120deg, rgba(37, 99, 235, 0.92) 0%, rgba(124, 58, 237, 0.92) 100%);
-                color: #fff;
-                box-shadow: 0 22px 55px rgba(124, 58, 237, 0.35);
-            }
-            .btn-primary:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 26px 65px rgba(124, 58, 237, 0.42);
-                border-color: rgba(255, 255, 255, 0.3);
-            }
-            .btn-ghost {
-                background: rgba(255, 255, 255, 0.08);
-                color: #e2e8f0;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-            .btn-ghost:hover {
-                transform: translateY(-2px);
-                background: rgba(255, 255, 255, 0.12);
-                border-color: rgba(255, 255, 255, 0.32);
-            }
-            .stat-card {
-                background: rgba(15,23,42,0.78);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 16px;
-                padding: 16px 18px;
-                box-shadow: 0 18px 42px rgba(0, 0, 0, 0.32);
-                backdrop-filter: blur(12px);
-            }
-            .stats-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-                gap: 14px;
-                align-items: stretch;
-            }
-            .stat-label { color: #9ca3af; font-size: 0.95rem; }
-            .stat-value { color: #e5e7eb; font-size: 1.85rem; font-weight: 800; margin-top: 6px; }
-            .stat-sub { color: #93c5fd; font-size: 0.95rem; font-weight: 700; }
-            .section-card {
-                background: rgba(15,23,42,0.8);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 18px;
-                padding: 20px;
-                box-shadow: 0 18px 48px rgba(0, 0, 0, 0.3);
-                backdrop-filter: blur(12px);
-            }
-            .section-card h3 { color: #e5e7eb; }
-            .section-card p { color: #cbd5e1; }
-            .pill-rail { display: flex; gap: 10px; flex-wrap: wrap; }
-            .pill {
-                padding: 10px 14px;
-                border-radius: 999px;
-                background: rgba(255,255,255,0.06);
-                border: 1px solid rgba(255,255,255,0.1);
-                color: #e5e7eb;
-                font-weight: 700;
-                font-size: 0.95rem;
-                backdrop-filter: blur(10px);
-            }
-            .rail {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
-                gap: 16px;
-            }
-            .rail-card {
-                background: linear-gradient(145deg, rgba(255,255,255,0.05), rgba(255,255,255,0.02));
-                border: 1px solid rgba(255,255,255,0.08);
-                border-radius: 16px;
-                padding: 16px;
-                color: #e5e7eb;
-                box-shadow: 0 16px 44px rgba(0,0,0,0.28);
-                backdrop-filter: blur(12px);
-            }
-            .rail-card h4 { margin: 0 0 8px; }
-            .rail-card p { margin: 0; color: #cbd5e1; font-size: 0.95rem; }
-            .workflow { display: grid; grid-template-columns: repeat(auto-fit, minmax(220px,1fr)); gap: 14px; }
-            .workflow-step {
-                border: 1px dashed rgba(255,255,255,0.14);
-                border-radius: 14px;
-                padding: 14px;
-                background: rgba(255,255,255,0.04);
-                color: #e5e7eb;
-                backdrop-filter: blur(10px);
-            }
-            .workflow-step strong { color: #93c5fd; }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+from models.data_loader import load_eda_summary, load_metrics
+from models.eda_summary import summary_frame
 
 
 def render():
-    """Render home page"""
-    _inject_styles()
-
+    """Render home page (styles ship in the theme bundle, config.theme.HOME_CSS)"""
     # Constrain layout width for better alignment
     st.markdown("<div class='home-shell'>", unsafe_allow_html=True)
 
@@ -312,8 +123,9 @@ def _render_dataset_overview():
         """, unsafe_allow_html=True)
     
     with col2:
-        df = load_dataset()
-        if df is not None:
+        summary = load_eda_summary()
+        if summary is not None:
+            target = summary['describe'][summary['target']]
             st.markdown("""
             <div class='section-card'>
                 <h3>📊 Dataset Stats</h3>
@@ -322,19 +134,19 @@ def _render_dataset_overview():
             st.markdown(f"""
             <div class='stat-card' style='margin-top:12px;'>
                 <div class='stat-label'>Total Samples</div>
-                <div class='stat-value'>{df.shape[0]:,}</div>
+                <div class='stat-value'>{summary['rows']:,}</div>
             </div>
             <div class='stat-card' style='margin-top:12px;'>
                 <div class='stat-label'>Total Features</div>
-                <div class='stat-value'>{df.shape[1] - 1}</div>
+                <div class='stat-value'>{len(summary['columns']) - 1}</div>
             </div>
             <div class='stat-card' style='margin-top:12px;'>
                 <div class='stat-label'>Mean Yield</div>
-                <div class='stat-value'>{df['Yield_tons_per_hectare'].mean():.2f} t/ha</div>
+                <div class='stat-value'>{target['mean']:.2f} t/ha</div>
             </div>
             <div class='stat-card' style='margin-top:12px;'>
                 <div class='stat-label'>Max Yield</div>
-                <div class='stat-value'>{df['Yield_tons_per_hectare'].max():.2f} t/ha</div>
+                <div class='stat-value'>{target['max']:.2f} t/ha</div>
             </div>
             """, unsafe_allow_html=True)
         else:
@@ -345,13 +157,13 @@ def _render_quick_stats():
     """Render quick statistics"""
     st.subheader("📊 Quick Dataset Overview")
     
-    df = load_dataset()
-    if df is not None:
-        samples = df.shape[0]
-        features = df.shape[1] - 1
-        mean_yield = df['Yield_tons_per_hectare'].mean()
-        std_yield = df['Yield_tons_per_hectare'].std()
-        crops = df['Crop'].nunique()
+    summary = load_eda_summary()
+    if summary is not None:
+        samples = summary['rows']
+        features = len(summary['columns']) - 1
+        mean_yield = summary['describe'][summary['target']]['mean']
+        std_yield = summary['describe'][summary['target']]['std']
+        crops = len(summary['groups']['Crop']['count'])
 
         stats_html = f"""
         <div class='stats-grid'>
@@ -381,7 +193,7 @@ def _render_quick_stats():
 
         st.markdown("<div class='section-card' style='padding: 12px;'>", unsafe_allow_html=True)
         with st.expander("📋 View Sample Data", expanded=False):
-            st.dataframe(df.head(10), use_container_width=True)
+            st.dataframe(summary_frame(summary['head']).head(10), use_container_width=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
 
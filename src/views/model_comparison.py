@@ -10,12 +10,13 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error, mean_absolute_percentage_error
 from models.model_loader import load_models
 from models.data_loader import load_metrics, load_train_test_data
+from utils.instrumentation import span
+from components.charts import points_note, scatter_trace
 
 
 def render():
@@ -61,8 +62,10 @@ def _compare_models(model1, model2, models):
             m1 = models[model1]
             m2 = models[model2]
             
-            pred1 = m1.predict(X_test) if model1 != 'LightGBM' else m1.predict(X_test)
-            pred2 = m2.predict(X_test) if model2 != 'LightGBM' else m2.predict(X_test)
+            with span('predict', rows=len(X_test)):
+                pred1 = m1.predict(X_test)
+            with span('predict', rows=len(X_test)):
+                pred2 = m2.predict(X_test)
             
             # Calculate metrics
             metrics1 = {
@@ -137,12 +140,12 @@ def _render_visual_comparison(model1, model2, y_test, pred1, pred2):
     with col1:
         # Model 1 predictions
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=y_test, y=pred1,
-            mode='markers',
+        points = scatter_trace(
+            y_test, pred1,
             name=model1,
             marker=dict(size=8, color='#667eea', opacity=0.6)
-        ))
+        )
+        fig.add_trace(points)
         fig.add_trace(go.Scatter(
             x=[y_test.min(), y_test.max()],
             y=[y_test.min(), y_test.max()],
@@ -151,7 +154,7 @@ def _render_visual_comparison(model1, model2, y_test, pred1, pred2):
             line=dict(color='#f5576c', dash='dash', width=3)
         ))
         fig.update_layout(
-            title=f'{model1} - Actual vs Predicted',
+            title=f'{model1} - Actual vs Predicted{points_note(points, len(y_test))}',
             xaxis_title='Actual',
             yaxis_title='Predicted',
             height=400,
@@ -166,12 +169,12 @@ def _render_visual_comparison(model1, model2, y_test, pred1, pred2):
     with col2:
         # Model 2 predictions
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=y_test, y=pred2,
-            mode='markers',
+        points = scatter_trace(
+            y_test, pred2,
             name=model2,
             marker=dict(size=8, color='#764ba2', opacity=0.6)
-        ))
+        )
+        fig.add_trace(points)
         fig.add_trace(go.Scatter(
             x=[y_test.min(), y_test.max()],
             y=[y_test.min(), y_test.max()],
@@ -180,7 +183,7 @@ def _render_visual_comparison(model1, model2, y_test, pred1, pred2):
             line=dict(color='#f5576c', dash='dash', width=3)
         ))
         fig.update_layout(
-            title=f'{model2} - Actual vs Predicted',
+            title=f'{model2} - Actual vs Predicted{points_note(points, len(y_test))}',
             xaxis_title='Actual',
             yaxis_title='Predicted',
             height=400,
@@ -201,16 +204,16 @@ def _render_direct_comparison(model1, model2, y_test, pred1, pred2):
     
     st.subheader("🔄 Direct Prediction Comparison")
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=pred1, y=pred2,
-        mode='markers',
+    points = scatter_trace(
+        pred1, pred2,
         marker=dict(size=8, color=y_test, 
                    colorscale='Viridis',
                    showscale=True,
                    colorbar=dict(title="Actual Yield")),
-        text=[f"Actual: {y:.2f}" for y in y_test],
-        hovertemplate="Model1: %{x:.2f}<br>Model2: %{y:.2f}<br>%{text}<extra></extra>"
-    ))
+        customdata=y_test,
+        hovertemplate="Model1: %{x:.2f}<br>Model2: %{y:.2f}<br>Actual: %{customdata:.2f}<extra></extra>"
+    )
+    fig.add_trace(points)
     fig.add_trace(go.Scatter(
         x=[min(pred1.min(), pred2.min()), max(pred1.max(), pred2.max())],
         y=[min(pred1.min(), pred2.min()), max(pred1.max(), pred2.max())],
@@ -219,7 +222,7 @@ def _render_direct_comparison(model1, model2, y_test, pred1, pred2):
         line=dict(color='#f5576c', dash='dash', width=3)
     ))
     fig.update_layout(
-        title=f'{model1} vs {model2} Predictions',
+        title=f'{model1} vs {model2} Predictions{points_note(points, len(y_test))}',
         xaxis_title=f'{model1} Predictions',
         yaxis_title=f'{model2} Predictions',
         height=500,
@@ -15,7 +15,11 @@ import numpy as np
 import plotly.graph_objects as go
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score, mean_absolute_percentage_error
 from models.model_loader import load_models, predict
-from models.data_loader import load_metrics, load_train_test_data
+from models.data_loader import load_metrics, load_train_test_data, load_cv_results
+from models.metrics_store import refresh_metrics
+from models.cv_report import CV_METRICS, SEGMENT_COLUMNS, segment_metrics
+from components.charts import histogram_trace, points_note, scatter_trace
+from models.benchmark import load_benchmark_results, stale_models, run_benchmarks, BATCH_SIZES
 
 
 def render():
@@ -58,7 +62,8 @@ def render():
     st.markdown("---")
     
     # Interactive Charts
-    tab1, tab2, tab3 = st.tabs(["📊 Metrics Comparison", "📈 Detailed Analysis", "📋 Raw Data"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Metrics Comparison", "📈 Detailed Analysis",
+                                            "🔁 Cross-Validation", "⚡ Inference Cost", "📋 Raw Data"])
     
     with tab1:
         _render_metrics_comparison(metrics_df)
@@ -67,6 +72,12 @@ def render():
         _render_detailed_analysis(models, metrics_df)
     
     with tab3:
+        _render_cross_validation()
+    
+    with tab4:
+        _render_inference_cost(metrics_df, r2_col)
+    
+    with tab5:
         _render_raw_data(metrics_df)
 
 
@@ -208,13 +219,13 @@ def _render_detailed_analysis(models, metrics_df):
                     # Actual vs Predicted Plot
                     fig = go.Figure()
                     
-                    fig.add_trace(go.Scatter(
-                        x=y_test,
-                        y=y_pred,
-                        mode='markers',
+                    points = scatter_trace(
+                        y_test,
+                        y_pred,
                         name='Predictions',
                         marker=dict(size=10, color='#667eea', opacity=0.7, line=dict(width=1, color='#4c51bf'))
-                    ))
+                    )
+                    fig.add_trace(points)
                     
                     fig.add_trace(go.Scatter(
                         x=[y_test.min(), y_test.max()],
@@ -225,7 +236,7 @@ def _render_detailed_analysis(models, metrics_df):
                     ))
                     
                     fig.update_layout(
-                        title=f'{selected_model} - Actual vs Predicted Yield',
+                        title=f'{selected_model} - Actual vs Predicted Yield{points_note(points, len(y_test))}',
                         xaxis_title='Actual Yield (tons/ha)',
                         yaxis_title='Predicted Yield (tons/ha)',
                         height=500,
@@ -242,15 +253,15 @@ def _render_detailed_analysis(models, metrics_df):
                     
                     with col1:
                         fig = go.Figure()
-                        fig.add_trace(go.Scatter(
-                            x=y_pred,
-                            y=residuals,
-                            mode='markers',
+                        points = scatter_trace(
+                            y_pred,
+                            residuals,
                             marker=dict(size=10, color='#fa709a', opacity=0.7, line=dict(width=1, color='#f5576c'))
-                        ))
+                        )
+                        fig.add_trace(points)
                         fig.add_hline(y=0, line_dash="dash", line_color="#f5576c", line_width=2)
                         fig.update_layout(
-                            title='Residual Plot',
+                            title=f'Residual Plot{points_note(points, len(residuals))}',
                             xaxis_title='Predicted Values',
                             yaxis_title='Residuals',
                             height=400,
@@ -260,9 +271,9 @@ def _render_detailed_analysis(models, metrics_df):
                     
                     with col2:
                         fig = go.Figure()
-                        fig.add_trace(go.Histogram(
-                            x=residuals,
-                            nbinsx=30,
+                        fig.add_trace(histogram_trace(
+                            residuals,
+                            nbins=30,
                             marker_color='#4facfe',
                             marker_line=dict(color='#00f2fe', width=1)
                         ))
@@ -290,6 +301,170 @@ def _render_detailed_analysis(models, metrics_df):
                 st.exception(e)
 
 
+def _render_cross_validation():
+    """Render fold metric distributions from the stored out-of-fold predictions"""
+    st.subheader("🔁 Cross-Validation")
+    
+    cv = load_cv_results()
+    if cv is None:
+        st.info("💡 No cross-validation report yet. Run `python scripts/train_models.py` to create one.")
+        return
+    
+    folds = cv['folds']
+    report = cv['report']
+    st.markdown(f"{report.get('folds', folds['Fold'].nunique())}-fold CV on the training split, "
+                f"computed {report.get('created_at', 'at the last training run')}")
+    
+    metric = st.selectbox("Metric", CV_METRICS, key="cv_metric")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Fold distribution per model
+        fig = go.Figure()
+        colors = ['#7dd3fc', '#c4b5fd', '#22c55e', '#fbbf24']
+        for i, (model_name, group) in enumerate(folds.groupby('Model', sort=False)):
+            fig.add_trace(go.Box(
+                y=group[metric],
+                name=model_name,
+                boxpoints='all',
+                jitter=0.3,
+                marker=dict(color=colors[i % len(colors)]),
+                text=[f"Fold {fold + 1}" for fold in group['Fold']]
+            ))
+        fig.update_layout(
+            title=f'{metric} across folds',
+            yaxis_title=metric,
+            height=400,
+            template='plotly_dark',
+            showlegend=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Per-segment out-of-fold metric
+        segments = [col for col in SEGMENT_COLUMNS if col in cv['predictions'].columns]
+        if segments:
+            segment = st.selectbox("Segment by", segments, key="cv_segment")
+            by_segment = segment_metrics(cv['predictions'], segment)
+            fig = go.Figure()
+            for i, (model_name, group) in enumerate(by_segment.groupby('Model', sort=False)):
+                fig.add_trace(go.Bar(
+                    x=group[segment],
+                    y=group[metric],
+                    name=model_name,
+                    marker=dict(color=colors[i % len(colors)])
+                ))
+            fig.update_layout(
+                title=f'Out-of-fold {metric} by {segment}',
+                xaxis_title=segment,
+                yaxis_title=metric,
+                barmode='group',
+                height=400,
+                template='plotly_dark'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    summary = folds.groupby('Model', sort=False)[CV_METRICS].agg(['mean', 'std'])
+    summary.columns = [f"{name} {stat}" for name, stat in summary.columns]
+    st.dataframe(summary.round(4), use_container_width=True)
+    
+    if report.get('timings'):
+        with st.expander("⏱️ Fold timings"):
+            st.dataframe(pd.DataFrame(report['timings']).round(4), use_container_width=True)
+
+
+def _render_inference_cost(metrics_df, r2_col):
+    """Render inference latency/throughput benchmark and accuracy trade-off"""
+    st.subheader("⚡ Inference Cost")
+    st.markdown("Single-row latency, batch throughput, load time and peak memory allocated per model version")
+    
+    missing = stale_models()
+    if missing:
+        st.info(f"💡 No benchmark yet for the current version of: {', '.join(missing)}")
+        if st.button("⏱️ Run Benchmark", type="primary"):
+            data = load_train_test_data()
+            if 'X_test' not in data:
+                st.error("❌ Test data not found!")
+                return
+            with st.spinner("🔄 Benchmarking models..."):
+                try:
+                    run_benchmarks(data['X_test'], missing)
+                except Exception as e:
+                    st.error(f"❌ Benchmark error: {str(e)}")
+                    st.exception(e)
+                    return
+    
+    bench_df = load_benchmark_results()
+    if bench_df.empty:
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    fastest = bench_df.loc[bench_df['Latency_p50_ms'].idxmin()]
+    col1.metric("⚡ Fastest (p50)", fastest['Model'], f"{fastest['Latency_p50_ms']:.3f} ms", delta_color="off")
+    col2.metric("🐢 Worst p99", f"{bench_df['Latency_p99_ms'].max():.3f} ms")
+    col3.metric("🚀 Peak Rows/sec", f"{bench_df[f'Rows_per_sec@{BATCH_SIZES[-1]}'].max():,.0f}")
+    col4.metric("📦 Slowest Load", f"{bench_df['Load_ms'].max():.1f} ms")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Accuracy vs latency trade-off
+        merged = bench_df.merge(metrics_df[['Model', r2_col]], on='Model', how='inner')
+        fig = go.Figure()
+        colors = ['#7dd3fc', '#c4b5fd', '#22c55e', '#fbbf24']
+        fig.add_trace(go.Scatter(
+            x=merged['Latency_p50_ms'],
+            y=merged[r2_col],
+            mode='markers+text',
+            text=merged['Model'],
+            textposition='top center',
+            error_x=dict(
+                type='data', symmetric=False,
+                array=merged['Latency_p99_ms'] - merged['Latency_p50_ms'],
+                arrayminus=[0] * len(merged), color='#94a3b8'
+            ),
+            marker=dict(size=16, color=[colors[i % len(colors)] for i in range(len(merged))],
+                        line=dict(color='#e0f2fe', width=1.6))
+        ))
+        fig.update_layout(
+            title='Accuracy vs Latency (p50, whisker to p99)',
+            xaxis_title='Single-row latency (ms)',
+            yaxis_title='R² Score',
+            height=400,
+            template='plotly_dark'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Throughput by batch size
+        fig = go.Figure()
+        colors = ['#4facfe', '#f472b6', '#22c55e', '#fbbf24']
+        for i, (_, row) in enumerate(bench_df.iterrows()):
+            fig.add_trace(go.Scatter(
+                x=list(BATCH_SIZES),
+                y=[row[f'Rows_per_sec@{size}'] for size in BATCH_SIZES],
+                mode='lines+markers',
+                name=row['Model'],
+                line=dict(color=colors[i % len(colors)], width=3)
+            ))
+        fig.update_layout(
+            title='Batch Throughput',
+            xaxis_title='Batch size (rows)',
+            yaxis_title='Rows / second',
+            xaxis_type='log',
+            yaxis_type='log',
+            height=400,
+            template='plotly_dark'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.dataframe(bench_df.round(4).rename(columns={'Peak_Alloc_KB': 'Peak allocation (KB)'}),
+                 use_container_width=True)
+    st.caption("Peak allocation: memory allocated while loading the model and predicting one row and a batch, "
+               "traced by Python; buffers XGBoost allocates natively are not included")
+
+
 def _render_raw_data(metrics_df):
     """Render raw data section"""
     st.subheader("📋 Complete Metrics Table")
@@ -304,3 +479,21 @@ def _render_raw_data(metrics_df):
         mime="text/csv",
         type="primary"
     )
+    
+    # Re-evaluation loads every changed model, so it only runs on request
+    st.markdown("### 🔄 Re-evaluate Models")
+    st.caption("Scores models whose file or test split changed since their last evaluation, "
+               "including predict latency and throughput on this machine.")
+    if st.button("🔄 Re-evaluate Changed Models"):
+        with st.spinner("🔄 Evaluating models..."):
+            try:
+                evaluated = refresh_metrics()
+            except Exception as e:
+                st.error(f"❌ Evaluation error: {str(e)}")
+                return
+        if evaluated is None:
+            st.error("❌ Test data not found!")
+        elif evaluated:
+            st.rerun()
+        else:
+            st.success("✅ Metrics are up to date")
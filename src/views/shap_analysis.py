@@ -1,6 +1,7 @@
 """
 SHAP Analysis View
 """
+import io
 import sys
 import os
 from pathlib import Path
@@ -16,8 +17,9 @@ import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 import shap
 from models.model_loader import load_models
+from models.explainers import load_explainer, align_features
 from models.data_loader import load_train_test_data
-from config.settings import CATEGORICAL_COLS
+from utils.instrumentation import span
 
 
 def render():
@@ -34,6 +36,12 @@ def render():
     
     st.info("💡 **What is SHAP?** SHAP (SHapley Additive exPlanations) explains model predictions by showing how much each feature contributed to the final prediction.")
     
+    _render_analysis(models)
+
+
+@st.fragment
+def _render_analysis(models):
+    """Settings, computation and results; interactions rerun only this fragment"""
     col1, col2 = st.columns([2, 1])
     
     with col1:
@@ -56,11 +64,8 @@ def render():
             data = load_train_test_data()
             
             if 'X_train' in data and 'X_test' in data:
-                X_train = data['X_train']
-                X_test = data['X_test']
-
-                # Ensure numeric, aligned frames for SHAP
-                X_train, X_test = _prepare_data_for_shap(X_train, X_test)
+                # Ensure a numeric frame aligned to the schema for SHAP
+                X_test = align_features(data['X_test'])
 
                 # Sample data for faster computation
                 X_test_sample = X_test.sample(min(sample_size, len(X_test)), random_state=42)
@@ -68,38 +73,21 @@ def render():
                 status_text.text("🧮 Computing SHAP values...")
                 progress_bar.progress(40)
                 
-                model = models[model_name]
-                
-                # Create explainer on numeric data
-                explainer = shap.Explainer(model, X_train.sample(min(100, len(X_train))))
-                shap_values = explainer(X_test_sample)
-                
-                progress_bar.progress(70)
-                status_text.text("📊 Generating visualizations...")
+                # Explainer is cached per model version (and primed by warm-up)
+                with span('shap.explain', rows=len(X_test_sample)):
+                    explainer = load_explainer(model_name)
+                    shap_values = explainer(X_test_sample)
                 
-                st.success("✅ SHAP analysis complete!")
                 progress_bar.progress(100)
-                status_text.empty()
-                
-                st.markdown("---")
-                
-                # Tabs for different visualizations
-                tab1, tab2, tab3, tab4 = st.tabs(["📊 Summary Plot", "📈 Feature Importance", 
-                                                   "🎯 Individual Prediction", "📋 Data Table"])
-                
-                with tab1:
-                    _render_summary_plot(shap_values, X_test_sample, model_name)
-                
-                with tab2:
-                    _render_feature_importance(shap_values, X_train, model_name)
-                
-                with tab3:
-                    _render_individual_prediction(shap_values, X_test_sample)
-                
-                with tab4:
-                    _render_data_table(shap_values, X_train, model_name)
+                st.success("✅ SHAP analysis complete!")
                 
-                # Store in session
+                # Results outlive the button press: later reruns redraw them from here
+                st.session_state['shap_analysis'] = {
+                    'model_name': model_name,
+                    'sample_size': sample_size,
+                    'shap_values': shap_values,
+                    'features': X_test_sample,
+                }
                 st.session_state['shap_values'] = shap_values
                 st.session_state['shap_features'] = X_test_sample
                 
@@ -112,20 +100,51 @@ def render():
         finally:
             progress_bar.empty()
             status_text.empty()
+    
+    analysis = st.session_state.get('shap_analysis')
+    if analysis is None:
+        return
+    
+    if (analysis['model_name'], analysis['sample_size']) != (model_name, sample_size):
+        st.caption(f"ℹ️ Showing the analysis of {analysis['model_name']} on {analysis['sample_size']} samples; "
+                   "press Generate SHAP Analysis to apply the new settings.")
+    
+    st.markdown("---")
+    
+    # Tabs for different visualizations
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Summary Plot", "📈 Feature Importance", 
+                                       "🎯 Individual Prediction", "📋 Data Table"])
+    
+    shap_values, features = analysis['shap_values'], analysis['features']
+    with tab1:
+        _render_summary_plot(analysis)
+    
+    with tab2:
+        _render_feature_importance(shap_values, features, analysis['model_name'])
+    
+    with tab3:
+        _render_individual_prediction(shap_values, features)
+    
+    with tab4:
+        _render_data_table(shap_values, features, analysis['model_name'])
 
 
-def _render_summary_plot(shap_values, X_test_sample, model_name):
-    """Render SHAP summary plot"""
+def _render_summary_plot(analysis):
+    """Render SHAP summary plot (drawn once per analysis, then reused as PNG)"""
     st.subheader("📊 SHAP Summary Plot")
     st.markdown("Shows the distribution of SHAP values for each feature")
     
-    plt.style.use("dark_background")
-    fig, ax = plt.subplots(figsize=(12, 8), facecolor="#0f172a")
-    ax.set_facecolor("#0f172a")
-    shap.summary_plot(shap_values, X_test_sample, show=False)
-    plt.title(f'SHAP Summary Plot - {model_name}', fontsize=16, pad=20, color="#e5e7eb")
-    st.pyplot(fig)
-    plt.close()
+    if 'summary_png' not in analysis:
+        plt.style.use("dark_background")
+        fig, ax = plt.subplots(figsize=(12, 8), facecolor="#0f172a")
+        ax.set_facecolor("#0f172a")
+        shap.summary_plot(analysis['shap_values'], analysis['features'], show=False)
+        plt.title(f"SHAP Summary Plot - {analysis['model_name']}", fontsize=16, pad=20, color="#e5e7eb")
+        buffer = io.BytesIO()
+        plt.gcf().savefig(buffer, format='png', bbox_inches='tight', facecolor="#0f172a")
+        plt.close('all')
+        analysis['summary_png'] = buffer.getvalue()
+    st.image(analysis['summary_png'], use_container_width=True)
     
     st.info("""
     **How to read this plot:**
@@ -136,12 +155,12 @@ def _render_summary_plot(shap_values, X_test_sample, model_name):
     """)
 
 
-def _render_feature_importance(shap_values, X_train, model_name):
+def _render_feature_importance(shap_values, features, model_name):
     """Render feature importance ranking"""
     st.subheader("📈 Feature Importance Ranking")
     
     feature_importance = pd.DataFrame({
-        'Feature': X_train.columns,
+        'Feature': features.columns,
         'Importance': np.abs(shap_values.values).mean(axis=0)
     }).sort_values('Importance', ascending=False)
     
@@ -185,8 +204,9 @@ def _render_feature_importance(shap_values, X_train, model_name):
             st.metric(row['Feature'], f"{row['Importance']:.4f}")
 
 
+@st.fragment
 def _render_individual_prediction(shap_values, X_test_sample):
-    """Render individual prediction explanation"""
+    """Render individual prediction explanation; the sample slider reruns only this panel"""
     st.subheader("🎯 Individual Prediction Explanation")
     
     sample_idx = st.slider("Select Sample Index", 0, len(X_test_sample)-1, 0)
@@ -218,12 +238,12 @@ def _render_individual_prediction(shap_values, X_test_sample):
             st.metric(feature, f"{value:.2f}")
 
 
-def _render_data_table(shap_values, X_train, model_name):
+def _render_data_table(shap_values, features, model_name):
     """Render feature importance data table"""
     st.subheader("📋 Feature Importance Data")
     
     feature_importance = pd.DataFrame({
-        'Feature': X_train.columns,
+        'Feature': features.columns,
         'Importance': np.abs(shap_values.values).mean(axis=0)
     }).sort_values('Importance', ascending=False)
     
@@ -237,38 +257,3 @@ def _render_data_table(shap_values, X_train, model_name):
         mime="text/csv"
     )
 
-
-def _prepare_data_for_shap(X_train: pd.DataFrame, X_test: pd.DataFrame):
-    """Align train/test, one-hot encode categoricals, coerce all features to float64."""
-    train = X_train.copy()
-    test = X_test.copy()
-
-    # One-hot encode known categoricals if present
-    cat_cols = [c for c in CATEGORICAL_COLS if c in train.columns]
-    if cat_cols:
-        train = pd.get_dummies(train, columns=cat_cols, drop_first=False)
-        test = pd.get_dummies(test, columns=cat_cols, drop_first=False)
-        test = test.reindex(columns=train.columns, fill_value=0)
-
-    # Convert any remaining object columns to category codes
-    obj_cols = train.select_dtypes(include=['object']).columns
-    for col in obj_cols:
-        train[col] = train[col].astype('category').cat.codes
-        test[col] = test[col].astype('category').cat.codes
-
-    # Convert boolean columns to int
-    bool_cols = train.select_dtypes(include=['bool']).columns
-    for col in bool_cols:
-        train[col] = train[col].astype(int)
-        test[col] = test[col].astype(int)
-
-    # Coerce all columns to numeric, then float64
-    for col in train.columns:
-        train[col] = pd.to_numeric(train[col], errors='coerce')
-        test[col] = pd.to_numeric(test[col], errors='coerce')
-
-    # Final cast to float64 and fill any NaNs with 0
-    train = train.astype('float64', errors='ignore').fillna(0)
-    test = test.astype('float64', errors='ignore').fillna(0)
-
-    return train, test
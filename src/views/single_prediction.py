@@ -12,8 +12,9 @@ sys.path.insert(0, str(project_root))
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from models.model_loader import load_models, predict
-from models.data_loader import load_dataset, load_train_test_data
+from models.model_loader import load_models, load_feature_schema, load_surrogate, predict
+from models.data_loader import load_dataset
+from models.feature_schema import schema_encoder
 
 
 def render():
@@ -22,10 +23,10 @@ def render():
     st.markdown("Enter farm parameters to predict crop yield")
     st.markdown("---")
     
-    # Load models and training column template
+    # Load models and the feature schema they were trained with
     models = load_models()
     df = load_dataset()
-    data_splits = load_train_test_data()
+    schema = load_feature_schema()
     
     if not models:
         st.error("⚠️ No models found! Please train models first.")
@@ -35,12 +36,12 @@ def render():
         st.error("⚠️ Dataset not found!")
         return
 
-    if 'X_train' not in data_splits:
-        st.error("⚠️ Training columns not found. Please retrain or ensure train splits exist.")
-        return
+    _render_prediction_form(models, df, schema)
 
-    train_columns = data_splits['X_train'].columns.tolist()
-    
+
+@st.fragment
+def _render_prediction_form(models, df, schema):
+    """Inputs, preview and prediction; widget changes rerun only this fragment"""
     # Input Form
     col1, col2 = st.columns(2)
     
@@ -84,6 +85,32 @@ def render():
                         value=int(df['Days_to_Harvest'].mean()),
                         help="Number of days until harvest")
     
+    inputs = {
+        'soil': soil_type,
+        'crop': crop,
+        'weather': weather,
+        'rainfall': rainfall,
+        'temperature': temperature,
+        'fertilizer': fertilizer,
+        'irrigation': irrigation,
+        'days': days
+    }
+    
+    # Encode the raw inputs with the schema the models were trained on
+    raw = pd.DataFrame([{
+        'Soil_Type': soil_type,
+        'Crop': crop,
+        'Rainfall_mm': rainfall,
+        'Temperature_Celsius': temperature,
+        'Fertilizer_Used': fertilizer,
+        'Irrigation_Used': irrigation,
+        'Weather_Condition': weather,
+        'Days_to_Harvest': days,
+    }])
+    features = schema_encoder(schema).transform(raw)
+    
+    _render_fast_preview(features)
+    
     st.markdown("---")
     
     # Model Selection
@@ -99,98 +126,103 @@ def render():
     if predict_button:
         try:
             with st.spinner("🔄 Making prediction..."):
-                # Build a one-hot row aligned to training columns
-                row = {col: 0 for col in train_columns}
-
-                # Helper to set one-hot if the column exists
-                def _set_one_hot(prefix: str, value: str):
-                    col_name = f"{prefix}_{value}"
-                    if col_name in row:
-                        row[col_name] = 1
-
-                _set_one_hot("Soil_Type", soil_type)
-                _set_one_hot("Crop", crop)
-                _set_one_hot("Weather_Condition", weather)
-
-                # Set numeric / boolean columns if present
-                if 'Rainfall_mm' in row:
-                    row['Rainfall_mm'] = rainfall
-                if 'Temperature_Celsius' in row:
-                    row['Temperature_Celsius'] = temperature
-                if 'Days_to_Harvest' in row:
-                    row['Days_to_Harvest'] = days
-                if 'Fertilizer_Used' in row:
-                    row['Fertilizer_Used'] = int(fertilizer)
-                if 'Irrigation_Used' in row:
-                    row['Irrigation_Used'] = int(irrigation)
-
-                features = pd.DataFrame([row], columns=train_columns)
-                
-                # Make prediction
-                prediction = predict(models[selected_model], features)[0]
-                
-                # Display Results
-                st.markdown("---")
-                st.success("✅ Prediction Complete!")
-                
-                col1, col2, col3 = st.columns([1, 2, 1])
-                
-                with col2:
-                    st.markdown(f"""
-                    <div style='background: linear-gradient(135deg, rgba(37,99,235,0.92) 0%, rgba(124,58,237,0.92) 100%); 
-                                padding: 3rem; border-radius: 22px; text-align: center; color: white;
-                                border: 1px solid rgba(255,255,255,0.15);
-                                box-shadow: 0 26px 65px rgba(124,58,237,0.35);
-                                backdrop-filter: blur(14px);'>
-                        <h2 style="color:#f0f9ff;">🌾 Predicted Yield</h2>
-                        <h1 style='font-size: 4rem; margin: 1rem 0; background: linear-gradient(135deg, #93c5fd 0%, #a78bfa 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;'>{prediction:.2f}</h1>
-                        <h3 style="color:#e0f2fe;">tons/hectare</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.markdown("##")
-                
-                # Input Summary
-                with st.expander("📋 View Input Summary"):
-                    summary_col1, summary_col2 = st.columns(2)
-                    with summary_col1:
-                        st.markdown(f"""
-                        **🌾 Crop Information:**
-                        - Soil Type: `{soil_type}`
-                        - Crop: `{crop}`
-                        - Weather: `{weather}`
-                        - Fertilizer: `{'Yes' if fertilizer else 'No'}`
-                        - Irrigation: `{'Yes' if irrigation else 'No'}`
-                        """)
-                    with summary_col2:
-                        st.markdown(f"""
-                        **📊 Environmental Data:**
-                        - Rainfall: `{rainfall:.2f} mm`
-                        - Temperature: `{temperature:.2f} °C`
-                        - Days to Harvest: `{days} days`
-                        - Model Used: `{selected_model}`
-                        """)
-                
-                # Save prediction history
-                if 'prediction_history' not in st.session_state:
-                    st.session_state['prediction_history'] = []
-                
-                st.session_state['prediction_history'].append({
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'model': selected_model,
-                    'prediction': prediction,
-                    'inputs': {
-                        'soil': soil_type,
-                        'crop': crop,
-                        'weather': weather,
-                        'rainfall': rainfall,
-                        'temperature': temperature,
-                        'fertilizer': fertilizer,
-                        'irrigation': irrigation,
-                        'days': days
-                    }
-                })
+                prediction = float(predict(models[selected_model], features)[0])
+            
+            record = {
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'model': selected_model,
+                'prediction': prediction,
+                'inputs': inputs
+            }
+            # Kept until the next prediction, so later reruns still show it
+            st.session_state['last_prediction'] = record
+            
+            # Save prediction history
+            if 'prediction_history' not in st.session_state:
+                st.session_state['prediction_history'] = []
+            st.session_state['prediction_history'].append(record)
+            
+            st.markdown("---")
+            st.success("✅ Prediction Complete!")
                 
         except Exception as e:
             st.error(f"❌ Prediction Error: {str(e)}")
             st.exception(e)
+    
+    last = st.session_state.get('last_prediction')
+    if last is not None:
+        if last['inputs'] != inputs or last['model'] != selected_model:
+            st.caption("ℹ️ Inputs changed since this prediction; press Predict Yield to update it.")
+        _render_result(last)
+
+
+def _render_result(record):
+    """Predicted yield card and input summary of a stored prediction"""
+    prediction = record['prediction']
+    inputs = record['inputs']
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, rgba(37,99,235,0.92) 0%, rgba(124,58,237,0.92) 100%); 
+                    padding: 3rem; border-radius: 22px; text-align: center; color: white;
+                    border: 1px solid rgba(255,255,255,0.15);
+                    box-shadow: 0 26px 65px rgba(124,58,237,0.35);
+                    backdrop-filter: blur(14px);'>
+            <h2 style="color:#f0f9ff;">🌾 Predicted Yield</h2>
+            <h1 style='font-size: 4rem; margin: 1rem 0; background: linear-gradient(135deg, #93c5fd 0%, #a78bfa 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;'>{prediction:.2f}</h1>
+            <h3 style="color:#e0f2fe;">tons/hectare</h3>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("##")
+    
+    # Input Summary
+    with st.expander("📋 View Input Summary"):
+        summary_col1, summary_col2 = st.columns(2)
+        with summary_col1:
+            st.markdown(f"""
+            **🌾 Crop Information:**
+            - Soil Type: `{inputs['soil']}`
+            - Crop: `{inputs['crop']}`
+            - Weather: `{inputs['weather']}`
+            - Fertilizer: `{'Yes' if inputs['fertilizer'] else 'No'}`
+            - Irrigation: `{'Yes' if inputs['irrigation'] else 'No'}`
+            """)
+        with summary_col2:
+            st.markdown(f"""
+            **📊 Environmental Data:**
+            - Rainfall: `{inputs['rainfall']:.2f} mm`
+            - Temperature: `{inputs['temperature']:.2f} °C`
+            - Days to Harvest: `{inputs['days']} days`
+            - Model Used: `{record['model']}`
+            """)
+
+
+def _render_fast_preview(features: pd.DataFrame):
+    """Live surrogate estimate that follows the inputs without calling the full model"""
+    surrogate = load_surrogate()
+    if surrogate is None:
+        return
+    
+    if not st.toggle("⚡ Fast preview", value=True,
+                     help="Estimate from a small tree distilled from XGBoost; "
+                          "use Predict Yield for the final prediction"):
+        return
+    
+    report = surrogate['report']
+    fidelity = report.get('fidelity_test') or report['fidelity_sampled']
+    try:
+        preview = float(surrogate['model'].predict(features.astype('float32'))[0])
+    except Exception:
+        # The preview is optional; never let it take the prediction form down
+        return
+    
+    col1, col2 = st.columns([1, 2])
+    col1.metric("⚡ Preview Yield", f"{preview:.2f} t/ha")
+    col2.caption(f"Surrogate of {report['teacher']} · mean deviation ±{fidelity['MAE']:.2f} t/ha "
+                 f"(R² {fidelity['R2']:.3f} vs {report['teacher']})")
+    if surrogate['stale']:
+        col2.warning("⚠️ XGBoost changed since this surrogate was distilled; "
+                     "run `python scripts/distill_surrogate.py`")